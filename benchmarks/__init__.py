@@ -0,0 +1,4 @@
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmarks for Proclamation, run with ``python -m benchmarks.run``."""
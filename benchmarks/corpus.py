@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Generate synthetic ``changes/`` trees to benchmark Proclamation with."""
+
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+_WORDS = (
+    "fix add remove update driver layer frame buffer render queue crash leak "
+    "support option command parser template section fragment release build "
+    "memory speed window device input output config default error warning"
+).split()
+
+REF_TYPES = ("pr", "mr", "issue")
+
+
+class CorpusSpec(NamedTuple):
+    """Shape of a synthetic corpus."""
+
+    fragments: int = 1000
+    """Total number of fragment files, spread evenly over the sections."""
+
+    sections: int = 4
+    """Number of sections, each with its own directory."""
+
+    refs_per_fragment: int = 2
+    """Number of references in the front matter of each fragment, the first
+    of which is an author."""
+
+    bullet_fraction: float = 0.1
+    """Fraction of fragment files containing several bullet points."""
+
+    bullets: int = 3
+    """Number of bullet points in those files."""
+
+    body_words: int = 20
+    """Number of words in the text of each fragment (or each bullet point)."""
+
+    history_releases: int = 50
+    """Number of past releases already in the changelog file."""
+
+    seed: int = 1
+    """Seed for the random number generator, for repeatable corpora."""
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[:1].upper() + text[1:] + "."
+
+
+def _fragment_text(rng: random.Random, spec: CorpusSpec, number: int) -> str:
+    lines = []
+    if spec.refs_per_fragment:
+        refs = [f"author.contributor{rng.randrange(50)}"]
+        refs.extend(
+            f"{rng.choice(REF_TYPES)}.{rng.randrange(1, 10 * (number + 1))}"
+            for _ in range(spec.refs_per_fragment - 1)
+        )
+        lines.append("---")
+        lines.extend(f"- {ref}" for ref in refs)
+        lines.append("---")
+    if rng.random() < spec.bullet_fraction:
+        lines.extend(
+            f"- {_sentence(rng, spec.body_words)}" for _ in range(spec.bullets)
+        )
+    else:
+        lines.append(_sentence(rng, spec.body_words))
+    return "\n".join(lines) + "\n"
+
+
+def _history(rng: random.Random, project_name: str, releases: int) -> str:
+    parts = ["# Changelog\n\n"]
+    for i in range(releases, 0, -1):
+        parts.append(f"## {project_name} 0.{i}.0 (2020-01-01)\n\n")
+        parts.extend(f"- {_sentence(rng, 12)}\n" for _ in range(5))
+        parts.append("\n")
+    return "".join(parts)
+
+
+def generate_corpus(
+    directory, spec: CorpusSpec = CorpusSpec()
+) -> Dict[str, List[Path]]:
+    """Write a config file, changelog and fragment tree into directory.
+
+    Returns the fragment files written, by section name.
+    The config file is ``.proclamation.json`` and uses relative paths, so
+    run Proclamation from directory.
+    """
+    base = Path(directory)
+    rng = random.Random(spec.seed)
+    project_name = "Bench"
+    sections: Dict[str, List[Path]] = {}
+    config_sections = {}
+    for s in range(spec.sections):
+        name = f"Section {s}"
+        section_dir = Path("changes") / f"section{s}"
+        (base / section_dir).mkdir(parents=True, exist_ok=True)
+        config_sections[name] = {"directory": section_dir.as_posix()}
+        sections[name] = []
+
+    names = list(sections)
+    for number in range(1, spec.fragments + 1):
+        name = names[number % len(names)]
+        section_dir = base / config_sections[name]["directory"]
+        fn = section_dir / f"{rng.choice(('pr', 'mr'))}.{number}.md"
+        fn.write_text(_fragment_text(rng, spec, number), encoding="utf-8")
+        sections[name].append(fn)
+
+    config = {
+        "project_name": project_name,
+        "base_url": "https://example.com/bench",
+        "sections": config_sections,
+    }
+    (base / ".proclamation.json").write_text(json.dumps(config), encoding="utf-8")
+    (base / "CHANGELOG.md").write_text(
+        _history(rng, project_name, spec.history_releases), encoding="utf-8"
+    )
+    return sections
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Check how long starting the command line interface takes to import.
+
+Run from the repository root, e.g. in CI::
+
+    python -m benchmarks.importtime --threshold-ms 150
+
+Exits with an error if importing :mod:`proclamation.main` takes longer than
+the threshold, or imports a module that only rendering commands need.
+"""
+
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple
+
+import click
+
+MODULE = "proclamation.main"
+
+FORBIDDEN = ("jinja2", "proclamation.render")
+"""Modules that must only be imported by the commands that need them."""
+
+
+class ImportTimes(NamedTuple):
+    """Parsed output of ``python -X importtime``."""
+
+    total_us: int
+    """Cumulative import time of the module, in microseconds."""
+
+    self_us: Dict[str, int]
+    """Time spent in each imported module itself, in microseconds."""
+
+
+def parse_importtime(output: str, module: str = MODULE) -> ImportTimes:
+    """Parse the stderr of ``python -X importtime``.
+
+    >>> parse_importtime('''import time: self [us] | cumulative | imported package
+    ... import time:       100 |        100 |   click
+    ... import time:        50 |        150 | proclamation.main''')
+    ImportTimes(total_us=150, self_us={'click': 100, 'proclamation.main': 50})
+    """
+    self_us = {}
+    total_us = None
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        self_us[name] = int(fields[0])
+        if name == module:
+            total_us = int(fields[1])
+    if total_us is None:
+        raise RuntimeError(f"{module} was not imported")
+    return ImportTimes(total_us, self_us)
+
+
+def measure(runs: int = 5, module: str = MODULE) -> ImportTimes:
+    """Import module in fresh interpreters, returning the fastest run."""
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        times = parse_importtime(proc.stderr, module)
+        if best is None or times.total_us < best.total_us:
+            best = times
+    return best
+
+
+def forbidden_imports(times: ImportTimes) -> List[str]:
+    """Return the modules in :data:`FORBIDDEN` that were imported."""
+    return [name for name in FORBIDDEN if name in times.self_us]
+
+
+@click.command()
+@click.option("--runs", default=5, show_default=True, help="Best of this many.")
+@click.option(
+    "--threshold-ms",
+    type=float,
+    default=150.0,
+    show_default=True,
+    help="Fail if the fastest import takes longer than this.",
+)
+@click.option("--top", default=10, show_default=True, help="Slowest modules to list.")
+def main(runs, threshold_ms, top):
+    """Measure the import time of the proclamation command line interface."""
+    times = measure(runs)
+    click.echo(f"{MODULE}: {times.total_us / 1000:.1f} ms (best of {runs})")
+    slowest = sorted(times.self_us.items(), key=lambda item: -item[1])[:top]
+    for name, us in slowest:
+        click.echo(f"  {us / 1000:8.2f} ms  {name}")
+    failed = False
+    for name in forbidden_imports(times):
+        click.echo(f"error: {MODULE} imports {name} at startup", err=True)
+        failed = True
+    if times.total_us / 1000 > threshold_ms:
+        click.echo(f"error: import took longer than {threshold_ms} ms", err=True)
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
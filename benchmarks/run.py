@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Time Proclamation on synthetic corpora of increasing size.
+
+Run from the repository root, e.g.::
+
+    python -m benchmarks.run --sizes 100,1000,10000 --json results.json
+"""
+
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+import click
+from click.testing import CliRunner
+
+from proclamation.main import cli
+from proclamation.merge import merge_fragments
+from proclamation.project import Project
+from proclamation.render import generate_updated_changelog, render_template
+from proclamation.settings import settings_from_json_file
+from proclamation.types import ReferenceParser
+
+from .corpus import CorpusSpec, generate_corpus
+
+DEFAULT_SIZES = (100, 1000, 10000)
+
+_DEFAULT_SPEC = CorpusSpec()
+
+
+class Result(NamedTuple):
+    """The outcome of one benchmark at one corpus size."""
+
+    benchmark: str
+    fragments: int
+    seconds: float
+    """Best wall time over all repeats."""
+    peak_bytes: int
+    """Peak memory allocated by Python during one extra run, per tracemalloc."""
+
+
+@contextmanager
+def _chdir(directory) -> Iterator[None]:
+    old = os.getcwd()
+    os.chdir(str(directory))
+    try:
+        yield
+    finally:
+        os.chdir(old)
+
+
+def _measure(
+    name: str,
+    fragments: int,
+    func: Callable[[], None],
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> Result:
+    """Time func, best of repeat, then measure its peak memory separately, so
+    that tracemalloc overhead does not affect the timing."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    if setup is not None:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(name, fragments, best, peak)
+
+
+def _load_project(base: Path) -> Project:
+    settings = settings_from_json_file(base / ".proclamation.json")
+    return Project(settings.projects[0], default_base=base)
+
+
+def _populated_project(base: Path) -> Project:
+    project = _load_project(base)
+    project.populate_sections()
+    return project
+
+
+def run_benchmarks(base: Path, spec: CorpusSpec, repeat: int) -> List[Result]:
+    """Generate a corpus in base and run every benchmark on it."""
+    sections = generate_corpus(base, spec)
+    n = spec.fragments
+    results = []
+    with _chdir(base):
+
+        def populate():
+            project = _load_project(base)
+            parser = ReferenceParser()
+            for section in project.sections:
+                section.populate_from_directory(
+                    base / section.relative_directory, parser
+                )
+
+        results.append(_measure("populate_from_directory", n, populate, repeat))
+
+        project = _populated_project(base)
+        results.append(
+            _measure(
+                "render_template",
+                n,
+                lambda: render_template(project, "1.0", "2020-02-02"),
+                repeat,
+            )
+        )
+        results.append(
+            _measure(
+                "generate_updated_changelog",
+                n,
+                lambda: generate_updated_changelog(project, "1.0", "2020-02-02"),
+                repeat,
+            )
+        )
+
+        # merge_fragments replaces its input files, so merge copies.
+        merge_dir = base / "merge"
+        originals = next(iter(sections.values()))
+
+        def copy_merge_inputs():
+            shutil.rmtree(str(merge_dir), ignore_errors=True)
+            merge_dir.mkdir()
+            for fn in originals:
+                shutil.copy(str(fn), str(merge_dir / fn.name))
+
+        def merge():
+            merge_fragments(sorted(merge_dir.iterdir()), None)
+
+        results.append(
+            _measure(
+                "merge_fragments", len(originals), merge, repeat, copy_merge_inputs
+            )
+        )
+        shutil.rmtree(str(merge_dir))
+
+        runner = CliRunner()
+
+        def build_dry_run():
+            result = runner.invoke(cli, ["build", "--dry-run", "1.0"])
+            if result.exit_code != 0:
+                raise RuntimeError(result.output) from result.exception
+
+        results.append(_measure("build --dry-run", n, build_dry_run, repeat))
+    return results
+
+
+def format_results(results: List[Result]) -> str:
+    """Return results as a table."""
+    lines = [f"{'benchmark':<28} {'fragments':>9} {'seconds':>10} {'peak MiB':>9}"]
+    for r in results:
+        lines.append(
+            f"{r.benchmark:<28} {r.fragments:>9} {r.seconds:>10.4f}"
+            f" {r.peak_bytes / 2**20:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    default=",".join(str(size) for size in DEFAULT_SIZES),
+    show_default=True,
+    help="Comma-separated corpus sizes, in fragment files. "
+    "Sizes up to 100000 are reasonable, but slow.",
+)
+@click.option("--sections", default=_DEFAULT_SPEC.sections, show_default=True)
+@click.option(
+    "--refs",
+    "refs_per_fragment",
+    default=_DEFAULT_SPEC.refs_per_fragment,
+    show_default=True,
+    help="References in the front matter of each fragment.",
+)
+@click.option(
+    "--bullet-fraction",
+    default=_DEFAULT_SPEC.bullet_fraction,
+    show_default=True,
+    help="Fraction of fragment files with several bullet points.",
+)
+@click.option(
+    "--body-words",
+    default=_DEFAULT_SPEC.body_words,
+    show_default=True,
+    help="Words in each fragment or bullet point.",
+)
+@click.option("--repeat", default=3, show_default=True, help="Runs per benchmark.")
+@click.option(
+    "--json",
+    "json_file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Also write the results to this file as JSON.",
+)
+def main(
+    sizes, sections, refs_per_fragment, bullet_fraction, body_words, repeat, json_file
+):
+    """Benchmark Proclamation on synthetic changes/ trees."""
+    results = []
+    for size in (int(s) for s in sizes.split(",")):
+        spec = CorpusSpec(
+            fragments=size,
+            sections=sections,
+            refs_per_fragment=refs_per_fragment,
+            bullet_fraction=bullet_fraction,
+            body_words=body_words,
+        )
+        with tempfile.TemporaryDirectory() as dirname:
+            # Keep rendered output of the benchmarks off the terminal.
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                size_results = run_benchmarks(Path(dirname), spec, repeat)
+        results.extend(size_results)
+        click.echo(format_results(size_results))
+        click.echo()
+    if json_file:
+        with open(json_file, "w", encoding="utf-8") as fp:
+            json.dump(
+                {
+                    "python": sys.version,
+                    "results": [r._asdict() for r in results],
+                },
+                fp,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
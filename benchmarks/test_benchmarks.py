@@ -0,0 +1,40 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Smoke tests, so the benchmarks keep working as Proclamation changes."""
+
+import tempfile
+from pathlib import Path
+
+from . import importtime
+from .corpus import CorpusSpec, generate_corpus
+from .run import format_results, run_benchmarks
+
+
+def test_generate_corpus():
+    with tempfile.TemporaryDirectory() as dirname:
+        sections = generate_corpus(dirname, CorpusSpec(fragments=10, sections=3))
+        assert sum(len(files) for files in sections.values()) == 10
+        assert (Path(dirname) / ".proclamation.json").exists()
+        assert all(fn.exists() for files in sections.values() for fn in files)
+
+
+def test_run_benchmarks():
+    with tempfile.TemporaryDirectory() as dirname:
+        results = run_benchmarks(Path(dirname), CorpusSpec(fragments=20), repeat=1)
+        assert [r.benchmark for r in results] == [
+            "populate_from_directory",
+            "render_template",
+            "generate_updated_changelog",
+            "merge_fragments",
+            "build --dry-run",
+        ]
+        assert all(r.seconds > 0 and r.peak_bytes > 0 for r in results)
+        assert "build --dry-run" in format_results(results)
+
+
+def test_no_jinja2_at_startup():
+    times = importtime.measure(runs=1)
+    assert importtime.forbidden_imports(times) == []
+    assert times.total_us > 0
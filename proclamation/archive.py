@@ -0,0 +1,187 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Move old releases out of the changelog file into archive files."""
+
+import logging
+import re
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Set
+
+from .history import Heading, HeadingIndex
+from .utils import atomic_write, copy_file_tail
+
+_LOG = logging.getLogger(__name__)
+
+_YEAR_RE = re.compile(r"\b(\d{4})-\d\d-\d\d\b")
+
+_MAJOR_RE = re.compile(r"\d+")
+
+_DEFAULT_ARCHIVE_HEAD = "# Changelog archive\n\n"
+
+_LINK_DEFINITION_RE = re.compile(rb" {0,3}\[[^\]]+\]:")
+
+
+def archive_filename(project_settings, heading: Heading) -> Path:
+    """Return the archive file that the release starting at heading goes to.
+
+    The ``archive_filename`` project setting is formatted with these fields:
+
+    - ``year``: the year of the first ISO date in the heading, or "undated"
+    - ``version``: the version in the heading, or "unversioned"
+    - ``major``: the first number in the version, or "unversioned"
+    - ``stem`` and ``suffix``: of the name of the changelog file
+    """
+    news_filename = Path(project_settings.news_filename)
+    year_match = _YEAR_RE.search(heading.line)
+    major_match = _MAJOR_RE.search(heading.version or "")
+    fields = {
+        "year": year_match.group(1) if year_match else "undated",
+        "version": heading.version or "unversioned",
+        "major": major_match.group(0) if major_match else "unversioned",
+        "stem": news_filename.stem,
+        "suffix": news_filename.suffix,
+    }
+    return Path(project_settings.archive_filename.format(**fields))
+
+
+def _footer_offset(src: BinaryIO, start: int) -> Optional[int]:
+    """Return the offset of the footer of a changelog file, or None.
+
+    The footer is the run of Markdown link reference definitions, such as
+    ``[1.0]: https://...``, and blank lines at the end of the file, after the
+    last release starting at start. It belongs to the changelog rather than
+    to any release.
+    """
+    src.seek(start)
+    src.readline()
+    footer_offset = None
+    while True:
+        offset = src.tell()
+        raw_line = src.readline()
+        if not raw_line:
+            return footer_offset
+        if _LINK_DEFINITION_RE.match(raw_line):
+            if footer_offset is None:
+                footer_offset = offset
+        elif raw_line.strip():
+            footer_offset = None
+
+
+def _archived_headings(project_settings, filename: Path) -> Set[str]:
+    """Return the release heading lines already in an archive file."""
+    insert_point_re = project_settings.insert_point_re
+    headings = set()
+    try:
+        with open(str(filename), "rb") as src:
+            for raw_line in src:
+                line = raw_line.decode("utf-8", errors="replace").rstrip()
+                if insert_point_re.match(line):
+                    headings.add(line)
+    except FileNotFoundError:
+        pass
+    return headings
+
+
+def _read_release(src: BinaryIO, start: int, end: Optional[int]) -> bytes:
+    src.seek(start)
+    data = src.read() if end is None else src.read(end - start)
+    # The oldest release might not end with a blank line, but will be followed
+    # by others in the archive.
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    if not data.endswith(b"\n\n") and not data.endswith(b"\r\n\r\n"):
+        data += b"\n"
+    return data
+
+
+def _prepend_releases(project_settings, filename: Path, releases: List[bytes]):
+    """Insert releases (newest first) before the first release in an archive."""
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_write(filename) as out:
+        try:
+            src = open(str(filename), "rb")
+        except FileNotFoundError:
+            out.write(_DEFAULT_ARCHIVE_HEAD.encode("utf-8"))
+            out.writelines(releases)
+            return
+        with src:
+            insert_point_re = project_settings.insert_point_re
+            insert_offset = None
+            while True:
+                offset = src.tell()
+                raw_line = src.readline()
+                if not raw_line:
+                    break
+                line = raw_line.decode("utf-8", errors="replace")
+                if insert_point_re.match(line.rstrip("\r\n")):
+                    insert_offset = offset
+                    break
+                out.write(raw_line)
+            out.writelines(releases)
+            if insert_offset is not None:
+                copy_file_tail(src, out, insert_offset)
+
+
+def archive_releases(
+    project_settings, keep: int, index: Optional[HeadingIndex] = None
+) -> Dict[Path, int]:
+    """Move all but the newest keep releases into archive files.
+
+    Releases are the stretches of the changelog file starting at lines
+    matching the insert point pattern. Older releases are at the end of the
+    changelog file, so once they have been added to their archive files, the
+    changelog file is simply truncated. A footer of link reference
+    definitions at the end of the changelog file stays there.
+
+    Releases whose heading is already in their archive file, say because a
+    previous run was interrupted before truncating the changelog file, are
+    not added again.
+
+    Returns the number of releases moved to each archive file.
+    """
+    if index is None:
+        index = HeadingIndex.scan(project_settings)
+    headings = index.headings
+    if len(headings) <= keep:
+        _LOG.info("Only %d releases, nothing to archive", len(headings))
+        return {}
+
+    news_filename = str(project_settings.news_filename)
+    moved: Dict[Path, int] = {}
+    archives: Dict[Path, List[bytes]] = {}
+    archived: Dict[Path, Set[str]] = {}
+    with open(news_filename, "rb") as src:
+        footer_offset = _footer_offset(src, headings[-1].offset)
+        footer = b""
+        if footer_offset is not None:
+            src.seek(footer_offset)
+            footer = src.read()
+        for position in range(keep, len(headings)):
+            end = footer_offset
+            if position + 1 < len(headings):
+                end = headings[position + 1].offset
+            heading = headings[position]
+            filename = archive_filename(project_settings, heading)
+            moved[filename] = moved.get(filename, 0) + 1
+            if filename not in archived:
+                archived[filename] = _archived_headings(project_settings, filename)
+            if heading.line.rstrip() in archived[filename]:
+                _LOG.info("%s is already in %s", heading.line.strip(), filename)
+                continue
+            archives.setdefault(filename, []).append(
+                _read_release(src, heading.offset, end)
+            )
+
+    for filename, releases in archives.items():
+        _LOG.info("Archiving %d releases to %s", len(releases), filename)
+        _prepend_releases(project_settings, filename, releases)
+
+    # Only shrink the changelog once the releases are safely archived.
+    with open(news_filename, "r+b") as out:
+        out.seek(headings[keep].offset)
+        out.write(footer)
+        out.truncate()
+    index.update_after_truncate(keep)
+    return moved
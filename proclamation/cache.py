@@ -0,0 +1,217 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Persistent on-disk cache of parsed fragment files."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from io import StringIO
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .types import Fragment, Reference, ReferenceParser
+
+_LOG = logging.getLogger(__name__)
+
+CACHE_DIRNAME = ".proclamation-cache"
+"""Default name of the cache directory, created in the base directory."""
+
+CACHE_FILENAME = "fragments.json"
+
+CACHE_FORMAT_VERSION = 1
+
+RACY_WINDOW_NS = 2 * 1000 * 1000 * 1000
+"""Files modified this close to (or after) the time the cache was written
+might have changed again without a visible change in size or mtime, so
+their content hash is checked before trusting the cache."""
+
+
+def prepare_cache_directory(directory):
+    """Create a cache directory, if needed, and keep it out of version control."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    gitignore = directory / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Created by Proclamation\n*\n", encoding="utf-8")
+    return directory
+
+
+def _parser_id(ref_parser) -> str:
+    cls = type(ref_parser)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _stat_key(st: os.stat_result) -> Dict[str, int]:
+    return {"ino": st.st_ino, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+class FragmentCache:
+    """A cache of parsed fragments, keyed by path, inode, size and mtime.
+
+    Entries whose stat information matches are used without reading the file.
+    Entries that look suspicious (stat information differs, or the file was
+    modified around the time the cache was written) are validated by comparing
+    a SHA-256 hash of the contents, which still saves parsing.
+
+    Safe to use from multiple threads. Call :func:`save` to write it back.
+    """
+
+    def __init__(self, directory, ref_parser: Optional[ReferenceParser] = None):
+        """Construct and load the cache stored in the given directory."""
+        self.directory = Path(directory)
+        self.filename = self.directory / CACHE_FILENAME
+        if ref_parser is None:
+            ref_parser = ReferenceParser()
+        self._parser_id = _parser_id(ref_parser)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+        self._written_ns = 0
+        self._dirty = False
+        self.hits = 0
+        """Number of files loaded from the cache without reading them."""
+        self.verified = 0
+        """Number of files read and hashed, but not parsed."""
+        self.misses = 0
+        """Number of files read and parsed."""
+        self._load()
+
+    def _load(self):
+        try:
+            with open(str(self.filename), encoding="utf-8") as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            _LOG.warning("Ignoring corrupt fragment cache %s", self.filename)
+            return
+        if (
+            data.get("version") != CACHE_FORMAT_VERSION
+            or data.get("parser") != self._parser_id
+        ):
+            _LOG.info("Ignoring fragment cache %s from another version", self.filename)
+            return
+        self._entries = data.get("entries", {})
+        self._written_ns = data.get("written_ns", 0)
+
+    def _restore(self, filename, reference, ref_parser, fragment_data):
+        fragment = Fragment(filename, reference, ref_parser)
+        fragment.text = fragment_data["text"]
+        for ref_str in fragment_data["refs"]:
+            fragment.add_ref(ref_str)
+        for author in fragment_data["authors"]:
+            fragment._insert_ref(Reference("author", author, []))
+        if fragment_data["issue"] is not None:
+            fragment._insert_ref(Reference("issue", str(fragment_data["issue"]), []))
+        return fragment
+
+    def _store(self, key, st, digest, fragments: List[Fragment], ref_parser):
+        entry = _stat_key(st)
+        entry["sha256"] = digest
+        entry["fragments"] = [
+            {
+                "text": fragment.text,
+                "refs": [ref_parser.unparse(ref) for ref in fragment.refs],
+                "authors": list(fragment.authors),
+                "issue": getattr(fragment, "issue", None),
+            }
+            for fragment in fragments
+        ]
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def parse_fragment_file(
+        self, filename, reference=None, ref_parser=None
+    ) -> List[Fragment]:
+        """Return the fragments for a file, using the cache if possible.
+
+        A drop-in replacement for :func:`proclamation.types.parse_fragment_file`.
+        """
+        return self.read_fragment_file(filename, reference, ref_parser)[0]
+
+    def read_fragment_file(
+        self, filename, reference=None, ref_parser=None
+    ) -> Tuple[List[Fragment], int]:
+        """Like :func:`parse_fragment_file`, also returning the number of
+        bytes read: 0 if the fragments were loaded without reading the file."""
+        if ref_parser is None:
+            ref_parser = ReferenceParser()
+        key = str(Path(filename).resolve())
+        st = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+        racy = st.st_mtime_ns + RACY_WINDOW_NS >= self._written_ns
+        if (
+            entry is not None
+            and not racy
+            and all(entry.get(k) == v for k, v in _stat_key(st).items())
+        ):
+            with self._lock:
+                self.hits += 1
+            fragments = [
+                self._restore(filename, reference, ref_parser, data)
+                for data in entry["fragments"]
+            ]
+            return fragments, 0
+
+        with open(key, "rb") as fp:
+            content = fp.read()
+        digest = hashlib.sha256(content).hexdigest()
+        if entry is not None and entry.get("sha256") == digest:
+            fragments = [
+                self._restore(filename, reference, ref_parser, data)
+                for data in entry["fragments"]
+            ]
+            with self._lock:
+                self.verified += 1
+        else:
+            # newline=None gives the same newline handling as open()
+            io = StringIO(content.decode("utf-8"), newline=None)
+            fragment = Fragment(filename, reference, ref_parser, io=io)
+            fragments = [fragment] + fragment.parse_file()
+            fragment.io = None
+            with self._lock:
+                self.misses += 1
+        self._store(key, st, digest, fragments, ref_parser)
+        return fragments, len(content)
+
+    def evict_missing(self):
+        """Drop entries for files that no longer exist."""
+        with self._lock:
+            missing = [key for key in self._entries if not os.path.exists(key)]
+            for key in missing:
+                del self._entries[key]
+            if missing:
+                self._dirty = True
+        _LOG.debug("Evicted %d cache entries for deleted files", len(missing))
+        return len(missing)
+
+    def save(self):
+        """Evict entries for deleted files and write the cache, if changed."""
+        self.evict_missing()
+        _LOG.info(
+            "Fragment cache: %d hits, %d verified by hash, %d misses",
+            self.hits,
+            self.verified,
+            self.misses,
+        )
+        if not self._dirty:
+            return
+        prepare_cache_directory(self.directory)
+        with self._lock:
+            data = {
+                "version": CACHE_FORMAT_VERSION,
+                "parser": self._parser_id,
+                "written_ns": time.time_ns(),
+                "entries": self._entries,
+            }
+            tmp_fn = self.filename.with_name(self.filename.name + ".tmp")
+            with open(str(tmp_fn), "w", encoding="utf-8") as fp:
+                json.dump(data, fp)
+            os.replace(str(tmp_fn), str(self.filename))
+            self._dirty = False
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Validate fragment files without rendering, reporting every problem."""
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .project import resolve_jobs
+from .types import (
+    FRONT_MATTER_DELIMITER,
+    Reference,
+    ReferenceParser,
+    scan_fragment_directory,
+    split_fragment_text,
+)
+
+
+class Problem(NamedTuple):
+    """A problem found in a fragment file."""
+
+    filename: Path
+    line: Optional[int]
+    """1-based line number, if the problem is on a specific line."""
+    message: str
+
+    def __str__(self):
+        """Format like a compiler diagnostic.
+
+        >>> str(Problem(Path("pr.1.md"), 3, "oops"))
+        'pr.1.md:3: oops'
+        >>> str(Problem(Path("pr.1.md"), None, "oops"))
+        'pr.1.md: oops'
+        """
+        if self.line is None:
+            return f"{self.filename}: {self.message}"
+        return f"{self.filename}:{self.line}: {self.message}"
+
+
+def _check_reference(
+    ref: Reference,
+    line: Optional[int],
+    ref_parser: ReferenceParser,
+    seen: Dict[Tuple, Optional[int]],
+) -> List[Tuple[Optional[int], str]]:
+    problems = []
+    ref_str = ref_parser.unparse(ref)
+    known_item_types = getattr(ref_parser, "known_item_types", None)
+    if known_item_types is not None and ref.item_type not in known_item_types:
+        problems.append((line, f"unknown reference type '{ref.item_type}'"))
+    if ref.item_type == "issue":
+        try:
+            int(ref.identifier)
+        except ValueError:
+            problems.append((line, f"issue reference '{ref_str}' is not a number"))
+    key = ref.as_tuple()
+    if key in seen:
+        first = seen[key]
+        where = "in the file name" if first is None else f"on line {first}"
+        problems.append((line, f"duplicate reference '{ref_str}', already {where}"))
+    else:
+        seen[key] = line
+    return problems
+
+
+def check_fragment_file(
+    filename, reference: Optional[Reference] = None, ref_parser=None
+) -> List[Problem]:
+    """Return every problem in a fragment file, without stopping at the first.
+
+    Splits the file with :func:`proclamation.types.split_fragment_text`, like
+    :func:`proclamation.types.parse_fragment_file`, and also flags reference
+    types not in ``ref_parser.known_item_types``, duplicate references and
+    empty bodies.
+    """
+    if ref_parser is None:
+        ref_parser = ReferenceParser()
+    filename = Path(filename)
+    if reference is None:
+        reference = ref_parser.parse_filename(filename.name)
+    if not reference:
+        return [Problem(filename, None, "file name is not a valid reference")]
+    found: List[Tuple[Optional[int], str]] = []
+    seen: Dict[Tuple, Optional[int]] = {}
+    found.extend(_check_reference(reference, None, ref_parser, seen))
+    try:
+        with open(str(filename), encoding="utf-8") as fp:
+            contents = split_fragment_text(fp)
+    except UnicodeDecodeError as e:
+        return [Problem(filename, None, f"not valid UTF-8: {e.reason}")]
+    except OSError as e:
+        return [Problem(filename, None, e.strerror)]
+
+    for number, line in contents.references:
+        ref = ref_parser.parse(line)
+        if not ref:
+            found.append((number, f"cannot parse '{line}' as a reference"))
+            continue
+        found.extend(_check_reference(ref, number, ref_parser, seen))
+    if contents.front_matter_closed is False:
+        found.append((1, f"front matter is not closed by '{FRONT_MATTER_DELIMITER}'"))
+    if not contents.bullets:
+        found.append((None, "empty fragment body"))
+    return [Problem(filename, line, message) for line, message in found]
+
+
+def check_project(
+    project, ref_parser=None, jobs=1, scanner=None
+) -> Tuple[int, List[Problem]]:
+    """Check all fragment files of a project, in parallel if jobs > 1.
+
+    Files in section directories that have a fragment extension but whose
+    name is not a valid reference, and so would be silently ignored, are
+    reported as well.
+
+    scanner: optional :class:`proclamation.project.FileListScanner`, to only
+    check some of the files.
+
+    Returns the number of fragment files checked and the problems found,
+    in a deterministic order.
+    """
+    if ref_parser is None:
+        ref_parser = project.ref_parser
+    list_directory = scan_fragment_directory
+    if scanner is not None:
+        list_directory = scanner.list_directory
+    problems: List[Problem] = []
+    entries = []
+    for section in project.sections:
+        rejected: List[Path] = []
+        try:
+            entries.extend(
+                list_directory(project.section_directory(section), ref_parser, rejected)
+            )
+        except FileNotFoundError as e:
+            message = f"directory of section '{section.name}' does not exist"
+            problems.append(Problem(Path(e.filename), None, message))
+        problems.extend(
+            Problem(fn, None, "file name is not a valid reference, so it is ignored")
+            for fn in rejected
+        )
+    filenames = [filename for filename, _ in entries]
+    refs = [ref for _, ref in entries]
+    jobs = resolve_jobs(jobs)
+    args = (filenames, refs, repeat(ref_parser))
+    if jobs == 1 or len(entries) < 2:
+        results = list(map(check_fragment_file, *args))
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(check_fragment_file, *args))
+    problems.extend(chain.from_iterable(results))
+    return len(entries), problems
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""A client for ``proclamation serve``, see :mod:`proclamation.server`.
+
+For example::
+
+    from proclamation.client import Client
+
+    client = Client("/run/proclamation.sock")
+    for project, text in client.draft(version="2.0").items():
+        print(text)
+"""
+
+import json
+import socket
+from typing import Dict, Optional
+
+
+class ServerError(RuntimeError):
+    """The server could not answer a request."""
+
+
+class Client:
+    """Sends requests to a server on a Unix socket, or a localhost port."""
+
+    def __init__(
+        self,
+        socket_path=None,
+        port: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Construct a client for the server at socket_path, or else port."""
+        if (socket_path is None) == (port is None):
+            raise ValueError("Pass exactly one of socket_path and port")
+        self.socket_path = socket_path
+        self.port = port
+        self.timeout = timeout
+
+    def _connect(self) -> socket.socket:
+        if self.socket_path is not None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address = str(self.socket_path)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = ("127.0.0.1", self.port)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(address)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def request(self, command: str, **params) -> dict:
+        """Send a request and return the response.
+
+        Parameters that are None are left out, to use the server's defaults.
+        Raises :class:`ServerError` if the server reports an error.
+        """
+        request = {"command": command}
+        request.update((k, v) for k, v in params.items() if v is not None)
+        with self._connect() as sock, sock.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            line = stream.readline()
+        if not line:
+            raise ServerError("The server closed the connection without answering")
+        response = json.loads(line)
+        if not response.pop("ok", False):
+            raise ServerError(response.get("error", "Unknown error"))
+        return response
+
+    def ping(self):
+        """Check that the server is answering."""
+        self.request("ping")
+
+    def draft(
+        self,
+        project: Optional[str] = None,
+        version: Optional[str] = None,
+        date: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Return the draft of each (or the named) project, by project name."""
+        return self.request("draft", project=project, version=version, date=date)[
+            "drafts"
+        ]
+
+    def check(self, project: Optional[str] = None, since: Optional[str] = None):
+        """Check fragments, returning the number of files checked and a list
+        of problems, each a dict with filename, line and message."""
+        response = self.request("check", project=project, since=since)
+        return response["checked"], response["problems"]
+
+    def export(self, project: Optional[str] = None, fmt: str = "json") -> str:
+        """Return the parsed fragments in an export format, as a string."""
+        return self.request("export", project=project, format=fmt)["output"]
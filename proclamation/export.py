@@ -0,0 +1,152 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Export the parsed fragment model as JSON, without rendering it."""
+
+import json
+from itertools import chain
+from operator import attrgetter
+from typing import Iterable, Iterator, TextIO, Tuple
+
+from .types import Fragment, Section, parse_fragment_file, reference_sort_key
+
+FORMATS = ("json", "ndjson")
+
+
+def fragment_to_dict(fragment: Fragment, ref_parser) -> dict:
+    """Return the JSON-compatible data for a parsed fragment."""
+    try:
+        issue = fragment.issue
+    except AttributeError:
+        issue = None
+    return {
+        "filename": str(fragment.filename),
+        "text": fragment.text,
+        "prefix": fragment.prefix,
+        "refs": [
+            {
+                "ref": ref_parser.unparse(ref),
+                "item_type": ref.item_type,
+                "identifier": ref.identifier,
+                "service_params": list(ref.service_params),
+            }
+            for ref in fragment.refs
+        ],
+        "authors": list(fragment.authors),
+        "issue": issue,
+    }
+
+
+def iter_section_fragments(
+    project, ref_parser=None, cache=None, scanner=None, populated=False
+) -> Iterator[Tuple[Section, Iterator[Fragment]]]:
+    """Yield a (section, fragments) pair for each section of a project,
+    where fragments parses the files of the section one by one.
+
+    Unlike :func:`proclamation.project.Project.populate_sections`, nothing is
+    kept: each fragment file is only read when the previous one has been
+    consumed, so memory use does not grow with the number of fragments.
+    Within a section, fragments come in the order of their references, as
+    they are rendered unless the section sorts by prefix.
+
+    populated: if true, the project is already populated, e.g. by
+    :mod:`proclamation.server`, and its fragments are used instead of
+    reading the files again.
+    """
+    if populated:
+        for section in project.sections:
+            yield section, iter(sorted(section.fragments, key=attrgetter("sort_key")))
+        return
+    if ref_parser is None:
+        ref_parser = project.ref_parser
+    parse = parse_fragment_file if cache is None else cache.parse_fragment_file
+    for section, entries in project.list_sections(ref_parser, scanner):
+        entries = sorted(entries, key=lambda entry: reference_sort_key(entry[1]))
+        yield section, chain.from_iterable(
+            parse(filename, ref, ref_parser) for filename, ref in entries
+        )
+
+
+def iter_records(
+    projects, ref_parser=None, cache=None, scanner=None, populated=False
+) -> Iterator[dict]:
+    """Yield a flat stream of project, section and fragment records.
+
+    Each record has a ``type`` key. Section and fragment records follow
+    their project (and section) record, and name it. The other arguments
+    are passed to :func:`iter_section_fragments`.
+    """
+    for project in projects:
+        parser = ref_parser if ref_parser is not None else project.ref_parser
+        yield {"type": "project", "name": project.name}
+        for section, fragments in iter_section_fragments(
+            project, parser, cache, scanner, populated
+        ):
+            yield {"type": "section", "project": project.name, "name": section.name}
+            for fragment in fragments:
+                record = {
+                    "type": "fragment",
+                    "project": project.name,
+                    "section": section.name,
+                }
+                record.update(fragment_to_dict(fragment, parser))
+                yield record
+
+
+def write_ndjson(out: TextIO, records: Iterable[dict]):
+    """Write records as newline-delimited JSON, one record per line."""
+    for record in records:
+        out.write(json.dumps(record))
+        out.write("\n")
+
+
+_NESTING = {"project": ("sections", 0), "section": ("fragments", 1)}
+"""Records that open a nested list, with the list name and their depth."""
+
+_CONTEXT_KEYS = ("type", "project", "section")
+
+
+def write_json(out: TextIO, records: Iterable[dict]):
+    """Write records from :func:`iter_records` as a single nested JSON document.
+
+    The document is written as records arrive, so it is never held in memory:
+    ``{"projects": [{"name": ..., "sections": [{"name": ..., "fragments":
+    [...]}]}]}``.
+    """
+    out.write('{"projects": [')
+    depth = 0
+    first = True
+    for record in records:
+        list_name, level = _NESTING.get(record["type"], (None, 2))
+        while depth > level:
+            out.write("]}")
+            depth -= 1
+            first = False
+        if not first:
+            out.write(", ")
+        data = json.dumps({k: v for k, v in record.items() if k not in _CONTEXT_KEYS})
+        if list_name is None:
+            out.write(data)
+            first = False
+        else:
+            # Leave the object open for the nested list.
+            out.write(f'{data[:-1]}, "{list_name}": [')
+            depth += 1
+            first = True
+    out.write("]}" * depth)
+    out.write("]}\n")
+
+
+def write_records(out: TextIO, records: Iterable[dict], fmt="json"):
+    """Write records from :func:`iter_records` in one of :data:`FORMATS`."""
+    writers = {"json": write_json, "ndjson": write_ndjson}
+    writers[fmt](out, records)
+
+
+def export(out: TextIO, projects, fmt="json", **kwargs):
+    """Write the fragments of projects to out in one of :data:`FORMATS`.
+
+    Keyword arguments are passed to :func:`iter_records`.
+    """
+    write_records(out, iter_records(projects, **kwargs), fmt)
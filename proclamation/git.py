@@ -0,0 +1,244 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Find fragment files using the git repository they are in."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .sources import FragmentSource
+from .types import Reference, filter_fragment_names
+
+
+class GitError(RuntimeError):
+    """A git command failed, e.g. because of an unknown revision."""
+
+
+def run_git(args: List[str], cwd=None) -> bytes:
+    """Run git with args in cwd and return its standard output.
+
+    Raises :class:`GitError` with git's error message if it fails.
+    """
+    # Only imported when needed, to keep startup fast.
+    import subprocess
+
+    try:
+        proc = subprocess.run(
+            ["git"] + args,
+            cwd=None if cwd is None else str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        raise GitError("git is not installed or not on the PATH") from None
+    if proc.returncode != 0:
+        message = proc.stderr.decode(errors="replace").strip()
+        raise GitError(f"git {args[0]} failed: {message}")
+    return proc.stdout
+
+
+def toplevel(cwd=None) -> Path:
+    """Return the root of the working tree containing cwd."""
+    output = run_git(["rev-parse", "--show-toplevel"], cwd)
+    return Path(output.decode().rstrip("\n"))
+
+
+def parse_name_status(output: bytes) -> List[Tuple[str, str]]:
+    """Parse the output of ``git diff --name-status -z --no-renames``.
+
+    Returns a list of (status letter, path) pairs.
+
+    >>> parse_name_status(b"A\\0changes/pr.1.md\\0D\\0changes/pr.2.md\\0")
+    [('A', 'changes/pr.1.md'), ('D', 'changes/pr.2.md')]
+    """
+    fields = output.decode().split("\0")
+    return [(fields[i][:1], fields[i + 1]) for i in range(0, len(fields) - 1, 2)]
+
+
+def changed_files(since: str, cwd=None) -> List[Path]:
+    """Return the files added or modified since a git revision.
+
+    The revision is compared with the working tree, in a single
+    ``git diff``, so committed and staged changes are included but untracked
+    files are not. Deleted files are left out. Returns absolute paths.
+    """
+    root = toplevel(cwd)
+    output = run_git(["diff", "--name-status", "-z", "--no-renames", since, "--"], cwd)
+    return [root / path for status, path in parse_name_status(output) if status != "D"]
+
+
+class TreeEntry(NamedTuple):
+    """An entry of ``git ls-tree`` output."""
+
+    mode: str
+    object_type: str
+    object_id: str
+    path: str
+
+
+def parse_ls_tree(output: bytes) -> List[TreeEntry]:
+    """Parse the output of ``git ls-tree -z``.
+
+    >>> (entry,) = parse_ls_tree(b"100644 blob 45b9\\tchanges/pr.1.md\\0")
+    >>> entry.object_id, entry.path
+    ('45b9', 'changes/pr.1.md')
+    """
+    entries = []
+    for record in output.decode().split("\0"):
+        if not record:
+            continue
+        info, path = record.split("\t", 1)
+        mode, object_type, object_id = info.split()
+        entries.append(TreeEntry(mode, object_type, object_id, path))
+    return entries
+
+
+def split_tree_range(tree: str) -> Tuple[Optional[str], str]:
+    """Split ``BASE..REV`` into (BASE, REV), or a plain tree-ish into (None, it).
+
+    >>> split_tree_range("v2.3..HEAD")
+    ('v2.3', 'HEAD')
+    >>> split_tree_range("main")
+    (None, 'main')
+    """
+    if ".." in tree:
+        base, rev = tree.split("..", 1)
+        return base, rev or "HEAD"
+    return None, tree
+
+
+class BlobReader:
+    """Reads blob contents through one long-running ``git cat-file --batch``.
+
+    The process is started on the first read, and shared by all threads.
+    Use as a context manager, or call :func:`close` when done.
+    """
+
+    def __init__(self, cwd=None):
+        """Construct a reader for the repository containing cwd."""
+        self.cwd = cwd
+        self._process = None
+        self._lock = threading.Lock()
+
+    def read(self, object_id: str) -> bytes:
+        """Return the contents of a blob."""
+        with self._lock:
+            if self._process is None:
+                import subprocess
+
+                try:
+                    self._process = subprocess.Popen(
+                        ["git", "cat-file", "--batch"],
+                        cwd=None if self.cwd is None else str(self.cwd),
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                    )
+                except FileNotFoundError:
+                    raise GitError("git is not installed or not on the PATH") from None
+            stdin = self._process.stdin
+            stdout = self._process.stdout
+            stdin.write(object_id.encode() + b"\n")
+            stdin.flush()
+            header = stdout.readline().split()
+            if len(header) != 3 or header[1] != b"blob":
+                raise GitError(f"git cat-file could not read blob {object_id}")
+            data = stdout.read(int(header[2]))
+            # Each object is followed by a newline.
+            stdout.read(1)
+            return data
+
+    def close(self):
+        """Stop the git process, if it was started."""
+        with self._lock:
+            if self._process is not None:
+                self._process.stdin.close()
+                self._process.wait()
+                self._process.stdout.close()
+                self._process = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class GitTreeSource(FragmentSource):
+    """Lists and reads fragment files from a git tree instead of the disk.
+
+    Section directories are looked up in the tree at their path relative to
+    base, like ``git ls-tree`` run in base does: so base is normally the
+    directory of the config file in a working tree, or a bare repository
+    (with a config file given on the command line). The fragment files keep
+    their names as if checked out in base, but nothing is read from there.
+
+    All blobs are read through a single :class:`BlobReader`.
+    """
+
+    def __init__(self, tree: str, base=None, since: Optional[str] = None):
+        """Construct a source for a tree-ish, in the repository containing base.
+
+        If since is a revision, only the files added or modified between
+        it and tree are listed.
+        """
+        self.tree = tree
+        self.base = Path(base or ".").resolve()
+        self._object_ids: Dict[Path, str] = {}
+        self._changed = None
+        if since is not None:
+            output = run_git(
+                [
+                    "diff",
+                    "--name-status",
+                    "-z",
+                    "--no-renames",
+                    "--relative",
+                    since,
+                    tree,
+                    "--",
+                ],
+                self.base,
+            )
+            self._changed = {
+                path for status, path in parse_name_status(output) if status != "D"
+            }
+        self._reader = BlobReader(self.base)
+
+    def list_directory(
+        self, directory, ref_parser, rejected: Optional[List[Path]] = None
+    ) -> List[Tuple[Path, Reference]]:
+        """List a directory of the tree, see
+        :func:`proclamation.sources.FragmentSource.list_directory`.
+
+        Raises FileNotFoundError if the tree has no such directory, like
+        scanning a missing directory on disk.
+        """
+        directory = Path(directory).resolve()
+        relative = Path(os.path.relpath(str(directory), str(self.base))).as_posix()
+        output = run_git(["ls-tree", "-z", self.tree, "--", relative + "/"], self.base)
+        if not output:
+            # git trees have no empty directories.
+            raise FileNotFoundError(f"No directory {relative} in {self.tree}")
+        names = []
+        for entry in parse_ls_tree(output):
+            # Only regular files, like a directory scan.
+            if entry.object_type != "blob" or not entry.mode.startswith("100"):
+                continue
+            if self._changed is not None and entry.path not in self._changed:
+                continue
+            filename = directory / entry.path.rsplit("/", 1)[-1]
+            self._object_ids[filename] = entry.object_id
+            names.append(filename.name)
+        return filter_fragment_names(directory, names, ref_parser, rejected)
+
+    def read_text(self, filename) -> str:
+        """Return the contents of a file listed by :func:`list_directory`."""
+        object_id = self._object_ids[Path(filename)]
+        return self._reader.read(object_id).decode("utf-8")
+
+    def close(self):
+        """Stop reading blobs."""
+        self._reader.close()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Index the release headings already in a changelog file."""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set
+
+_LOG = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+
+class Heading(NamedTuple):
+    """A line in a changelog file matching the insert point pattern."""
+
+    offset: int
+    """Byte offset of the start of the line in the file."""
+
+    line: str
+    """The text of the line, without line ending."""
+
+    version: Optional[str]
+    """The version parsed from the line, if any."""
+
+
+def parse_version(project_settings, line: str) -> Optional[str]:
+    """Return the version string in a heading line, or None.
+
+    Uses the ``version`` group of the version pattern if it has one,
+    otherwise the whole match.
+    """
+    version_re = project_settings.version_re
+    match = version_re.search(line)
+    if not match:
+        return None
+    if "version" in version_re.groupindex:
+        return match.group("version")
+    return match.group(0)
+
+
+def index_filename(cache_dir, news_filename) -> Path:
+    """Return the name of the saved index of a changelog file in a cache
+    directory."""
+    key = str(Path(news_filename).resolve()).encode("utf-8")
+    return Path(cache_dir) / f"headings-{hashlib.sha1(key).hexdigest()}.json"
+
+
+class HeadingIndex:
+    """Byte offsets and versions of every release heading in a changelog file.
+
+    A release heading is a line matching the insert point pattern, so each
+    release runs from its heading to the next one.
+    """
+
+    def __init__(self, project_settings, headings: List[Heading], stat=None):
+        """Construct from headings, usually through :func:`get_heading_index`."""
+        self.settings = project_settings
+        self.filename = Path(project_settings.news_filename)
+        self.headings = headings
+        """List of :class:`Heading` tuples, in file order."""
+        self._stat = stat
+        self._lines: Set[str] = set()
+        self._versions: Dict[str, int] = {}
+        self._rebuild_lookups()
+
+    def _rebuild_lookups(self):
+        self._lines = {heading.line.rstrip() for heading in self.headings}
+        self._versions = {}
+        for i, heading in enumerate(self.headings):
+            if heading.version is not None:
+                self._versions.setdefault(heading.version, i)
+
+    @classmethod
+    def scan(cls, project_settings) -> "HeadingIndex":
+        """Build an index by reading the whole changelog file.
+
+        A missing file results in an empty index.
+        """
+        filename = project_settings.news_filename
+        try:
+            with open(str(filename), "rb") as fp:
+                stat = os.fstat(fp.fileno())
+                headings = cls._scan_lines(project_settings, fp, 0)
+        except FileNotFoundError:
+            return cls(project_settings, [])
+        _LOG.info("Indexed %d headings in %s", len(headings), filename)
+        return cls(project_settings, headings, stat)
+
+    @staticmethod
+    def _scan_lines(project_settings, fp, offset, end=None) -> List[Heading]:
+        insert_point_re = project_settings.insert_point_re
+        headings = []
+        for raw_line in fp:
+            if end is not None and offset >= end:
+                break
+            line = raw_line.decode("utf-8", errors="replace")
+            line = line.rstrip("\r\n")
+            if insert_point_re.match(line):
+                headings.append(
+                    Heading(offset, line, parse_version(project_settings, line))
+                )
+            offset += len(raw_line)
+        return headings
+
+    @classmethod
+    def load(cls, project_settings, cache_dir) -> Optional["HeadingIndex"]:
+        """Load an index saved in cache_dir, if it is still valid for the
+        changelog file."""
+        fn = index_filename(cache_dir, project_settings.news_filename)
+        try:
+            with open(str(fn), encoding="utf-8") as fp:
+                data = json.load(fp)
+            stat = os.stat(str(project_settings.news_filename))
+        except (FileNotFoundError, ValueError):
+            return None
+        if (
+            data.get("format") != INDEX_FORMAT_VERSION
+            or data.get("insert_point_pattern")
+            != project_settings.insert_point_re.pattern
+            or data.get("version_pattern") != project_settings.version_re.pattern
+            or data.get("mtime_ns") != stat.st_mtime_ns
+            or data.get("size") != stat.st_size
+        ):
+            _LOG.info("Heading index for %s is stale", project_settings.news_filename)
+            return None
+        headings = [Heading(*heading) for heading in data["headings"]]
+        return cls(project_settings, headings, stat)
+
+    def save(self, cache_dir):
+        """Save this index in cache_dir, for :func:`load`.
+
+        Failing to write it is only logged: the index is scanned again next
+        time.
+        """
+        if self._stat is None:
+            return
+        data = {
+            "format": INDEX_FORMAT_VERSION,
+            "insert_point_pattern": self.settings.insert_point_re.pattern,
+            "version_pattern": self.settings.version_re.pattern,
+            "mtime_ns": self._stat.st_mtime_ns,
+            "size": self._stat.st_size,
+            "headings": [list(heading) for heading in self.headings],
+        }
+        fn = index_filename(cache_dir, self.filename)
+        tmp_fn = fn.with_name(fn.name + ".tmp")
+        try:
+            with open(str(tmp_fn), "w", encoding="utf-8") as fp:
+                json.dump(data, fp)
+            os.replace(str(tmp_fn), str(fn))
+        except OSError as e:
+            _LOG.info("Cannot save heading index %s: %s", fn, e)
+
+    def update_after_insert(self, insert_offset: int, length: int):
+        """Update the index after length bytes were inserted at insert_offset,
+        indexing only the inserted bytes."""
+        with open(str(self.filename), "rb") as fp:
+            self._stat = os.fstat(fp.fileno())
+            fp.seek(insert_offset)
+            inserted = self._scan_lines(
+                self.settings, fp, insert_offset, insert_offset + length
+            )
+        before = [h for h in self.headings if h.offset < insert_offset]
+        after = [
+            h._replace(offset=h.offset + length)
+            for h in self.headings
+            if h.offset >= insert_offset
+        ]
+        self.headings = before + inserted + after
+        self._rebuild_lookups()
+
+    def update_after_truncate(self, position: int):
+        """Update the index after the file was truncated at the start of the
+        release at position."""
+        self.headings = self.headings[:position]
+        self._stat = os.stat(str(self.filename))
+        self._rebuild_lookups()
+
+    def has_heading(self, line: str) -> bool:
+        """Return true if a heading with this exact text already exists."""
+        return line.rstrip() in self._lines
+
+    def find_version(self, version: str) -> Optional[int]:
+        """Return the position of the (first) release with this version.
+
+        A leading ``v`` is optional.
+        """
+        candidates = [version]
+        if version.startswith("v"):
+            candidates.append(version[1:])
+        else:
+            candidates.append("v" + version)
+        for candidate in candidates:
+            if candidate in self._versions:
+                return self._versions[candidate]
+        return None
+
+    def is_duplicate(self, line: str) -> bool:
+        """Return true if a new heading line duplicates any existing release,
+        either exactly or by version, ignoring a leading ``v`` like
+        :meth:`find_version`."""
+        if self.has_heading(line):
+            return True
+        version = parse_version(self.settings, line)
+        return version is not None and self.find_version(version) is not None
+
+    def read_release(self, position: int) -> str:
+        """Return the text of a single release, seeking straight to it."""
+        start = self.headings[position].offset
+        with open(str(self.filename), "rb") as fp:
+            fp.seek(start)
+            if position + 1 < len(self.headings):
+                data = fp.read(self.headings[position + 1].offset - start)
+            else:
+                data = fp.read()
+        return data.decode("utf-8")
+
+
+def get_heading_index(project_settings, cache_dir=None) -> HeadingIndex:
+    """Return an up-to-date heading index for a project's changelog file.
+
+    If a cache directory is given, an index saved there is used when its
+    recorded mtime and size still match the file, and a freshly scanned one
+    is saved for next time.
+    """
+    if cache_dir is not None:
+        index = HeadingIndex.load(project_settings, cache_dir)
+        if index is not None:
+            return index
+    index = HeadingIndex.scan(project_settings)
+    if cache_dir is not None:
+        index.save(cache_dir)
+    return index
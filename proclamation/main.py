@@ -12,11 +12,20 @@ from pathlib import Path
 
 import click
 
+from .archive import archive_releases
+from .cache import CACHE_DIRNAME, FragmentCache, prepare_cache_directory
+from .check import check_project
+from .export import FORMATS, export
+from .git import GitError, GitTreeSource, changed_files, split_tree_range
+from .history import get_heading_index
 from .merge import merge_fragments
-from .project import Project
-from .render import generate_updated_changelog, render_template
+from .profiling import DISABLED, Profiler
+from .project import DirectoryScanner, FileListScanner, Project
 from .settings import settings_from_json_file
-from .utils import remove_files
+from .sources import ArchiveSource, open_archive
+from .types import ReferenceParser
+from .utils import read_manifest, remove_files, write_manifest
+from .watch import open_watcher, watch_projects, watched_paths
 
 
 class ProjectCollection:
@@ -25,19 +34,48 @@ class ProjectCollection:
     Typically populated by whatever is parsing a command line.
     """
 
-    def __init__(self, config_file, project_name, default_base, ref_parser=None):
+    def __init__(
+        self,
+        config_file,
+        project_name,
+        default_base,
+        ref_parser=None,
+        jobs=1,
+        cache=None,
+        profiler=None,
+    ):
         """Construct the ProjectCollection, including creating all Project
         objects."""
+        self.config_file = config_file
         self.project_name = project_name
         self.default_base = default_base
+        self._ref_parser = ref_parser
+        self.jobs = jobs
+        """Number of threads used to parse fragments, see
+        :func:`Project.populate_sections`."""
+        self.cache = cache
+        """Optional :class:`FragmentCache` used when populating sections."""
+        self.scanner = DirectoryScanner()
+        """Lists each fragment directory once, for all projects."""
+        if profiler is None:
+            profiler = DISABLED
+        self.profiler = profiler
+        """:class:`Profiler` timing the phases of this run."""
+        if ref_parser is None:
+            # Share one parser so directory listings can be shared too.
+            ref_parser = ReferenceParser()
         self.projects = []
         log = logging.getLogger(__name__).getChild("ProjectCollection")
         try:
-            settings = settings_from_json_file(config_file)
+            with profiler.phase("settings"):
+                settings = settings_from_json_file(config_file)
         except FileNotFoundError:
             self.loaded_config = False
             self.config_fn = config_file
             return
+        template_cache_dir = None
+        if cache is not None:
+            template_cache_dir = cache.directory / "templates"
         for project_settings in settings.projects:
             if not self.should_process_project(project_settings.name):
                 log.info(
@@ -49,13 +87,104 @@ class ProjectCollection:
             log.debug("Initializing project %s", project_settings.name)
             self.projects.append(
                 Project(
-                    project_settings, default_base=default_base, ref_parser=ref_parser
+                    project_settings,
+                    default_base=default_base,
+                    ref_parser=ref_parser,
+                    template_cache_dir=template_cache_dir,
                 )
             )
         self.loaded_config = True
         if project_name and len(self.projects) == 0:
             raise RuntimeError(f"Could not find a project named '{project_name}'")
 
+    def reload(self) -> "ProjectCollection":
+        """Return a new collection with the same options, reading the config
+        file again."""
+        return ProjectCollection(
+            self.config_file,
+            self.project_name,
+            self.default_base,
+            ref_parser=self._ref_parser,
+            jobs=self.jobs,
+            cache=self.cache,
+            profiler=self.profiler,
+        )
+
+    def populate(self, project, ref_parser=None, lazy=False, scanner=None, source=None):
+        """Populate the sections of a project using our options.
+
+        scanner: optional, used instead of our shared :class:`DirectoryScanner`,
+        e.g. a :class:`FileListScanner` from :func:`changed_files_scanner`.
+        source: optional, reads fragments from elsewhere than the file system,
+        e.g. a :class:`GitTreeSource` from :func:`git_tree_source` or an
+        :class:`ArchiveSource` from :func:`archive_source`.
+        """
+        if scanner is None:
+            scanner = self.scanner
+        project.populate_sections(
+            ref_parser,
+            jobs=self.jobs,
+            cache=self.cache,
+            lazy=lazy,
+            scanner=scanner,
+            profiler=self.profiler,
+            source=source,
+        )
+
+    def changed_files_scanner(self, since) -> FileListScanner:
+        """Return a scanner listing only the files changed since a git revision.
+
+        Runs a single ``git diff`` in the default base directory.
+        """
+        with self.profiler.phase("git diff"):
+            return FileListScanner(changed_files(since, self.default_base))
+
+    def git_tree_source(self, tree, since=None) -> GitTreeSource:
+        """Return a source reading fragments from a git tree-ish.
+
+        tree may also be a range ``BASE..REV``, which reads only the fragment
+        files added or modified in REV since BASE, like since does.
+        """
+        base, tree = split_tree_range(tree)
+        if base is not None:
+            if since is not None:
+                raise GitError("Cannot combine a revision range with --since")
+            since = base
+        return GitTreeSource(tree, self.default_base, since)
+
+    def archive_source(self, filename) -> ArchiveSource:
+        """Return a source reading fragments from a tar or zip archive.
+
+        Paths in the archive are relative to the default base directory.
+        """
+        with self.profiler.phase("read archive"):
+            return open_archive(filename, self.default_base)
+
+    def heading_index(self, project):
+        """Return the :class:`HeadingIndex` of the changelog file of a project.
+
+        It is kept in the cache directory if caching is enabled."""
+        cache_dir = None
+        if self.cache is not None:
+            cache_dir = self.cache.directory
+        return get_heading_index(project.settings, cache_dir)
+
+    def save_heading_index(self, index):
+        """Save an updated heading index, if caching is enabled."""
+        if self.cache is not None:
+            index.save(self.cache.directory)
+
+    def render_module(self):
+        """Import and return :mod:`proclamation.render`, and so Jinja2.
+
+        Deferred until a command actually renders something, so that other
+        commands start quickly. Compiled templates are cached in the cache
+        directory if caching is enabled, see :class:`Project`.
+        """
+        from . import render
+
+        return render
+
     def should_process_project(self, proj_name):
         """
         Return true if the named project is the one we want, or if
@@ -95,6 +224,46 @@ pass_project_collection = click.make_pass_decorator(ProjectCollection)
     type=click.Path(file_okay=False, dir_okay=True),
     help="Specify a different default base directory to search.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    "jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of threads to parse fragment files with. 0 means one per CPU.",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=False,
+    envvar="PROCLAMATION_CACHE",
+    help=f"Cache parsed fragments and compiled templates in {CACHE_DIRNAME}/ "
+    "in the base directory, so unchanged files are not parsed again.",
+)
+@click.option(
+    "--profile",
+    "profile",
+    is_flag=True,
+    help="Report the time spent, and the files and bytes handled, in each phase "
+    "of the run to stderr, as a table followed by a line of JSON.",
+)
+@click.option(
+    "--profile-cprofile",
+    "cprofile_file",
+    type=click.Path(file_okay=True, dir_okay=False, writable=True),
+    default=None,
+    help="Implies --profile. Also write cProfile statistics of the main thread "
+    "to this file, for pstats or snakeviz.",
+)
+@click.option(
+    "--profile-trace",
+    "trace_file",
+    type=click.Path(file_okay=True, dir_okay=False, writable=True),
+    default=None,
+    help="Implies --profile. Also write the phases to this file in Chrome "
+    "trace event format, for chrome://tracing or Perfetto.",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -103,7 +272,18 @@ pass_project_collection = click.make_pass_decorator(ProjectCollection)
     help="Show verbose info messages. Repeat for more verbosity.",
 )
 @click.pass_context
-def cli(ctx, config_file, project_name, default_base, verbose):
+def cli(
+    ctx,
+    config_file,
+    project_name,
+    default_base,
+    jobs,
+    use_cache,
+    profile,
+    cprofile_file,
+    trace_file,
+    verbose,
+):
     """Proclamation builds your changelog files from fragments."""
     fmt = "[%(levelname)s:%(name)s]  %(message)s"
     if verbose >= 2:
@@ -114,15 +294,115 @@ def cli(ctx, config_file, project_name, default_base, verbose):
         logging.getLogger(__name__).info("Verbose logging enabled.")
     else:
         logging.basicConfig(format=fmt)
-    ctx.obj = ProjectCollection(config_file, project_name, default_base)
+    profiler = DISABLED
+    if profile or cprofile_file or trace_file:
+        profiler = Profiler()
+        if cprofile_file:
+            profiler.start_cprofile()
+    cache = None
+    if use_cache:
+        cache_dir = Path(default_base or ".").resolve() / CACHE_DIRNAME
+        with profiler.phase("load cache"):
+            cache = FragmentCache(cache_dir)
+        prepare_cache_directory(cache_dir)
+
+    def on_close():
+        # A single callback, as click 7 and 8 run them in opposite orders:
+        # the cache must be saved before the profile is reported.
+        if cache is not None:
+            with profiler.phase("save cache"):
+                cache.save()
+        if profiler.enabled:
+            _report_profile(profiler, cprofile_file, trace_file)
+
+    ctx.call_on_close(on_close)
+    ctx.obj = ProjectCollection(
+        config_file,
+        project_name,
+        default_base,
+        jobs=jobs,
+        cache=cache,
+        profiler=profiler,
+    )
+
+
+def _report_profile(profiler, cprofile_file, trace_file):
+    if cprofile_file:
+        profiler.stop_cprofile(cprofile_file)
+    if trace_file:
+        profiler.write_chrome_trace(trace_file)
+    summary = profiler.summary()
+    click.echo(profiler.format_table(summary), err=True)
+    click.echo(profiler.json_line(summary), err=True)
+
+
+def _since_option(func):
+    return click.option(
+        "--since",
+        metavar="GIT_REF",
+        default=None,
+        help="Only use fragment files added or modified since this git "
+        "revision, found with a single git diff instead of listing directories.",
+    )(func)
+
+
+def _changed_files_scanner(project_collection, since, ctx):
+    if since is None:
+        return None
+    try:
+        return project_collection.changed_files_scanner(since)
+    except GitError as e:
+        raise click.UsageError(str(e), ctx)
 
 
 @cli.command()
 @click.argument("project_version", metavar="VERSION", required=False)
 @click.option("--date", "release_date", default=None, help="Release date if not today.")
+@_since_option
+@click.option(
+    "--tree",
+    metavar="TREE-ISH",
+    default=None,
+    help="Read fragment files from this git commit or tree instead of the "
+    "working tree, e.g. in a bare repository. A range BASE..REV reads only "
+    "the fragments added or modified in REV since BASE.",
+)
+@click.option(
+    "--source",
+    "archive",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Read fragment files from this tar (optionally compressed) or zip "
+    "archive, without extracting it. Paths in it are relative to the base "
+    "directory, e.g. changes/main/pr.1.md.",
+)
+@click.option(
+    "--outputs",
+    "write_extra_outputs",
+    is_flag=True,
+    help="Also render the additional outputs configured for each project "
+    "to their files.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running, and print the draft again whenever fragments or the "
+    "template of a project change. Only changed fragments are parsed again.",
+)
 @click.pass_context
 @pass_project_collection
-def draft(project_collection, ctx, project_version, release_date=None, ref_parser=None):
+def draft(
+    project_collection,
+    ctx,
+    project_version,
+    release_date=None,
+    since=None,
+    tree=None,
+    archive=None,
+    write_extra_outputs=False,
+    watch=False,
+    ref_parser=None,
+):
     """
     Preview the new VERSION portion of your changelog file(s) to stdout.
 
@@ -131,9 +411,49 @@ def draft(project_collection, ctx, project_version, release_date=None, ref_parse
 
     if project_version is None:
         project_version = "v.next (DRAFT)"
+    if watch and (archive is not None or tree is not None or since is not None):
+        raise click.UsageError(
+            "--watch cannot be combined with --source, --tree or --since", ctx
+        )
+    profiler = project_collection.profiler
+    scanner = None
+    source = None
+    if archive is not None:
+        if tree is not None or since is not None:
+            raise click.UsageError("--source cannot be combined with --tree or --since")
+        try:
+            source = project_collection.archive_source(archive)
+        except (OSError, RuntimeError) as e:
+            raise click.UsageError(str(e), ctx)
+    elif tree is not None:
+        try:
+            source = project_collection.git_tree_source(tree, since)
+        except GitError as e:
+            raise click.UsageError(str(e), ctx)
+    else:
+        scanner = _changed_files_scanner(project_collection, since, ctx)
+    if source is not None:
+        ctx.call_on_close(source.close)
+    render = project_collection.render_module()
+
+    def render_draft(project):
+        with profiler.phase("render", project.name):
+            print(
+                render.render_template(project, project_version, release_date),
+                flush=watch,
+            )
+        if write_extra_outputs:
+            with profiler.phase("outputs", project.name):
+                render.write_outputs(
+                    project, project_version, release_date, project_collection.jobs
+                )
+
+    populated = []
     for project in project_collection.projects:
         try:
-            project.populate_sections(ref_parser)
+            project_collection.populate(
+                project, ref_parser, scanner=scanner, source=source
+            )
         except FileNotFoundError as e:
             logging.getLogger(__name__).warning(
                 "Skipping project '%s', got this error while populating: %s  ",
@@ -141,7 +461,26 @@ def draft(project_collection, ctx, project_version, release_date=None, ref_parse
                 e,
             )
             continue
-        print(render_template(project, project_version, release_date))
+        except GitError as e:
+            raise click.ClickException(str(e))
+        render_draft(project)
+        populated.append(project)
+
+    if watch:
+        paths = [path for project in populated for path in watched_paths(project)]
+        with open_watcher(paths) as watcher:
+            click.echo("Watching for changes, press Ctrl+C to stop.", err=True)
+            try:
+                watch_projects(
+                    populated,
+                    render_draft,
+                    watcher,
+                    ref_parser,
+                    project_collection.cache,
+                    report=lambda message: click.echo(message, err=True),
+                )
+            except KeyboardInterrupt:
+                pass
 
 
 @cli.command()
@@ -161,6 +500,14 @@ def draft(project_collection, ctx, project_version, release_date=None, ref_parse
     help="Write an updated changelog to stdout instead of disk. "
     "Implies --keep-fragments",
 )
+@click.option(
+    "--manifest",
+    "manifest_file",
+    type=click.Path(file_okay=True, dir_okay=False, writable=True),
+    default=None,
+    help="Write the list of fragment files used to this file, "
+    "for a later 'remove-fragments --manifest'.",
+)
 @click.pass_context
 @pass_project_collection
 def build(
@@ -170,9 +517,14 @@ def build(
     release_date=None,
     keep_fragments=False,
     dry_run=False,
+    manifest_file=None,
     ref_parser=None,
 ):
-    """Build your updated changelog file."""
+    """Build your updated changelog file.
+
+    Only the fragment files that were used to build the changelog are removed
+    afterwards, even if more have appeared in the meantime.
+    """
     if dry_run and len(project_collection.projects) != 1:
         raise click.UsageError(
             "You may only build a single project at a time to stdout: "
@@ -185,7 +537,7 @@ def build(
         )
     for project in project_collection.projects:
         try:
-            project.populate_sections(ref_parser)
+            project_collection.populate(project, ref_parser)
         except FileNotFoundError as e:
             logging.getLogger(__name__).error(
                 "When processing project '%s', got this error: %s", project.name, e
@@ -195,39 +547,82 @@ def build(
     # Separate loop so that we don't write anything until we know we parsed
     # everything OK
 
+    profiler = project_collection.profiler
+    render = project_collection.render_module()
     for project in project_collection.projects:
-        new_contents = generate_updated_changelog(
-            project, project_version, release_date
-        )
         if dry_run:
-            print(new_contents)
-        else:
-            fn = project.settings.news_filename
-            with open(fn, "w", encoding="utf-8") as fp:
-                fp.write(new_contents)
+            with profiler.phase("render", project.name):
+                print(
+                    render.generate_updated_changelog(
+                        project, project_version, release_date
+                    )
+                )
+            continue
+        with profiler.phase("index", project.name):
+            index = project_collection.heading_index(project)
+        # Rendering is streamed into the new file, so is timed as part of this.
+        with profiler.phase("render and splice", project.name) as record:
+            render.write_updated_changelog(
+                project, project_version, release_date, index
+            )
+            record.add(files=1, nbytes=index.filename.stat().st_size)
+        if project.settings.archive_keep is not None:
+            with profiler.phase("archive", project.name):
+                archive_releases(project.settings, project.settings.archive_keep, index)
+        project_collection.save_heading_index(index)
+        if project.settings.outputs:
+            with profiler.phase("outputs", project.name) as record:
+                written = render.write_outputs(
+                    project, project_version, release_date, project_collection.jobs
+                )
+                record.add(files=len(written))
+
+    consumed = _consumed_fragments(project_collection)
+    if manifest_file:
+        write_manifest(manifest_file, consumed)
 
     if not keep_fragments and not dry_run:
-        _actually_remove_fragments(project_collection, ref_parser=ref_parser)
+        with profiler.phase("remove") as record:
+            remove_files(consumed)
+            record.add(files=len(consumed))
 
 
-def _actually_remove_fragments(project_collection, ref_parser=None):
+def _consumed_fragments(project_collection):
+    """Return a sorted list of fragment files in already-populated projects."""
     all_files = set()
     for project in project_collection.projects:
-        project.populate_sections(ref_parser)
-        all_files.update(set(project.fragment_filenames))
-    remove_files(all_files)
+        all_files.update(project.fragment_filenames)
+    return sorted(all_files)
+
+
+def _actually_remove_fragments(project_collection, ref_parser=None):
+    for project in project_collection.projects:
+        # Only filenames are needed, so do not read the fragments.
+        project_collection.populate(project, ref_parser, lazy=True)
+    remove_files(_consumed_fragments(project_collection))
 
 
 @cli.command()
 @click.confirmation_option()
+@click.option(
+    "--manifest",
+    "manifest_file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+    default=None,
+    help="Remove exactly the files listed in a manifest written by "
+    "'build --manifest', instead of scanning the sections.",
+)
 @click.pass_context
 @pass_project_collection
-def remove_fragments(project_collection, ctx, ref_parser=None):
+def remove_fragments(project_collection, ctx, manifest_file=None, ref_parser=None):
     """
     Remove changelog fragment files associated with all/specified projects.
 
     Typically you can allow "build" to do this for you instead of doing this manually.
     """
+    if manifest_file:
+        remove_files(read_manifest(manifest_file))
+        return
     _actually_remove_fragments(project_collection, ref_parser=ref_parser)
 
 
@@ -246,3 +641,222 @@ def merge(files, ref_parser=None):
         # Nothing to do
         return
     merge_fragments([Path(f) for f in files], ref_parser)
+
+
+@cli.command()
+@click.argument("project_version", metavar="VERSION")
+@click.pass_context
+@pass_project_collection
+def show(project_collection, ctx, project_version):
+    """
+    Print the changelog entry of an existing release VERSION to stdout.
+
+    A leading "v" in VERSION is optional.
+    """
+    if not project_collection.loaded_config:
+        raise click.UsageError(
+            f"Config file {project_collection.config_fn} not found", ctx
+        )
+    found = False
+    for project in project_collection.projects:
+        index = project_collection.heading_index(project)
+        position = index.find_version(project_version)
+        if position is None:
+            continue
+        found = True
+        click.echo(index.read_release(position), nl=False)
+    if not found:
+        raise click.ClickException(
+            f"Version {project_version} not found in any changelog file"
+        )
+
+
+@cli.command()
+@click.option(
+    "--keep",
+    "keep",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Number of the newest releases to keep in the changelog file. "
+    "Defaults to the archive_keep project setting.",
+)
+@click.pass_context
+@pass_project_collection
+def archive(project_collection, ctx, keep=None):
+    """
+    Move old releases from your changelog file(s) to archive files.
+
+    Archive files are named according to the archive_filename project setting.
+    """
+    if not project_collection.loaded_config:
+        raise click.UsageError(
+            f"Config file {project_collection.config_fn} not found", ctx
+        )
+    keeps = []
+    for project in project_collection.projects:
+        project_keep = keep
+        if project_keep is None:
+            project_keep = project.settings.archive_keep
+        if project_keep is None:
+            raise click.UsageError(
+                f"No --keep given and no archive_keep set for project {project.name}",
+                ctx,
+            )
+        keeps.append(project_keep)
+    for project, project_keep in zip(project_collection.projects, keeps):
+        index = project_collection.heading_index(project)
+        archived = archive_releases(project.settings, project_keep, index)
+        project_collection.save_heading_index(index)
+        for filename, count in archived.items():
+            click.echo(f"{project.name}: archived {count} release(s) to {filename}")
+
+
+@cli.command(name="export")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(FORMATS),
+    default="json",
+    show_default=True,
+    help="A single JSON document, or newline-delimited JSON with one "
+    "project, section or fragment record per line.",
+)
+@click.option(
+    "-o",
+    "--output",
+    "output",
+    type=click.File("w", encoding="utf-8", lazy=True),
+    default="-",
+    help="File to write to, instead of stdout.",
+)
+@click.pass_context
+@pass_project_collection
+def export_command(project_collection, ctx, fmt, output, ref_parser=None):
+    """
+    Export the parsed fragments of all/specified projects as JSON.
+
+    Every fragment is written with its text, prefix, references, authors,
+    issue and filename, as soon as it has been parsed, without rendering.
+    Projects with a missing fragment directory are skipped, as by draft.
+    """
+    if not project_collection.loaded_config:
+        raise click.UsageError(
+            f"Config file {project_collection.config_fn} not found", ctx
+        )
+    # List every directory before writing anything, so a missing one does not
+    # leave a partial document. The listings are kept by the scanner.
+    projects = []
+    for project in project_collection.projects:
+        try:
+            project.list_sections(ref_parser, project_collection.scanner)
+        except FileNotFoundError as e:
+            logging.getLogger(__name__).warning(
+                "Skipping project '%s', got this error while listing: %s",
+                project.name,
+                e,
+            )
+            continue
+        projects.append(project)
+    export(
+        output,
+        projects,
+        fmt,
+        ref_parser=ref_parser,
+        cache=project_collection.cache,
+        scanner=project_collection.scanner,
+    )
+
+
+@cli.command()
+@_since_option
+@click.pass_context
+@pass_project_collection
+def check(project_collection, ctx, since=None, ref_parser=None):
+    """
+    Check the changelog fragments of all/specified projects for problems.
+
+    Every fragment file is parsed, using --jobs threads, but nothing is
+    rendered. All problems found are reported, one per line, and the exit
+    status is non-zero if there were any.
+
+    With --since, only the fragment files changed since that git revision
+    are checked, e.g. those added by a merge request.
+    """
+    if not project_collection.loaded_config:
+        raise click.UsageError(
+            f"Config file {project_collection.config_fn} not found", ctx
+        )
+    scanner = _changed_files_scanner(project_collection, since, ctx)
+    checked = 0
+    problems = []
+    for project in project_collection.projects:
+        project_checked, project_problems = check_project(
+            project, ref_parser, jobs=project_collection.jobs, scanner=scanner
+        )
+        checked += project_checked
+        problems.extend(project_problems)
+    for problem in problems:
+        click.echo(str(problem))
+    files = len({problem.filename for problem in problems})
+    click.echo(
+        f"Checked {checked} fragment files: {len(problems)} problem(s) "
+        f"in {files} file(s)",
+        err=True,
+    )
+    if problems:
+        ctx.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Listen on a Unix socket at this path.",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(min=0, max=65535),
+    default=None,
+    help="Listen on this TCP port of 127.0.0.1 instead, where Unix sockets "
+    "are not available.",
+)
+@click.pass_context
+@pass_project_collection
+def serve(project_collection, ctx, socket_path=None, port=None):
+    """
+    Answer draft, check and export requests until interrupted.
+
+    Projects stay parsed and templates compiled between requests: only
+    fragment files whose modification time or size changed are parsed again,
+    and the config file is reloaded when it changes. Use
+    proclamation.client.Client to send requests.
+    """
+    if (socket_path is None) == (port is None):
+        raise click.UsageError("Pass exactly one of --socket and --port", ctx)
+    if not project_collection.loaded_config:
+        raise click.UsageError(
+            f"Config file {project_collection.config_fn} not found", ctx
+        )
+    # Only imported by this command, to keep startup of the others fast.
+    from . import server
+
+    proclamation = server.ProclamationServer(
+        project_collection.reload, project_collection.config_file
+    )
+    try:
+        if socket_path is not None:
+            if not hasattr(server, "UnixServer"):
+                raise click.UsageError("Unix sockets are not available, use --port")
+            listener = server.UnixServer(socket_path, proclamation)
+        else:
+            listener = server.TCPServer(port, proclamation)
+    except (OSError, RuntimeError) as e:
+        raise click.ClickException(str(e))
+    with listener:
+        click.echo(f"Listening on {listener.server_address}", err=True)
+        try:
+            listener.serve_forever()
+        except KeyboardInterrupt:
+            pass
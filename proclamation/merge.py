@@ -8,7 +8,7 @@
 
 import logging
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Iterable, List, Optional, Set, Tuple
 
 from .utils import remove_files
 from .types import FRONT_MATTER_DELIMITER, Fragment, Reference, ReferenceParser
@@ -44,6 +44,13 @@ class MegaFragment:
                 self.refs.append(ref)
                 self.refs_set.add(ref.as_tuple())
 
+    def add_fragments(self, fragments: Iterable[Fragment]):
+        """
+        Accumulate several fragments, in order.
+        """
+        for fragment in fragments:
+            self.add_fragment(fragment)
+
     def add_file(self, filename: Path, ref_parser: ReferenceParser):
         """Accumulate all fragments defined by a file."""
         fragment_ref = ref_parser.parse(filename.name)
@@ -54,9 +61,7 @@ class MegaFragment:
 
         fragment = Fragment(filename, fragment_ref, ref_parser)
         extras = fragment.parse_file()
-        self.add_fragment(fragment)
-        for extra in extras:
-            self.add_fragment(extra)
+        self.add_fragments([fragment] + extras)
 
     def export(self, ref_parser: ReferenceParser) -> str:
         """
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Time the phases of a run, for ``proclamation --profile``."""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class PhaseRecord:
+    """Timing and counts for one run of a phase, e.g. parsing one project."""
+
+    __slots__ = (
+        "name",
+        "project",
+        "start",
+        "duration",
+        "files",
+        "bytes",
+        "cached",
+        "thread",
+    )
+
+    def __init__(self, name: str, project: Optional[str]):
+        """Construct a record, starting now."""
+        self.name = name
+        self.project = project
+        self.start = time.perf_counter()
+        self.duration = 0.0
+        self.files = 0
+        self.bytes = 0
+        self.cached = 0
+        self.thread = threading.get_ident()
+
+    def add(self, files=0, nbytes=0, cached=0):
+        """Count files handled by this phase, bytes read, and files loaded
+        from a cache without reading them."""
+        self.files += files
+        self.bytes += nbytes
+        self.cached += cached
+
+
+class Profiler:
+    """Collects :class:`PhaseRecord` objects, and optionally a cProfile.
+
+    A disabled profiler records nothing, so code can be instrumented
+    unconditionally.
+    """
+
+    def __init__(self, enabled=True):
+        """Construct a profiler, starting the clock for the whole run."""
+        self.enabled = enabled
+        self.records: List[PhaseRecord] = []
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._cprofile = None
+
+    @contextmanager
+    def phase(self, name: str, project: Optional[str] = None) -> Iterator[PhaseRecord]:
+        """Time the enclosed block as a phase, optionally of a project.
+
+        Yields the :class:`PhaseRecord`, to count files and bytes with.
+        """
+        record = PhaseRecord(name, project)
+        try:
+            yield record
+        finally:
+            if self.enabled:
+                record.duration = time.perf_counter() - record.start
+                with self._lock:
+                    self.records.append(record)
+
+    def start_cprofile(self):
+        """Start profiling Python calls in this thread with cProfile."""
+        import cProfile
+
+        self._cprofile = cProfile.Profile()
+        self._cprofile.enable()
+
+    def stop_cprofile(self, filename):
+        """Stop cProfile and write its statistics to filename, for pstats."""
+        if self._cprofile is None:
+            return
+        self._cprofile.disable()
+        self._cprofile.dump_stats(str(filename))
+        self._cprofile = None
+
+    def summary(self) -> dict:
+        """Return the totals per phase and project, in order of first use."""
+        totals: Dict[Tuple[str, Optional[str]], dict] = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            key = (record.name, record.project)
+            entry = totals.get(key)
+            if entry is None:
+                entry = {
+                    "phase": record.name,
+                    "project": record.project,
+                    "seconds": 0.0,
+                    "calls": 0,
+                    "files": 0,
+                    "bytes": 0,
+                    "cached": 0,
+                }
+                totals[key] = entry
+            entry["seconds"] += record.duration
+            entry["calls"] += 1
+            entry["files"] += record.files
+            entry["bytes"] += record.bytes
+            entry["cached"] += record.cached
+        return {
+            "total_seconds": time.perf_counter() - self._start,
+            "phases": list(totals.values()),
+        }
+
+    def format_table(self, summary=None) -> str:
+        """Return a summary as a human-readable table."""
+        if summary is None:
+            summary = self.summary()
+        rows = [("phase", "project", "seconds", "files", "bytes", "cached")]
+        for entry in summary["phases"]:
+            rows.append(
+                (
+                    entry["phase"],
+                    entry["project"] or "",
+                    f"{entry['seconds']:.4f}",
+                    str(entry["files"]),
+                    str(entry["bytes"]),
+                    str(entry["cached"]),
+                )
+            )
+        rows.append(("total", "", f"{summary['total_seconds']:.4f}", "", "", ""))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i < 2 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        )
+
+    def json_line(self, summary=None) -> str:
+        """Return a summary as a single line of JSON."""
+        if summary is None:
+            summary = self.summary()
+        return json.dumps({"proclamation_profile": summary})
+
+    def write_chrome_trace(self, filename):
+        """Write the phases in Chrome trace event format.
+
+        Load the file in ``chrome://tracing`` or https://ui.perfetto.dev/
+        """
+        pid = os.getpid()
+        with self._lock:
+            records = list(self.records)
+        events = [
+            {
+                # Keep projects apart in the trace viewer.
+                "name": _qualified_name(record),
+                "cat": "proclamation",
+                "ph": "X",
+                "ts": (record.start - self._start) * 1e6,
+                "dur": record.duration * 1e6,
+                "pid": pid,
+                "tid": record.thread,
+                "args": {
+                    "project": record.project,
+                    "files": record.files,
+                    "bytes": record.bytes,
+                    "cached": record.cached,
+                },
+            }
+            for record in records
+        ]
+        with open(str(filename), "w", encoding="utf-8") as fp:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fp)
+
+
+def _qualified_name(record: PhaseRecord) -> str:
+    if record.project is None:
+        return record.name
+    return f"{record.name} ({record.project})"
+
+
+DISABLED = Profiler(enabled=False)
+"""A shared profiler that records nothing, used when none is given."""
@@ -7,10 +7,23 @@
 """Loading data for a project."""
 
 import logging
-from itertools import chain
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice, repeat
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from .types import ReferenceParser, Section
+from .profiling import DISABLED
+from .sources import FileSystemSource
+from .types import (
+    Fragment,
+    Reference,
+    ReferenceParser,
+    Section,
+    filter_fragment_names,
+    scan_fragment_directory,
+)
 
 
 def _resolve_with_base(base_dir, path):
@@ -18,10 +31,96 @@ def _resolve_with_base(base_dir, path):
     return (base_dir / path).resolve()
 
 
+def resolve_jobs(jobs):
+    """Turn a requested job count into an actual number of worker threads.
+
+    None or 1 means serial, 0 means one per CPU.
+
+    >>> resolve_jobs(None)
+    1
+    >>> resolve_jobs(4)
+    4
+    >>> resolve_jobs(0) >= 1
+    True
+    """
+    if jobs is None:
+        return 1
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+class DirectoryScanner:
+    """Lists each fragment directory at most once.
+
+    Shared by all projects in a :class:`proclamation.main.ProjectCollection`,
+    so directories used by several projects (or several sections) are only
+    scanned once per invocation. Listings are remembered per resolved
+    directory and reference parser.
+    """
+
+    def __init__(self):
+        """Construct an empty scanner."""
+        self._listings: Dict[Tuple[Path, object], List[Tuple[Path, Reference]]] = {}
+        self._lock = threading.Lock()
+        self.scans = 0
+        """Number of directories actually scanned."""
+
+    def list_directory(self, directory, ref_parser) -> List[Tuple[Path, Reference]]:
+        """Return the (filename, reference) pairs for a directory.
+
+        See :func:`proclamation.types.scan_fragment_directory`.
+        """
+        key = (Path(directory).resolve(), ref_parser)
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is None:
+                listing = scan_fragment_directory(key[0], ref_parser)
+                self._listings[key] = listing
+                self.scans += 1
+        return listing
+
+    def forget(self):
+        """Forget all listings, so directories will be scanned again."""
+        with self._lock:
+            self._listings.clear()
+
+
+class FileListScanner:
+    """Lists only the given files, as if their directories held nothing else.
+
+    Use in place of a :class:`DirectoryScanner` to limit a run to some
+    fragment files, such as those changed since a git revision (see
+    :func:`proclamation.git.changed_files`). No directory is listed, so the
+    cost does not depend on how many other fragments are pending.
+    """
+
+    def __init__(self, filenames: Iterable[Path]):
+        """Construct a scanner for the given files, which must exist."""
+        self._names: Dict[Path, List[str]] = {}
+        for filename in filenames:
+            filename = Path(filename)
+            self._names.setdefault(filename.parent.resolve(), []).append(filename.name)
+
+    def list_directory(
+        self, directory, ref_parser, rejected: Optional[List[Path]] = None
+    ) -> List[Tuple[Path, Reference]]:
+        """Return the (filename, reference) pairs of the given files in a
+        directory.
+
+        See :func:`proclamation.types.filter_fragment_names`.
+        """
+        directory = Path(directory).resolve()
+        names = self._names.get(directory, ())
+        return filter_fragment_names(directory, names, ref_parser, rejected)
+
+
 class Project:
     """A project has sections and fragments."""
 
-    def __init__(self, settings, ref_parser=None, default_base=None):
+    def __init__(
+        self, settings, ref_parser=None, default_base=None, template_cache_dir=None
+    ):
         """Construct a project.
 
         settings: a ProjectSettings object.
@@ -29,11 +128,14 @@ class Project:
         suitable.
         default_base: optional, default base directory. If unset, defaults to
         the current working directory.
+        template_cache_dir: optional, a directory to keep compiled templates
+        in, see :func:`proclamation.render.get_environment`.
         """
         super().__init__()
         if default_base is None:
             default_base = Path(".").resolve()
         self.default_base = default_base
+        self.template_cache_dir = template_cache_dir
 
         if ref_parser is None:
             ref_parser = ReferenceParser()
@@ -58,18 +160,172 @@ class Project:
             )
             sections.append(section)
 
-    def populate_sections(self, ref_parser=None):
-        """Load fragments associated with each section."""
+    def populate_sections(
+        self,
+        ref_parser=None,
+        jobs=1,
+        cache=None,
+        lazy=False,
+        scanner=None,
+        profiler=None,
+        source=None,
+    ):
+        """Load fragments associated with each section.
+
+        jobs: number of threads to parse fragment files with, across all
+        sections. 1 (the default) parses serially, 0 uses one thread per CPU.
+        The resulting order does not depend on the number of jobs.
+        cache: optional :class:`proclamation.cache.FragmentCache` to load
+        unchanged fragment files from instead of parsing them.
+        lazy: if true, only list the directories now, and leave reading
+        fragment files until their content is needed. See
+        :func:`Section.add_lazy_fragments`.
+        scanner: optional :class:`DirectoryScanner` shared with other
+        projects, to avoid listing the same directory more than once.
+        profiler: optional :class:`proclamation.profiling.Profiler` to time
+        the "scan" and "parse" phases with.
+        source: optional :class:`proclamation.sources.FragmentSource` to list
+        and read fragment files with, such as an archive. Defaults to a
+        :class:`proclamation.sources.FileSystemSource` using scanner and
+        cache, which are otherwise not used. Fragments are only lazy if the
+        source is on disk.
+        """
+        if ref_parser is None:
+            ref_parser = self.ref_parser
+        if profiler is None:
+            profiler = DISABLED
+        jobs = resolve_jobs(jobs)
+        if source is None:
+            source = FileSystemSource(scanner, cache)
+        parse = source.parse_fragment_file
+        lazy = lazy and source.on_disk
+
+        # List every directory first, then parse all files in one pool.
+        with profiler.phase("scan", self.name) as record:
+            listings = self.list_sections(ref_parser, source)
+            record.add(files=sum(len(entries) for _, entries in listings))
+
+        if lazy:
+            for section, entries in listings:
+                section.add_lazy_fragments(
+                    Fragment(filename, ref, ref_parser, lazy=True)
+                    for filename, ref in entries
+                )
+            return
+
+        entries = [entry for _, entries in listings for entry in entries]
+        filenames = [filename for filename, _ in entries]
+        refs = [ref for _, ref in entries]
+        with profiler.phase("parse", self.name) as record:
+            bytes_before = source.bytes_read
+            hits_before = source.cache_hits
+            if jobs == 1 or len(entries) < 2:
+                results = map(parse, filenames, refs, repeat(ref_parser))
+                self._add_parsed(listings, results)
+            else:
+                self._log.info("Parsing %d files using %d threads", len(entries), jobs)
+                with ThreadPoolExecutor(max_workers=jobs) as executor:
+                    # map() yields results in submission order, keeping this
+                    # deterministic
+                    results = executor.map(parse, filenames, refs, repeat(ref_parser))
+                    self._add_parsed(listings, results)
+            # Counted by the source as files are read, without extra stat calls.
+            record.add(
+                files=len(filenames),
+                nbytes=source.bytes_read - bytes_before,
+                cached=source.cache_hits - hits_before,
+            )
+
+    def list_sections(
+        self, ref_parser=None, scanner=None
+    ) -> List[Tuple[Section, List[Tuple[Path, Reference]]]]:
+        """List the fragment files of each section, without reading them.
+
+        Returns a list of (section, entries) pairs, where entries are the
+        (filename, reference) pairs from
+        :func:`proclamation.types.scan_fragment_directory`.
+        scanner: optional :class:`DirectoryScanner` shared with other
+        projects, to avoid listing the same directory more than once, or
+        any :class:`proclamation.sources.FragmentSource`.
+        """
         if ref_parser is None:
             ref_parser = self.ref_parser
+        listings = []
         for section in self.sections:
-            directory = _resolve_with_base(
-                self.default_base, section.relative_directory
-            )
+            directory = self.section_directory(section)
             self._log.info(
                 "Populating section %s from files in %s", section.name, str(directory)
             )
-            section.populate_from_directory(directory, ref_parser)
+            if scanner is None:
+                entries = section.list_directory(directory, ref_parser)
+            else:
+                entries = scanner.list_directory(directory, ref_parser)
+            listings.append((section, entries))
+        return listings
+
+    def refresh_fragments(
+        self, filenames: Iterable[Path], ref_parser=None, cache=None
+    ) -> List[Section]:
+        """Bring populated sections up to date after some files changed.
+
+        Only the given files are looked at: fragments of files that no longer
+        exist are removed, and those of new or modified files are (re-)parsed.
+        A file that cannot be parsed, e.g. because it is only partly written,
+        is logged and keeps its previous fragments, if any.
+        cache: optional :class:`proclamation.cache.FragmentCache`, as for
+        :func:`populate_sections`.
+
+        Returns the sections that changed.
+        """
+        if ref_parser is None:
+            ref_parser = self.ref_parser
+        source = FileSystemSource(cache=cache)
+        names: Dict[Path, List[str]] = {}
+        for filename in filenames:
+            filename = Path(filename)
+            names.setdefault(filename.parent.resolve(), []).append(filename.name)
+        changed = []
+        for section in self.sections:
+            directory = self.section_directory(section)
+            section_names = names.get(directory)
+            if not section_names:
+                continue
+            existing = [name for name in section_names if (directory / name).is_file()]
+            parsed: Dict[Path, List[Fragment]] = {}
+            failed = set()
+            for filename, ref in filter_fragment_names(directory, existing, ref_parser):
+                try:
+                    parsed[filename] = source.parse_fragment_file(
+                        filename, ref, ref_parser
+                    )
+                except (RuntimeError, ValueError, OSError) as e:
+                    self._log.warning(
+                        "Keeping the previous version of %s, cannot parse it: %s",
+                        filename,
+                        e,
+                    )
+                    failed.add(filename)
+            removed = section.remove_fragments(
+                directory / name
+                for name in section_names
+                if directory / name not in failed
+            )
+            section.add_fragments(chain.from_iterable(parsed.values()))
+            if removed or parsed:
+                changed.append(section)
+        return changed
+
+    def section_directory(self, section) -> Path:
+        """Return the resolved directory containing a section's fragments."""
+        return _resolve_with_base(self.default_base, section.relative_directory)
+
+    @staticmethod
+    def _add_parsed(listings, results):
+        results = iter(results)
+        for section, section_entries in listings:
+            section.add_fragments(
+                chain.from_iterable(islice(results, len(section_entries)))
+            )
 
     @property
     def fragment_filenames(self):
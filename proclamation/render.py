@@ -11,38 +11,73 @@ so if you want to do something else for templating, you can.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from io import StringIO
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from jinja2 import (
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PackageLoader,
     TemplateSyntaxError,
 )
 
+from .project import resolve_jobs
+from .utils import atomic_write, copy_file_tail
 
-def render_template(project, project_version, release_date=None):
-    """Render the CHANGES template for a project.
+_ENVIRONMENTS: Dict[Tuple[Tuple[str, ...], Optional[str]], Environment] = {}
+_ENVIRONMENTS_LOCK = threading.Lock()
 
-    Returns the rendered text.
+
+def get_environment(search_path, bytecode_cache_dir=None) -> Environment:
+    """Return the shared Jinja2 environment for a template search path.
+
+    The built-in templates are searched after the given directories.
+    Environments are created once per search path and bytecode cache
+    directory, so templates are only compiled once per process.
+
+    If bytecode_cache_dir is given, compiled templates are also stored there,
+    so later runs can skip compiling templates that have not changed. Jinja2
+    compares a checksum of the template source before using a cached copy, so
+    edited templates are recompiled.
     """
+    cache_dir = None if bytecode_cache_dir is None else str(bytecode_cache_dir)
+    key = (tuple(str(p) for p in search_path), cache_dir)
+    with _ENVIRONMENTS_LOCK:
+        env = _ENVIRONMENTS.get(key)
+        if env is not None:
+            return env
+        loader = ChoiceLoader(
+            [FileSystemLoader(search_path), PackageLoader("proclamation", "templates")]
+        )
+        bytecode_cache = None
+        if cache_dir is not None:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
+        env = Environment(
+            autoescape=False, loader=loader, bytecode_cache=bytecode_cache
+        )
+        _ENVIRONMENTS[key] = env
+        return env
+
+
+def _get_template(project, template_name=None):
     log = logging.getLogger(__name__)
+    if template_name is None:
+        template_name = project.template
     search_path = [project.default_base]
     log.debug(
         "Template search path is %s, followed by built-in templates.", str(search_path)
     )
-    loader = ChoiceLoader(
-        [FileSystemLoader(search_path), PackageLoader("proclamation", "templates")]
-    )
 
-    if release_date is None:
-        release_date = date.today().isoformat().strip()
-
-    env = Environment(autoescape=False, loader=loader)
+    env = get_environment(search_path, project.template_cache_dir)
     try:
-        template = env.get_template(project.template)
+        template = env.get_template(template_name)
     except TemplateSyntaxError as e:
         print(
             f"template syntax error during parse: {e.filename}:{e.lineno} "
@@ -50,21 +85,53 @@ def render_template(project, project_version, release_date=None):
         )
         raise RuntimeError("Jinja2 template syntax error") from e
 
-    log.info("Loaded template %s from %s", project.template, template.filename)
+    log.info("Loaded template %s from %s", template_name, template.filename)
+    return template
+
+
+def _ensure_ends_with_blank_line(chunks: Iterable[str]) -> Iterator[str]:
+    """Pass through chunks of text, adding newlines at the end if required.
+
+    >>> "".join(_ensure_ends_with_blank_line(["a", "b\\n"]))
+    'ab\\n\\n'
+    >>> "".join(_ensure_ends_with_blank_line(["a\\n", "\\n"]))
+    'a\\n\\n'
+    """
+    tail = ""
+    for chunk in chunks:
+        if chunk:
+            tail = (tail + chunk)[-2:]
+            yield chunk
+    if not tail.endswith("\n"):
+        yield "\n\n"
+    elif tail != "\n\n":
+        yield "\n"
+
+
+def generate_template(
+    project, project_version, release_date=None, template_name=None
+) -> Iterator[str]:
+    """Render the CHANGES template for a project, piece by piece.
+
+    Returns an iterator over chunks of the rendered text, which together
+    are the same as the result of :func:`render_template`.
+    template_name: optional, a template to use instead of the project's.
+    """
+    template = _get_template(project, template_name)
+
+    if release_date is None:
+        release_date = date.today().isoformat().strip()
+
+    context = {
+        "project_name": project.name,
+        "project_version": project_version,
+        "date": release_date,
+        "sections": project.sections,
+        "base_url": project.settings.base_url,
+    }
     try:
-        result = template.render(
-            {
-                "project_name": project.name,
-                "project_version": project_version,
-                "date": release_date,
-                "sections": project.sections,
-                "base_url": project.settings.base_url,
-            }
-        )
         # ensure it ends with a blank line
-        while not result.endswith("\n\n"):
-            result += "\n"
-        return result
+        yield from _ensure_ends_with_blank_line(template.generate(context))
     except TemplateSyntaxError as e:
         print(
             f"template syntax error during render: {e.filename}:{e.lineno} "
@@ -73,6 +140,78 @@ def render_template(project, project_version, release_date=None):
         raise RuntimeError("Jinja2 template syntax error") from e
 
 
+def render_template(project, project_version, release_date=None, template_name=None):
+    """Render the CHANGES template for a project.
+
+    Returns the rendered text.
+    template_name: optional, a template to use instead of the project's.
+    """
+    return "".join(
+        generate_template(project, project_version, release_date, template_name)
+    )
+
+
+def output_filename(output_settings, project, project_version) -> Path:
+    """Return the filename an output of a project is written to."""
+    return Path(
+        output_settings.output.format(
+            version=project_version, project_name=project.name
+        )
+    )
+
+
+def _write_output(output_settings, project, project_version, release_date) -> Path:
+    filename = output_filename(output_settings, project, project_version)
+    chunks = generate_template(
+        project, project_version, release_date, output_settings.template
+    )
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_write(filename) as out:
+        for chunk in chunks:
+            out.write(chunk.encode("utf-8"))
+    logging.getLogger(__name__).info(
+        "Rendered %s to %s", output_settings.template, filename
+    )
+    return filename
+
+
+def write_outputs(project, project_version, release_date=None, jobs=1) -> List[Path]:
+    """Render every additional output of a populated project to its file.
+
+    All outputs are rendered from the same, already populated, sections.
+    jobs: number of threads to render with, 0 meaning one per CPU.
+    Returns the filenames written, in the order the outputs are configured.
+    """
+    outputs = project.settings.outputs
+    if release_date is None:
+        release_date = date.today().isoformat()
+    args = (
+        outputs,
+        repeat(project),
+        repeat(project_version),
+        repeat(release_date),
+    )
+    jobs = min(resolve_jobs(jobs), len(outputs))
+    if jobs <= 1:
+        return list(map(_write_output, *args))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(_write_output, *args))
+
+
+def _find_insert_point(project_settings, contents) -> int:
+    """Return the offset of the first line matching the insert point pattern,
+    or -1. Stops scanning as soon as it is found."""
+    insert_point_re = project_settings.insert_point_re
+    pos = 0
+    end_of_contents = len(contents)
+    while pos < end_of_contents:
+        end = contents.find("\n", pos) + 1 or end_of_contents
+        if insert_point_re.match(contents[pos:end]):
+            return pos
+        pos = end
+    return -1
+
+
 def split_changelog_contents(project_settings, contents):
     """
     Split the contents of a changelog file based on the insert point pattern.
@@ -81,31 +220,18 @@ def split_changelog_contents(project_settings, contents):
     content after the insert point, including the line that matched the
     pattern.
     """
-    io = StringIO(contents)
-    before = []
-    after = []
-    found_first_line = False
-
-    insert_point_re = project_settings.insert_point_re
-
-    for line in io:
-        if found_first_line:
-            after.append(line)
-            continue
-        if insert_point_re.match(line):
-            # OK, we hadn't found it, but now we did.
-            found_first_line = True
-            after.append(line)
-            continue
-
-        # haven't found it yet
-        before.append(line)
+    split_point = _find_insert_point(project_settings, contents)
+    found_first_line = split_point >= 0
+    if not found_first_line:
+        split_point = len(contents)
+    before = contents[:split_point]
+    after = contents[split_point:]
 
     log = logging.getLogger(__name__)
     log.info(
         "%d lines before the insert point in existing file, %d after",
-        len(before),
-        len(after),
+        len(before.splitlines()),
+        len(after.splitlines()),
     )
     if not found_first_line:
         log.warning(
@@ -113,7 +239,7 @@ def split_changelog_contents(project_settings, contents):
             "insert_point_pattern, there may be an error in "
             "your settings"
         )
-    return "".join(before), "".join(after)
+    return before, after
 
 
 def get_split_changelog_file(project_settings):
@@ -132,6 +258,19 @@ def get_split_changelog_file(project_settings):
         return "# Changelog\n\n", ""
 
 
+_DUPLICATE_HEADING_MESSAGE = (
+    "Your new changelog entry has the same heading as the most recent "
+    "existing entry! Probably duplicating version numbers."
+)
+
+_DUPLICATE_VERSION_MESSAGE = (
+    "Your new changelog entry has the same heading or version as an existing "
+    "entry! Probably duplicating version numbers."
+)
+
+_DEFAULT_CHANGELOG_HEAD = "# Changelog\n\n"
+
+
 def combine_changelogs(before, after, project, project_version, release_date):
     """Return the text of the updated, complete changelog file given
     pre-split contents."""
@@ -143,10 +282,7 @@ def combine_changelogs(before, after, project, project_version, release_date):
     log = logging.getLogger(__name__)
     log.info("First line of insert point: %s", first_after_line.rstrip())
     if first_after_line.rstrip() == first_new_line.rstrip():
-        raise RuntimeError(
-            "Your new changelog entry has the same heading as the most recent "
-            "existing entry! Probably duplicating version numbers."
-        )
+        raise RuntimeError(_DUPLICATE_HEADING_MESSAGE)
     return "".join((before, new_portion, after))
 
 
@@ -155,3 +291,128 @@ def generate_updated_changelog(project, project_version, release_date=None):
     before, after = get_split_changelog_file(project.settings)
 
     return combine_changelogs(before, after, project, project_version, release_date)
+
+
+def _write_new_portion(
+    out,
+    chunks: Iterable[str],
+    is_duplicate,
+    message=_DUPLICATE_HEADING_MESSAGE,
+    newline="\n",
+) -> int:
+    """Write rendered chunks as UTF-8 with the given line ending, checking the
+    first line for a duplicate heading as soon as it is complete. Returns the
+    number of bytes written."""
+    first_line = ""
+    checked = False
+    written = 0
+    for chunk in chunks:
+        if not checked:
+            first_line += chunk
+            if "\n" not in first_line:
+                continue
+            checked = True
+            if is_duplicate(first_line.split("\n", 1)[0]):
+                raise RuntimeError(message)
+            chunk = first_line
+        if newline != "\n":
+            chunk = chunk.replace("\n", newline)
+        data = chunk.encode("utf-8")
+        out.write(data)
+        written += len(data)
+    return written
+
+
+def _write_spliced_changelog(
+    out, project, project_version, release_date, index=None
+) -> Tuple[int, int]:
+    """Write the whole updated changelog to the binary file out.
+
+    Only the head of the existing file, up to the insert point, is read and
+    decoded. The rest is copied without being read into Python where possible,
+    so the cost does not depend on the length of the history.
+
+    If a :class:`proclamation.history.HeadingIndex` is given, the new heading
+    is checked against every release in it, instead of just the most recent.
+
+    The new portion uses the line ending of the first line of the existing
+    file, so a CRLF changelog stays CRLF.
+
+    Returns the offset and length in bytes of the newly inserted portion.
+    """
+    settings = project.settings
+    log = logging.getLogger(__name__)
+    chunks = generate_template(project, project_version, release_date)
+
+    def write_new_portion(first_after_line, newline="\n"):
+        if index is not None:
+            return _write_new_portion(
+                out, chunks, index.is_duplicate, _DUPLICATE_VERSION_MESSAGE, newline
+            )
+        return _write_new_portion(
+            out,
+            chunks,
+            lambda line: first_after_line.rstrip() == line.rstrip(),
+            newline=newline,
+        )
+
+    try:
+        src = open(settings.news_filename, "rb")
+    except FileNotFoundError:
+        head = _DEFAULT_CHANGELOG_HEAD.encode("utf-8")
+        out.write(head)
+        return len(head), write_new_portion("")
+    with src:
+        insert_point_re = settings.insert_point_re
+        insert_offset = None
+        first_after_line = ""
+        head_lines = 0
+        head_length = 0
+        newline = None
+        while True:
+            offset = src.tell()
+            raw_line = src.readline()
+            if not raw_line:
+                break
+            if newline is None and raw_line.endswith(b"\n"):
+                newline = "\r\n" if raw_line.endswith(b"\r\n") else "\n"
+            line = raw_line.decode("utf-8").replace("\r\n", "\n")
+            if insert_point_re.match(line):
+                insert_offset = offset
+                first_after_line = line
+                break
+            out.write(raw_line)
+            head_lines += 1
+            head_length += len(raw_line)
+        log.info("%d lines before the insert point in existing file", head_lines)
+        if insert_offset is None:
+            log.warning(
+                "Did not find a line that matches the "
+                "insert_point_pattern, there may be an error in "
+                "your settings"
+            )
+        log.info("First line of insert point: %s", first_after_line.rstrip())
+        length = write_new_portion(first_after_line, newline or "\n")
+        if insert_offset is not None:
+            copy_file_tail(src, out, insert_offset)
+    return head_length, length
+
+
+def write_updated_changelog(project, project_version, release_date=None, index=None):
+    """Update the changelog file of a project in place.
+
+    Unlike :func:`generate_updated_changelog`, the full text is never held in
+    memory: the existing head, the newly rendered portion and the existing
+    tail are streamed into a temporary file next to the changelog, which then
+    atomically replaces it. On error, the original file is left untouched.
+
+    If a :class:`proclamation.history.HeadingIndex` of the changelog file is
+    given, a version already anywhere in the file is refused, and the index is
+    updated to match the new file by indexing only the inserted portion.
+    """
+    with atomic_write(project.settings.news_filename) as out:
+        offset, length = _write_spliced_changelog(
+            out, project, project_version, release_date, index
+        )
+    if index is not None:
+        index.update_after_insert(offset, length)
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""A long-running server answering requests over a local socket.
+
+Used by ``proclamation serve``, and :mod:`proclamation.client` to talk to it.
+
+The protocol is one JSON object per line. Each request names a ``command``
+(``draft``, ``check``, ``export`` or ``ping``) and its parameters, and gets
+one response line back: ``{"ok": true, ...}`` with the results, or
+``{"ok": false, "error": "..."}``. A connection may send several requests.
+"""
+
+import inspect
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from io import StringIO
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .check import check_project
+from .export import FORMATS, iter_records, write_records
+from .git import GitError
+from .watch import PollingWatcher, refresh_projects, watched_paths
+
+_LOG = logging.getLogger(__name__)
+
+
+class RequestError(Exception):
+    """A request was invalid, reported to the client as an error."""
+
+
+class _WarmProject:
+    """A populated project, with what is needed to keep it up to date."""
+
+    def __init__(self, collection, project):
+        self.project = project
+        self.lock = threading.Lock()
+        """Held while refreshing or rendering this project."""
+        self.watcher = None
+        self.available = False
+        self._populate(collection)
+
+    def _populate(self, collection):
+        # Snapshot the directories before reading them, to not miss changes.
+        self.watcher = PollingWatcher(watched_paths(self.project))
+        try:
+            collection.populate(self.project)
+        except FileNotFoundError as e:
+            _LOG.warning("Skipping project '%s' for now: %s", self.project.name, e)
+            return
+        self.available = True
+
+    def refresh(self, collection):
+        """Re-parse the fragment files whose mtime or size changed since the
+        last request, or try populating the project again if that failed."""
+        if not self.available:
+            self._populate(collection)
+            return
+        changed = self.watcher.wait(timeout=0)
+        if changed:
+            try:
+                refresh_projects([self.project], changed, cache=collection.cache)
+            except BaseException:
+                # Try these files again next time, rather than serving the
+                # project without them.
+                self.watcher.retry(changed)
+                raise
+
+
+class ProclamationServer:
+    """Keeps projects parsed and templates compiled between requests.
+
+    load_collection is called to (re-)create the
+    :class:`proclamation.main.ProjectCollection`, initially and whenever the
+    config file changes. Fragment files are re-parsed when their mtime or
+    size changes.
+
+    Requests are handled concurrently. Each project is refreshed and
+    rendered (or exported) by one request at a time, but requests for other
+    projects, and check requests, do not wait for it.
+    """
+
+    def __init__(self, load_collection: Callable[[], object], config_file):
+        """Construct a server, loading the projects."""
+        self._load_collection = load_collection
+        self.config_file = Path(config_file)
+        self._lock = threading.Lock()
+        self._config_stat = None
+        self._collection = None
+        self._warm: Dict[str, _WarmProject] = {}
+        self._reload_if_needed()
+
+    def _reload_if_needed(self):
+        try:
+            st = os.stat(str(self.config_file))
+            stat_key = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stat_key = None
+        with self._lock:
+            if self._collection is not None and stat_key == self._config_stat:
+                return self._collection, self._warm
+        # Load and populate without the lock, so requests still being
+        # answered from the previous collection are not held up.
+        collection = self._load_collection()
+        if not collection.loaded_config:
+            raise RequestError(f"Config file {self.config_file} not found")
+        # Compile templates now, rather than in the first request.
+        collection.render_module()
+        warm = {
+            project.name: _WarmProject(collection, project)
+            for project in collection.projects
+        }
+        with self._lock:
+            # Keep what another request loaded meanwhile from the same config.
+            if self._collection is None or stat_key != self._config_stat:
+                self._collection = collection
+                self._warm = warm
+                self._config_stat = stat_key
+            return self._collection, self._warm
+
+    def _select(self, collection, project_name: Optional[str]) -> List:
+        if project_name is None:
+            return list(collection.projects)
+        for project in collection.projects:
+            if project.name == project_name:
+                return [project]
+        raise RequestError(f"Could not find a project named '{project_name}'")
+
+    def draft(
+        self,
+        project: Optional[str] = None,
+        version: Optional[str] = None,
+        date: Optional[str] = None,
+    ) -> dict:
+        """Render drafts, like ``proclamation draft``."""
+        if version is None:
+            version = "v.next (DRAFT)"
+        collection, warm = self._reload_if_needed()
+        render = collection.render_module()
+        drafts = {}
+        for selected in self._select(collection, project):
+            state = warm[selected.name]
+            with state.lock:
+                state.refresh(collection)
+                if not state.available:
+                    continue
+                drafts[selected.name] = render.render_template(selected, version, date)
+        return {"drafts": drafts}
+
+    def check(self, project: Optional[str] = None, since: Optional[str] = None) -> dict:
+        """Check fragments for problems, like ``proclamation check``.
+
+        Unlike draft and export, this reads the fragment files again rather
+        than using the warm projects: those keep the previous version of a
+        file that cannot be parsed, which is exactly what check must report.
+        """
+        collection, _ = self._reload_if_needed()
+        scanner = None
+        if since is not None:
+            scanner = collection.changed_files_scanner(since)
+        checked = 0
+        problems = []
+        for selected in self._select(collection, project):
+            count, found = check_project(
+                selected, jobs=collection.jobs, scanner=scanner
+            )
+            checked += count
+            problems.extend(found)
+        return {
+            "checked": checked,
+            "problems": [
+                {"filename": str(p.filename), "line": p.line, "message": p.message}
+                for p in problems
+            ],
+        }
+
+    def export(self, project: Optional[str] = None, format: str = "json") -> dict:
+        """Export parsed fragments, like ``proclamation export``."""
+        if format not in FORMATS:
+            raise RequestError(f"Unknown export format '{format}'")
+        collection, warm = self._reload_if_needed()
+        records: List[dict] = []
+        for selected in self._select(collection, project):
+            state = warm[selected.name]
+            with state.lock:
+                state.refresh(collection)
+                if not state.available:
+                    continue
+                records.extend(iter_records([selected], populated=True))
+        out = StringIO()
+        write_records(out, records, format)
+        return {"output": out.getvalue()}
+
+    def handle_request(self, request: dict) -> dict:
+        """Answer a decoded request, never raising."""
+        commands = {
+            "draft": self.draft,
+            "check": self.check,
+            "export": self.export,
+            "ping": lambda: {},
+        }
+        try:
+            if not isinstance(request, dict):
+                raise RequestError("Request must be a JSON object")
+            params = dict(request)
+            command = params.pop("command", None)
+            if command not in commands:
+                raise RequestError(f"Unknown command '{command}'")
+            try:
+                inspect.signature(commands[command]).bind(**params)
+            except TypeError as e:
+                raise RequestError(f"Invalid parameters for {command}: {e}") from e
+            result = commands[command](**params)
+        except Exception as e:
+            if not isinstance(e, (RequestError, GitError)):
+                _LOG.exception("Error handling %r", request)
+            return {"ok": False, "error": str(e)}
+        result["ok"] = True
+        return result
+
+    def handle_line(self, line: bytes) -> bytes:
+        """Answer one request line with one response line."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {"ok": False, "error": f"Invalid JSON: {e}"}
+        else:
+            response = self.handle_request(request)
+        return json.dumps(response).encode("utf-8") + b"\n"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            self.wfile.write(self.server.proclamation.handle_line(line))
+            self.wfile.flush()
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class UnixServer(socketserver.ThreadingUnixStreamServer):
+        """Serves a :class:`ProclamationServer` on a Unix socket, with a
+        thread per connection."""
+
+        daemon_threads = True
+
+        def __init__(self, path, proclamation: ProclamationServer):
+            """Listen on a socket at path, replacing a stale one.
+
+            The socket is only accessible to the current user.
+            """
+            path = str(path)
+            if os.path.exists(path):
+                _remove_stale_socket(path)
+            self.proclamation = proclamation
+            super().__init__(path, _Handler)
+
+        def server_bind(self):
+            super().server_bind()
+            os.chmod(self.server_address, 0o600)
+
+        def server_close(self):
+            """Stop listening and remove the socket file."""
+            super().server_close()
+            try:
+                os.unlink(self.server_address)
+            except FileNotFoundError:
+                pass
+
+
+def _remove_stale_socket(path: str):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+            return
+    raise RuntimeError(f"A server is already listening on {path}")
+
+
+class TCPServer(socketserver.ThreadingTCPServer):
+    """Serves a :class:`ProclamationServer` on a localhost TCP port, with a
+    thread per connection. Only for platforms without Unix sockets: anyone
+    able to connect locally can use it."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port: int, proclamation: ProclamationServer):
+        """Listen on 127.0.0.1:port. Port 0 picks a free port."""
+        self.proclamation = proclamation
+        super().__init__(("127.0.0.1", port), _Handler)
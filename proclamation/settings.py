@@ -51,6 +51,28 @@ class SectionSettings:
         )
 
 
+class OutputSettings:
+    """Settings for an additional rendered output of a :class:`Project`."""
+
+    def __init__(self, template, output):
+        """Construct an output settings object."""
+        self.template = template
+        """Filename of the template to render."""
+
+        self.output = output
+        """Filename to write the rendered template to.
+
+        May contain ``{version}`` and ``{project_name}`` fields."""
+
+    def __repr__(self):
+        """Return a representation of this object.
+
+        >>> repr(OutputSettings('email.txt.j2', 'email-{version}.txt'))
+        "OutputSettings('email.txt.j2', 'email-{version}.txt')"
+        """
+        return "OutputSettings({}, {})".format(repr(self.template), repr(self.output))
+
+
 class ProjectSettings:
     """Settings for an entire :class:`Project`.
 
@@ -65,6 +87,9 @@ class ProjectSettings:
         insert_point_pattern=None,
         news_filename=None,
         extra_data=None,
+        version_pattern=None,
+        archive_keep=None,
+        archive_filename=None,
     ):
         """Construct a settings object."""
         self.name = project_name
@@ -81,6 +106,10 @@ class ProjectSettings:
         self.sections = []
         """List of :class:`SectionSettings` objects."""
 
+        self.outputs = []
+        """List of :class:`OutputSettings` objects, rendered in addition to
+        the changelog file."""
+
         self.base_url = base_url
         """Base URL of project management.
 
@@ -93,11 +122,32 @@ class ProjectSettings:
         """A regular expression matching the line we should insert before,
         compiled from ``insert_point_pattern``."""
 
+        if version_pattern is None:
+            # At least two numbers, so that digits in a project name such
+            # as "3D" are not taken for the version.
+            version_pattern = r"\bv?\d+(?:\.\d+)+[^\s()]*"
+        self.version_re = re.compile(version_pattern)
+        """A regular expression finding the version in a line matching the
+        insert point pattern, compiled from ``version_pattern``.
+
+        If it has a group named ``version``, that group is the version,
+        otherwise the whole match is."""
+
         if news_filename is None:
             news_filename = "CHANGELOG.md"
         self.news_filename = news_filename
         """The filename of your changelog file."""
 
+        self.archive_keep = archive_keep
+        """If not None, the number of releases to keep in the changelog file
+        after a build: older ones are moved to archive files."""
+
+        if archive_filename is None:
+            archive_filename = "changes/archive/{stem}-{year}{suffix}"
+        self.archive_filename = archive_filename
+        """Filename pattern of archive files, see
+        :func:`proclamation.archive.archive_filename`."""
+
         if extra_data is None:
             extra_data = {}
         self.extra_data = extra_data
@@ -139,6 +189,11 @@ def parse_section(section_name, section_info):
     )
 
 
+def parse_output(output_info):
+    """Parse a dictionary into an :class:`OutputSettings` object."""
+    return OutputSettings(output_info["template"], output_info["output"])
+
+
 def parse_project(proj):
     """Parse a dictionary into a :class:`ProjectSettings` object."""
     proj_settings = ProjectSettings(
@@ -148,9 +203,14 @@ def parse_project(proj):
         insert_point_pattern=proj.get("insert_point_pattern"),
         news_filename=proj.get("news_filename"),
         extra_data=proj.get("extra_data"),
+        version_pattern=proj.get("version_pattern"),
+        archive_keep=proj.get("archive_keep"),
+        archive_filename=proj.get("archive_filename"),
     )
     for section_name, section_info in proj["sections"].items():
         proj_settings.sections.append(parse_section(section_name, section_info))
+    for output_info in proj.get("outputs", []):
+        proj_settings.outputs.append(parse_output(output_info))
     return proj_settings
 
 
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Places to list and read fragment files from: the file system or archives."""
+
+import os
+import posixpath
+import threading
+from abc import ABC, abstractmethod
+from io import StringIO
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .types import (
+    Fragment,
+    Reference,
+    ReferenceParser,
+    filter_fragment_names,
+    scan_fragment_directory,
+)
+
+
+class FragmentSource(ABC):
+    """Lists and reads fragment files, for :func:`Project.populate_sections`.
+
+    Subclasses implement :func:`list_directory` and :func:`read_text`, and may
+    override :func:`parse_fragment_file`. Use as a context manager, or call
+    :func:`close` when done.
+    """
+
+    on_disk = False
+    """Whether the listed files are on the file system, so they can be
+    read later by lazy fragments."""
+
+    bytes_read = 0
+    """Bytes of fragment files read so far, for sources that count them."""
+
+    cache_hits = 0
+    """Fragment files loaded from a cache without being read, for sources
+    that count them."""
+
+    @abstractmethod
+    def list_directory(
+        self, directory, ref_parser, rejected: Optional[List[Path]] = None
+    ) -> List[Tuple[Path, Reference]]:
+        """Return the (filename, reference) pairs for a section directory.
+
+        See :func:`proclamation.types.scan_fragment_directory`.
+        """
+
+    @abstractmethod
+    def read_text(self, filename) -> str:
+        """Return the contents of a file listed by :func:`list_directory`."""
+
+    def parse_fragment_file(
+        self, filename, reference=None, ref_parser=None
+    ) -> List[Fragment]:
+        """Parse a file listed by :func:`list_directory`.
+
+        A drop-in replacement for :func:`proclamation.types.parse_fragment_file`.
+        """
+        if ref_parser is None:
+            ref_parser = ReferenceParser()
+        fragment = Fragment(
+            filename, reference, ref_parser, io=StringIO(self.read_text(filename))
+        )
+        extras = fragment.parse_file()
+        fragment.io = None
+        return [fragment] + extras
+
+    def close(self):
+        """Release any resources held."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class FileSystemSource(FragmentSource):
+    """Reads fragment files from their directories, the default source.
+
+    scanner: optional :class:`proclamation.project.DirectoryScanner` shared
+    with other projects, to avoid listing the same directory more than once.
+    cache: optional :class:`proclamation.cache.FragmentCache` to load
+    unchanged fragment files from instead of parsing them.
+    """
+
+    on_disk = True
+
+    def __init__(self, scanner=None, cache=None):
+        """Construct a source, optionally with a shared scanner and cache."""
+        self.scanner = scanner
+        self.cache = cache
+        self._lock = threading.Lock()
+        self.bytes_read = 0
+        self.cache_hits = 0
+
+    def list_directory(
+        self, directory, ref_parser, rejected: Optional[List[Path]] = None
+    ) -> List[Tuple[Path, Reference]]:
+        """List a directory, see :func:`FragmentSource.list_directory`."""
+        if self.scanner is None:
+            return scan_fragment_directory(directory, ref_parser, rejected)
+        return self.scanner.list_directory(directory, ref_parser)
+
+    def read_text(self, filename) -> str:
+        """Read a file."""
+        with open(str(filename), encoding="utf-8") as fp:
+            return fp.read()
+
+    def parse_fragment_file(
+        self, filename, reference=None, ref_parser=None
+    ) -> List[Fragment]:
+        """Parse a file from disk, using the cache if there is one."""
+        if self.cache is None:
+            with open(str(filename), "rb") as fp:
+                data = fp.read()
+            # newline=None gives the same newline handling as open()
+            io = StringIO(data.decode("utf-8"), newline=None)
+            fragment = Fragment(filename, reference, ref_parser, io=io)
+            fragments = [fragment] + fragment.parse_file()
+            fragment.io = None
+            nbytes = len(data)
+        else:
+            fragments, nbytes = self.cache.read_fragment_file(
+                filename, reference, ref_parser
+            )
+        with self._lock:
+            self.bytes_read += nbytes
+            if not nbytes and self.cache is not None:
+                self.cache_hits += 1
+        return fragments
+
+
+def _normalize_member_name(name: str) -> str:
+    """Turn an archive member name into a plain relative path.
+
+    >>> _normalize_member_name("./changes/main/pr.1.md")
+    'changes/main/pr.1.md'
+    """
+    return posixpath.normpath(name.lstrip("/"))
+
+
+class ArchiveSource(FragmentSource):
+    """Reads fragment files from an archive, without extracting it.
+
+    Section directories are looked up in the archive at their path relative
+    to base, so make the archive from the directory containing the config
+    file, e.g. with ``tar -cf changes.tar changes/``. The fragment files keep
+    their names as if extracted in base.
+    """
+
+    def __init__(self, base=None):
+        """Construct a source for member paths relative to base."""
+        self.base = Path(base or ".").resolve()
+        self._members: Dict[str, Dict[str, object]] = {}
+        """Maps directory to file name to member, for each regular file."""
+
+    def _add_member(self, name: str, member):
+        directory, _, filename = _normalize_member_name(name).rpartition("/")
+        self._members.setdefault(directory or ".", {})[filename] = member
+
+    def _member(self, filename):
+        filename = Path(filename)
+        relative = os.path.relpath(str(filename.parent), str(self.base))
+        return self._members[Path(relative).as_posix()][filename.name]
+
+    def list_directory(
+        self, directory, ref_parser, rejected: Optional[List[Path]] = None
+    ) -> List[Tuple[Path, Reference]]:
+        """List a directory of the archive, see
+        :func:`FragmentSource.list_directory`."""
+        directory = Path(directory).resolve()
+        relative = os.path.relpath(str(directory), str(self.base))
+        names = self._members.get(Path(relative).as_posix(), {})
+        return filter_fragment_names(directory, names, ref_parser, rejected)
+
+
+def _open_tar_stream(fp, name: str):
+    import tarfile
+
+    if name.endswith((".zst", ".tzst")) and "zst" not in tarfile.TarFile.OPEN_METH:
+        # tarfile only reads Zstandard itself starting with Python 3.14.
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError(
+                f"Reading {name} needs Python 3.14 or the zstandard package"
+            ) from None
+        return tarfile.open(
+            fileobj=zstandard.ZstdDecompressor().stream_reader(fp), mode="r|"
+        )
+    return tarfile.open(fileobj=fp, mode="r|*")
+
+
+class TarSource(ArchiveSource):
+    """Reads fragment files from a (possibly compressed) tar archive.
+
+    The archive is read in a single sequential pass when opened, keeping the
+    contents of its regular files in memory: fragment bundles are many tiny
+    files, so this is much faster than extracting them.
+    """
+
+    def __init__(self, filename, base=None):
+        """Read a tar archive, for member paths relative to base."""
+        super().__init__(base)
+        self.filename = Path(filename)
+        with open(str(self.filename), "rb") as fp:
+            with _open_tar_stream(fp, self.filename.name) as tar:
+                for member in tar:
+                    if member.isfile():
+                        self._add_member(member.name, tar.extractfile(member).read())
+
+    def read_text(self, filename) -> str:
+        """Return the contents of a member."""
+        return self._member(filename).decode("utf-8")
+
+
+class ZipSource(ArchiveSource):
+    """Reads fragment files from a zip archive, on demand."""
+
+    def __init__(self, filename, base=None):
+        """Open a zip archive, for member paths relative to base."""
+        super().__init__(base)
+        self.filename = Path(filename)
+        import zipfile
+
+        self._zip = zipfile.ZipFile(str(self.filename))
+        self._lock = threading.Lock()
+        for info in self._zip.infolist():
+            if not info.is_dir():
+                self._add_member(info.filename, info)
+
+    def read_text(self, filename) -> str:
+        """Return the contents of a member."""
+        info = self._member(filename)
+        with self._lock:
+            return self._zip.read(info).decode("utf-8")
+
+    def close(self):
+        """Close the archive."""
+        self._zip.close()
+
+
+def open_archive(filename, base=None) -> ArchiveSource:
+    """Open a tar or zip archive of fragment files as a source.
+
+    The format is detected from the contents, except for Zstandard
+    compressed tar archives, which need a ``.zst`` or ``.tzst`` suffix.
+    Raises RuntimeError if the archive cannot be read.
+    """
+    # Only imported when needed, to keep startup fast.
+    import tarfile
+    import zipfile
+
+    filename = Path(filename)
+    try:
+        if zipfile.is_zipfile(str(filename)):
+            return ZipSource(filename, base)
+        return TarSource(filename, base)
+    except (tarfile.TarError, zipfile.BadZipFile) as e:
+        raise RuntimeError(f"Cannot read archive {filename}: {e}") from e
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+from pathlib import Path
+
+from ..archive import archive_releases
+from ..history import HeadingIndex
+from ..settings import ProjectSettings
+
+CHANGELOG = """# Changelog
+
+## Proj 2.0.0 (2021-03-01)
+
+- Third
+
+## Proj 1.1.0 (2020-06-01)
+
+- Second
+
+## Proj 1.0.0 (2020-01-01)
+
+- First"""
+
+
+def _settings(dirname, **kwargs):
+    base = Path(dirname)
+    return ProjectSettings(
+        "Proj",
+        news_filename=str(base / "CHANGELOG.md"),
+        archive_filename=str(base / "archive" / "{stem}-{year}{suffix}"),
+        **kwargs,
+    )
+
+
+def test_archive_by_year():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = _settings(dirname)
+        news = Path(settings.news_filename)
+        news.write_text(CHANGELOG, encoding="utf-8")
+        index = HeadingIndex.scan(settings)
+
+        archived = archive_releases(settings, 2, index)
+        archive_2020 = Path(dirname) / "archive" / "CHANGELOG-2020.md"
+        assert archived == {archive_2020: 1}
+        assert news.read_text(encoding="utf-8") == CHANGELOG.split("## Proj 1.0.0")[0]
+        assert index.headings == HeadingIndex.scan(settings).headings
+        assert archive_2020.read_text(encoding="utf-8") == (
+            "# Changelog archive\n\n## Proj 1.0.0 (2020-01-01)\n\n- First\n\n"
+        )
+
+        # Newer releases go before older ones in an existing archive
+        archived = archive_releases(settings, 0, index)
+        assert archived == {
+            Path(dirname) / "archive" / "CHANGELOG-2021.md": 1,
+            archive_2020: 1,
+        }
+        assert news.read_text(encoding="utf-8") == "# Changelog\n\n"
+        contents = archive_2020.read_text(encoding="utf-8")
+        assert contents.index("1.1.0") < contents.index("1.0.0")
+
+
+def test_archive_by_major_version():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = _settings(dirname)
+        settings.archive_filename = str(Path(dirname) / "v{major}.md")
+        Path(settings.news_filename).write_text(CHANGELOG, encoding="utf-8")
+        assert archive_releases(settings, 5) == {}
+        archived = archive_releases(settings, 0)
+        assert archived == {
+            Path(dirname) / "v2.md": 1,
+            Path(dirname) / "v1.md": 2,
+        }
+
+
+def test_footer_stays_in_changelog():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = _settings(dirname)
+        news = Path(settings.news_filename)
+        footer = (
+            "[1.0.0]: https://example.com/1.0.0\n[1.1.0]: https://example.com/1.1.0\n"
+        )
+        news.write_text(CHANGELOG + "\n\n" + footer, encoding="utf-8")
+
+        archive_releases(settings, 1)
+        assert news.read_text(encoding="utf-8") == (
+            CHANGELOG.split("## Proj 1.1.0")[0] + footer
+        )
+        contents = (Path(dirname) / "archive" / "CHANGELOG-2020.md").read_text(
+            encoding="utf-8"
+        )
+        assert "https://" not in contents
+        assert contents.endswith("- First\n\n")
+
+
+def test_interrupted_archive_is_not_duplicated():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = _settings(dirname)
+        news = Path(settings.news_filename)
+        news.write_text(CHANGELOG, encoding="utf-8")
+        archive_2020 = Path(dirname) / "archive" / "CHANGELOG-2020.md"
+        archive_releases(settings, 1)
+        archived = archive_2020.read_text(encoding="utf-8")
+
+        # As if the changelog was not truncated after writing the archive.
+        news.write_text(CHANGELOG, encoding="utf-8")
+        assert archive_releases(settings, 1) == {archive_2020: 2}
+        assert archive_2020.read_text(encoding="utf-8") == archived
+        assert news.read_text(encoding="utf-8") == CHANGELOG.split("## Proj 1.1.0")[0]
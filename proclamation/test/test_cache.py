@@ -0,0 +1,107 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from ..cache import FragmentCache
+from ..sources import FileSystemSource
+from ..types import ReferenceParser
+
+FRAGMENT = """---
+- author.someone
+- issue.12
+- mr.23
+---
+This is content.
+"""
+
+AN_HOUR_AGO = time.time() - 3600
+
+
+def _write(fn, contents):
+    with open(str(fn), "w", encoding="utf-8") as fp:
+        fp.write(contents)
+    os.utime(str(fn), (AN_HOUR_AGO, AN_HOUR_AGO))
+
+
+def _parse(cache, fn):
+    parser = ReferenceParser()
+    return cache.parse_fragment_file(fn, parser.parse(fn.name), parser)
+
+
+def test_cache_roundtrip():
+    with tempfile.TemporaryDirectory() as dirname:
+        fn = Path(dirname) / "pr.5.md"
+        _write(fn, FRAGMENT)
+        cache_dir = Path(dirname) / "cache"
+
+        cache = FragmentCache(cache_dir)
+        (fragment,) = _parse(cache, fn)
+        assert cache.misses == 1
+        cache.save()
+        assert (cache_dir / ".gitignore").exists()
+
+        cache = FragmentCache(cache_dir)
+        (cached,) = _parse(cache, fn)
+        assert cache.hits == 1
+        assert cache.misses == 0
+        assert cached.text == fragment.text
+        assert cached.authors == ["someone"]
+        assert cached.issue == 12
+        assert [r.as_tuple() for r in cached.refs] == [
+            r.as_tuple() for r in fragment.refs
+        ]
+
+
+def test_cache_detects_changes_and_evicts():
+    with tempfile.TemporaryDirectory() as dirname:
+        fn = Path(dirname) / "pr.5.md"
+        _write(fn, FRAGMENT)
+        cache_dir = Path(dirname) / "cache"
+        cache = FragmentCache(cache_dir)
+        _parse(cache, fn)
+        cache.save()
+
+        # Same size, different contents, and a new mtime
+        _write(fn, FRAGMENT.replace("content", "CONTENT"))
+        os.utime(str(fn), (AN_HOUR_AGO + 5, AN_HOUR_AGO + 5))
+        cache = FragmentCache(cache_dir)
+        (fragment,) = _parse(cache, fn)
+        assert cache.misses == 1
+        assert "CONTENT" in fragment.text
+
+        # Touched, but unchanged: verified by hash rather than parsed
+        os.utime(str(fn), (AN_HOUR_AGO + 10, AN_HOUR_AGO + 10))
+        (fragment,) = _parse(cache, fn)
+        assert cache.verified == 1
+        assert "CONTENT" in fragment.text
+
+        fn.unlink()
+        assert cache.evict_missing() == 1
+
+
+def test_source_counts_bytes_read_and_cache_hits():
+    with tempfile.TemporaryDirectory() as dirname:
+        fn = Path(dirname) / "pr.5.md"
+        _write(fn, FRAGMENT)
+        cache_dir = Path(dirname) / "cache"
+        parser = ReferenceParser()
+
+        source = FileSystemSource()
+        source.parse_fragment_file(fn, parser.parse(fn.name), parser)
+        assert (source.bytes_read, source.cache_hits) == (len(FRAGMENT), 0)
+
+        cache = FragmentCache(cache_dir)
+        source = FileSystemSource(cache=cache)
+        source.parse_fragment_file(fn, parser.parse(fn.name), parser)
+        assert (source.bytes_read, source.cache_hits) == (len(FRAGMENT), 0)
+        cache.save()
+
+        source = FileSystemSource(cache=FragmentCache(cache_dir))
+        source.parse_fragment_file(fn, parser.parse(fn.name), parser)
+        assert (source.bytes_read, source.cache_hits) == (0, 1)
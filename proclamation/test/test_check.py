@@ -0,0 +1,99 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ..check import check_fragment_file, check_project
+from ..project import Project
+from ..settings import ProjectSettings, SectionSettings
+from ..types import parse_fragment_file
+
+
+def _problems(dirname, name, contents):
+    fn = Path(dirname) / name
+    fn.write_text(contents, encoding="utf-8")
+    return [(p.line, p.message) for p in check_fragment_file(fn)]
+
+
+def test_valid_fragment():
+    with tempfile.TemporaryDirectory() as dirname:
+        contents = "---\n# comment\n- issue.3\n- author.someone\n---\nText\n"
+        assert _problems(dirname, "pr.1.md", contents) == []
+
+
+def test_collects_all_problems():
+    with tempfile.TemporaryDirectory() as dirname:
+        contents = "---\n- pr.1\n- prr.2\n- issue.x\nnonsense\n- mr.3\n- mr.3\n---\n\n"
+        assert _problems(dirname, "pr.1.md", contents) == [
+            (2, "duplicate reference 'pr.1', already in the file name"),
+            (3, "unknown reference type 'prr'"),
+            (4, "issue reference 'issue.x' is not a number"),
+            (5, "cannot parse 'nonsense' as a reference"),
+            (7, "duplicate reference 'mr.3', already on line 6"),
+            (None, "empty fragment body"),
+        ]
+
+
+def test_unclosed_front_matter():
+    with tempfile.TemporaryDirectory() as dirname:
+        assert _problems(dirname, "pr.1.md", "---\n- mr.2\nSome text\n") == [
+            (3, "cannot parse 'Some text' as a reference"),
+            (1, "front matter is not closed by '---'"),
+            (None, "empty fragment body"),
+        ]
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "Text\n",
+        "",
+        " \n\n",
+        "---\n- mr.2\n---\n",
+        "---\n- mr.2\n---\nText \u2028 more\n",
+        "---\n- mr.2\nnonsense\n---\nText\n",
+        "---\r\n- mr.2\r\n---\r\nText\r\n",
+    ],
+)
+def test_check_agrees_with_parsing(contents):
+    with tempfile.TemporaryDirectory() as dirname:
+        fn = Path(dirname) / "pr.1.md"
+        fn.write_text(contents, encoding="utf-8", newline="")
+        try:
+            parse_fragment_file(fn)
+            parsed = True
+        except RuntimeError:
+            parsed = False
+        assert parsed == (check_fragment_file(fn) == [])
+
+
+def test_check_project():
+    with tempfile.TemporaryDirectory() as dirname:
+        base = Path(dirname)
+        (base / "main").mkdir()
+        for i in range(10):
+            (base / "main" / f"pr.{i}.md").write_text(
+                "Text\n" if i % 3 else "", encoding="utf-8"
+            )
+        (base / "main" / "pr-10.md").write_text("Misnamed\n", encoding="utf-8")
+        settings = ProjectSettings("Test")
+        settings.sections.append(SectionSettings("Main", "main"))
+        settings.sections.append(SectionSettings("Missing", "missing"))
+        project = Project(settings, default_base=base)
+
+        checked, serial = check_project(project)
+        assert checked == 10
+        assert [(p.filename.name, p.message) for p in serial] == [
+            ("pr-10.md", "file name is not a valid reference, so it is ignored"),
+            ("missing", "directory of section 'Missing' does not exist"),
+            ("pr.0.md", "empty fragment body"),
+            ("pr.3.md", "empty fragment body"),
+            ("pr.6.md", "empty fragment body"),
+            ("pr.9.md", "empty fragment body"),
+        ]
+        assert check_project(project, jobs=4) == (checked, serial)
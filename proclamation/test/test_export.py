@@ -0,0 +1,87 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from ..export import export, iter_records
+from ..project import Project
+from ..settings import ProjectSettings, SectionSettings
+
+
+def _make_project(dirname):
+    base = Path(dirname)
+    for section in ("features", "fixes"):
+        (base / section).mkdir()
+    (base / "features" / "pr.10.md").write_text(
+        "---\n- issue.3\n- author.someone\n---\nUI: Tenth\n", encoding="utf-8"
+    )
+    (base / "features" / "pr.9.md").write_text("Ninth\n", encoding="utf-8")
+    settings = ProjectSettings("Test")
+    settings.sections.append(SectionSettings("Features", "features"))
+    settings.sections.append(SectionSettings("Fixes", "fixes"))
+    return Project(settings, default_base=base)
+
+
+def test_ndjson():
+    with tempfile.TemporaryDirectory() as dirname:
+        project = _make_project(dirname)
+        out = StringIO()
+        export(out, [project], "ndjson")
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [r["type"] for r in records] == [
+            "project",
+            "section",
+            "fragment",
+            "fragment",
+            "section",
+        ]
+        ninth, tenth = records[2:4]
+        assert Path(ninth["filename"]).name == "pr.9.md"
+        assert ninth["issue"] is None
+        assert tenth["section"] == "Features"
+        assert tenth["text"] == "UI: Tenth"
+        assert tenth["prefix"] == "UI"
+        assert tenth["authors"] == ["someone"]
+        assert tenth["issue"] == 3
+        assert tenth["refs"][0]["ref"] == "pr.10"
+
+
+def test_json_matches_records():
+    with tempfile.TemporaryDirectory() as dirname:
+        project = _make_project(dirname)
+        out = StringIO()
+        export(out, [project, project], "json")
+        data = json.loads(out.getvalue())
+        assert len(data["projects"]) == 2
+        sections = data["projects"][1]["sections"]
+        assert [s["name"] for s in sections] == ["Features", "Fixes"]
+        assert sections[1]["fragments"] == []
+        fragments = [r for r in iter_records([project]) if r["type"] == "fragment"]
+        assert [f["text"] for f in sections[0]["fragments"]] == [
+            f["text"] for f in fragments
+        ]
+        assert "type" not in sections[0]["fragments"][0]
+
+        out = StringIO()
+        export(out, [], "json")
+        assert json.loads(out.getvalue()) == {"projects": []}
+
+
+def test_populated_matches_files():
+    with tempfile.TemporaryDirectory() as dirname:
+        project = _make_project(dirname)
+        (Path(dirname) / "features" / "pr.11.md").write_text(
+            "A: Eleventh\n", encoding="utf-8"
+        )
+        project.settings.sections[0].sort_by_prefix = True
+        project = Project(project.settings, default_base=Path(dirname))
+        expected = list(iter_records([project]))
+        project.populate_sections()
+        # Rendered in prefix order, but exported in reference order.
+        assert [f.text for f in project.sections[0].fragments][0] == "A: Eleventh"
+        assert list(iter_records([project], populated=True)) == expected
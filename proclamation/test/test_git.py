@@ -0,0 +1,120 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ..git import BlobReader, GitError, GitTreeSource, changed_files
+from ..types import ReferenceParser
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+        + list(args),
+        cwd=str(repo),
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def _write(repo, name, text="Change\n"):
+    fn = Path(repo) / name
+    fn.parent.mkdir(parents=True, exist_ok=True)
+    fn.write_text(text, encoding="utf-8")
+
+
+def test_changed_files():
+    with tempfile.TemporaryDirectory() as dirname:
+        repo = Path(dirname).resolve()
+        _git(repo, "init", "-q")
+        _write(repo, "changes/main/pr.1.md")
+        _write(repo, "changes/main/pr.2.md")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "base")
+        _git(repo, "tag", "base")
+
+        _write(repo, "changes/main/pr.2.md", "Modified\n")
+        _write(repo, "changes/main/pr.3.md")
+        _write(repo, "changes/main/pr.4.md")
+        (repo / "changes/main/pr.1.md").unlink()
+        _git(repo, "add", "changes/main/pr.3.md")
+        _git(repo, "commit", "-q", "-m", "change")
+        # Staged but not committed: included. Untracked: not included.
+        _git(repo, "add", "changes/main/pr.4.md")
+        _write(repo, "changes/main/pr.5.md")
+
+        assert sorted(changed_files("base", repo / "changes")) == [
+            repo / "changes/main/pr.2.md",
+            repo / "changes/main/pr.3.md",
+            repo / "changes/main/pr.4.md",
+        ]
+        with pytest.raises(GitError, match="git diff failed"):
+            changed_files("no-such-ref", repo)
+
+
+def _fragments_repo(repo):
+    _git(repo, "init", "-q")
+    _write(repo, "changes/main/pr.1.md", "---\n- author.someone\n---\nFirst\n")
+    _write(repo, "changes/main/pr.2.md", "Second\n")
+    _write(repo, "changes/main/README.md", "Not a fragment\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "tag", "base")
+    _write(repo, "changes/main/pr.3.md", "Third\n")
+    _write(repo, "changes/main/pr.2.md", "Second, reworded\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "change")
+
+
+def _texts(source, directory):
+    parser = ReferenceParser()
+    return [
+        fragment.text
+        for filename, ref in source.list_directory(directory, parser)
+        for fragment in source.parse_fragment_file(filename, ref, parser)
+    ]
+
+
+def test_git_tree_source():
+    with tempfile.TemporaryDirectory() as dirname:
+        repo = Path(dirname).resolve() / "work"
+        repo.mkdir()
+        _fragments_repo(repo)
+        # Not checked out: only the committed contents are read.
+        _write(repo, "changes/main/pr.1.md", "Uncommitted\n")
+        main_dir = repo / "changes/main"
+
+        with GitTreeSource("base", repo) as source:
+            assert _texts(source, main_dir) == ["First", "Second"]
+        with GitTreeSource("HEAD", repo) as source:
+            assert _texts(source, main_dir) == ["First", "Second, reworded", "Third"]
+            (fragment,) = source.parse_fragment_file(main_dir / "pr.1.md")
+            assert fragment.authors == ["someone"]
+            assert fragment.filename == main_dir / "pr.1.md"
+        with GitTreeSource("HEAD", repo / "changes", since="base") as source:
+            assert _texts(source, main_dir) == ["Second, reworded", "Third"]
+        with GitTreeSource("HEAD", repo) as source:
+            with pytest.raises(FileNotFoundError, match="changes/other"):
+                source.list_directory(repo / "changes/other", ReferenceParser())
+
+        bare = Path(dirname).resolve() / "bare.git"
+        _git(dirname, "clone", "-q", "--bare", str(repo), str(bare))
+        with GitTreeSource("HEAD", bare) as source:
+            assert _texts(source, bare / "changes/main") == [
+                "First",
+                "Second, reworded",
+                "Third",
+            ]
+
+        with BlobReader(bare) as reader:
+            with pytest.raises(GitError, match="could not read blob"):
+                reader.read("0" * 40)
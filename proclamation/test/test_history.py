@@ -0,0 +1,163 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ..history import HeadingIndex, get_heading_index, index_filename
+from ..project import Project
+from ..render import write_updated_changelog
+from ..settings import ProjectSettings
+
+CHANGELOG = """# Changelog
+
+Some introduction.
+
+## Proj v2.0.0 (2020-02-02)
+
+- Second release
+
+## Proj 1.1.0-rc1 (2020-01-15)
+
+- Release candidate
+
+## Proj 1.0.0 (2020-01-01)
+
+- First release
+"""
+
+
+def _settings(dirname):
+    return ProjectSettings("Proj", news_filename=str(Path(dirname) / "CHANGELOG.md"))
+
+
+def _write_changelog(settings, contents=CHANGELOG):
+    with open(settings.news_filename, "w", encoding="utf-8", newline="") as fp:
+        fp.write(contents)
+
+
+def test_scan_and_show():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = _settings(dirname)
+        _write_changelog(settings)
+        index = HeadingIndex.scan(settings)
+        assert [h.version for h in index.headings] == ["v2.0.0", "1.1.0-rc1", "1.0.0"]
+        assert index.find_version("2.0.0") == 0
+        assert index.find_version("v1.0.0") == 2
+        assert index.find_version("3.0.0") is None
+        assert index.read_release(1) == (
+            "## Proj 1.1.0-rc1 (2020-01-15)\n\n- Release candidate\n\n"
+        )
+        assert index.read_release(2).endswith("- First release\n")
+
+        assert index.is_duplicate("## Proj 1.0.0 (2021-01-01)")
+        assert index.is_duplicate("## Proj v2.0.0 (2020-02-02)")
+        assert not index.is_duplicate("## Proj 1.0.1 (2021-01-01)")
+        # A leading "v" does not make a version new, either way.
+        assert index.is_duplicate("## Proj v1.0.0 (2021-01-01)")
+        assert index.is_duplicate("## Proj 2.0.0 (2021-01-01)")
+
+
+def test_crlf_offsets():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = _settings(dirname)
+        _write_changelog(settings, CHANGELOG.replace("\n", "\r\n"))
+        index = HeadingIndex.scan(settings)
+        assert index.read_release(2).startswith("## Proj 1.0.0")
+
+
+def test_version_group():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = ProjectSettings(
+            "Proj",
+            news_filename=str(Path(dirname) / "CHANGELOG.md"),
+            version_pattern=r"Proj (?P<version>\S+)",
+        )
+        _write_changelog(settings)
+        index = HeadingIndex.scan(settings)
+        assert [h.version for h in index.headings] == ["v2.0.0", "1.1.0-rc1", "1.0.0"]
+
+
+def test_digits_in_project_name():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = ProjectSettings(
+            "Project 3D", news_filename=str(Path(dirname) / "CHANGELOG.md")
+        )
+        _write_changelog(
+            settings,
+            "# Changelog\n\n## Project 3D 1.0 (2020-01-01)\n\n- First release\n",
+        )
+        index = HeadingIndex.scan(settings)
+        assert [h.version for h in index.headings] == ["1.0"]
+        assert index.find_version("3D") is None
+        assert not index.is_duplicate("## Project 3D 1.1 (2021-01-01)")
+        assert index.is_duplicate("## Project 3D 1.0 (2021-01-01)")
+
+
+def test_persisted_index():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = _settings(dirname)
+        cache_dir = Path(dirname) / "cache"
+        cache_dir.mkdir()
+        _write_changelog(settings)
+        index = get_heading_index(settings, cache_dir)
+        assert index_filename(cache_dir, settings.news_filename).exists()
+
+        loaded = HeadingIndex.load(settings, cache_dir)
+        assert loaded is not None
+        assert loaded.headings == index.headings
+
+        # A changed file invalidates the saved index
+        _write_changelog(settings, CHANGELOG + "\n## Proj 0.1.0\n")
+        assert HeadingIndex.load(settings, cache_dir) is None
+        assert len(get_heading_index(settings, cache_dir).headings) == 4
+
+
+def test_index_saved_only_with_cache(monkeypatch):
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = _settings(dirname)
+        _write_changelog(settings)
+        get_heading_index(settings)
+        # Nothing is written next to the changelog without a cache directory.
+        assert sorted(p.name for p in Path(dirname).iterdir()) == ["CHANGELOG.md"]
+
+        cache_dir = Path(dirname) / "cache"
+        cache_dir.mkdir()
+        index = get_heading_index(settings, cache_dir)
+
+        def scan(cls, project_settings):
+            raise AssertionError("the saved index should be used")
+
+        with monkeypatch.context() as m:
+            m.setattr(HeadingIndex, "scan", classmethod(scan))
+            assert get_heading_index(settings, cache_dir).headings == index.headings
+
+        # The index kept up to date by a build is saved for the next one.
+        project = Project(settings, default_base=dirname)
+        write_updated_changelog(project, "3.0.0", "2021-01-01", index)
+        index.save(cache_dir)
+        monkeypatch.setattr(HeadingIndex, "scan", classmethod(scan))
+        assert get_heading_index(settings, cache_dir).find_version("3.0.0") == 0
+
+
+def test_update_after_build():
+    with tempfile.TemporaryDirectory() as dirname:
+        settings = _settings(dirname)
+        _write_changelog(settings)
+        project = Project(settings, default_base=dirname)
+        index = HeadingIndex.scan(settings)
+
+        write_updated_changelog(project, "3.0.0", "2021-01-01", index)
+        assert index.headings == HeadingIndex.scan(settings).headings
+        assert index.find_version("3.0.0") == 0
+        assert index.read_release(1).startswith("## Proj v2.0.0")
+
+        # Not the most recent release, but still a duplicate
+        contents = Path(settings.news_filename).read_bytes()
+        with pytest.raises(RuntimeError):
+            write_updated_changelog(project, "1.0.0", "2021-02-01", index)
+        assert Path(settings.news_filename).read_bytes() == contents
@@ -3,12 +3,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import io
+import shutil
+import subprocess
+import tarfile
 import tempfile
 from pathlib import Path
 import json
 import pytest
+from click.testing import CliRunner
 
-from ..main import ProjectCollection
+from ..main import ProjectCollection, cli
 from .test_settings import PROJECT, PROJ_NAME
 
 
@@ -39,3 +44,281 @@ def test_missing_project():
         fn = create_config_file(dirname, PROJECT)
         with pytest.raises(Exception):
             _ = ProjectCollection(fn, "Incorrect Project", dirname)
+
+
+BUILD_PROJECT = {
+    "project_name": PROJ_NAME,
+    "base_url": "https://example.com/project",
+    "sections": {"main section": {"directory": "changes/main"}},
+}
+
+
+def _write_fragment(fn, text):
+    with open(str(fn), "w", encoding="utf-8") as fp:
+        fp.write(text)
+
+
+@pytest.fixture
+def build_project(monkeypatch):
+    """Change to a temporary directory containing a config file for
+    BUILD_PROJECT and its empty fragment directory.
+
+    Yields a CliRunner and the fragment directory.
+    """
+    with tempfile.TemporaryDirectory() as dirname:
+        monkeypatch.chdir(dirname)
+        create_config_file(".", BUILD_PROJECT)
+        main_dir = Path("changes/main")
+        main_dir.mkdir(parents=True)
+        yield CliRunner(), main_dir
+
+
+def test_build_manifest_and_remove(build_project):
+    runner, main_dir = build_project
+    _write_fragment(main_dir / "pr.1.md", "First change\n")
+    _write_fragment(main_dir / "pr.2.md", "Second change\n")
+
+    result = runner.invoke(
+        cli, ["build", "1.0", "--keep-fragments", "--manifest", "manifest.txt"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "First change" in Path("CHANGELOG.md").read_text(encoding="utf-8")
+    manifest = Path("manifest.txt").read_text(encoding="utf-8").splitlines()
+    assert [Path(line).name for line in manifest] == ["pr.1.md", "pr.2.md"]
+
+    # Arrived after the build: must not be removed
+    _write_fragment(main_dir / "pr.3.md", "Late change\n")
+    result = runner.invoke(
+        cli, ["remove-fragments", "--yes", "--manifest", "manifest.txt"]
+    )
+    assert result.exit_code == 0, result.output
+    assert sorted(p.name for p in main_dir.iterdir()) == ["pr.3.md"]
+
+
+def test_build_removes_consumed_fragments(build_project):
+    runner, main_dir = build_project
+    _write_fragment(main_dir / "pr.1.md", "First change\n")
+
+    result = runner.invoke(cli, ["build", "1.0"])
+    assert result.exit_code == 0, result.output
+    assert list(main_dir.iterdir()) == []
+
+
+def test_remove_fragments_does_not_parse(build_project):
+    runner, main_dir = build_project
+    # Invalid front matter would fail if this were parsed
+    _write_fragment(main_dir / "pr.1.md", "---\nnot a ref\n---\nText\n")
+
+    result = runner.invoke(cli, ["remove-fragments", "--yes"])
+    assert result.exit_code == 0, result.output
+    assert list(main_dir.iterdir()) == []
+
+
+def test_show(build_project):
+    runner, main_dir = build_project
+    _write_fragment(main_dir / "pr.1.md", "First change\n")
+    result = runner.invoke(cli, ["--cache", "build", "1.0", "--date", "2020"])
+    assert result.exit_code == 0, result.output
+    _write_fragment(main_dir / "pr.2.md", "Second change\n")
+    result = runner.invoke(cli, ["--cache", "build", "1.1", "--date", "2021"])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(cli, ["show", "v1.0"])
+    assert result.exit_code == 0, result.output
+    assert "First change" in result.output
+    assert "Second change" not in result.output
+
+    _write_fragment(main_dir / "pr.3.md", "Third change\n")
+    result = runner.invoke(cli, ["--cache", "build", "1.0", "--date", "2022"])
+    assert result.exit_code != 0
+    assert "Third change" not in Path("CHANGELOG.md").read_text(encoding="utf-8")
+
+    result = runner.invoke(cli, ["show", "2.0"])
+    assert result.exit_code != 0
+
+
+def test_build_archives(build_project):
+    runner, main_dir = build_project
+    create_config_file(".", dict(BUILD_PROJECT, archive_keep=1))
+    for i, year in enumerate(("2020", "2021")):
+        _write_fragment(main_dir / f"pr.{i}.md", f"Change {i}\n")
+        result = runner.invoke(cli, ["build", f"1.{i}", "--date", f"{year}-01-01"])
+        assert result.exit_code == 0, result.output
+
+    changelog = Path("CHANGELOG.md").read_text(encoding="utf-8")
+    assert "Change 1" in changelog
+    assert "Change 0" not in changelog
+    archive = Path("changes/archive/CHANGELOG-2020.md")
+    assert "Change 0" in archive.read_text(encoding="utf-8")
+
+    result = runner.invoke(cli, ["archive", "--keep", "0"])
+    assert result.exit_code == 0, result.output
+    assert "CHANGELOG-2021.md" in result.output
+
+
+def test_export(caplog, build_project):
+    runner, main_dir = build_project
+    _write_fragment(main_dir / "pr.1.md", "First change\n")
+
+    result = runner.invoke(cli, ["export", "--format", "ndjson"])
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert records[-1]["text"] == "First change"
+
+    result = runner.invoke(cli, ["export", "-o", "out.json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(Path("out.json").read_text(encoding="utf-8"))
+    assert data["projects"][0]["name"] == PROJ_NAME
+
+    main_dir.rename("elsewhere")
+    result = runner.invoke(cli, ["export", "-o", "out.json"])
+    assert result.exit_code == 0, result.output
+    assert f"Skipping project '{PROJ_NAME}'" in caplog.text
+    data = json.loads(Path("out.json").read_text(encoding="utf-8"))
+    assert data == {"projects": []}
+
+
+def test_profile(build_project):
+    runner, main_dir = build_project
+    _write_fragment(main_dir / "pr.1.md", "First change\n")
+    result = runner.invoke(
+        cli,
+        [
+            "--cache",
+            "--profile-cprofile",
+            "run.prof",
+            "--profile-trace",
+            "trace.json",
+            "build",
+            "1.0",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    # stderr is mixed into the output by default
+    (line,) = [
+        line
+        for line in result.output.splitlines()
+        if line.startswith('{"proclamation_profile"')
+    ]
+    profile = json.loads(line)["proclamation_profile"]
+    phases = {(e["phase"], e["project"]): e for e in profile["phases"]}
+    assert phases[("parse", PROJ_NAME)]["files"] == 1
+    assert phases[("parse", PROJ_NAME)]["bytes"] == len("First change\n")
+    assert phases[("parse", PROJ_NAME)]["cached"] == 0
+    assert phases[("remove", None)]["files"] == 1
+    assert ("settings", None) in phases
+    # Saved before the report is written, whatever the version of click.
+    assert ("save cache", None) in phases
+    assert Path("run.prof").stat().st_size > 0
+    assert json.loads(Path("trace.json").read_text(encoding="utf-8"))
+
+
+def test_check(build_project):
+    runner, main_dir = build_project
+    _write_fragment(main_dir / "pr.1.md", "First change\n")
+    result = runner.invoke(cli, ["check"])
+    assert result.exit_code == 0, result.output
+    assert "Checked 1 fragment files: 0 problem(s)" in result.output
+
+    _write_fragment(main_dir / "pr.2.md", "---\n- bug.3\n---\n")
+    result = runner.invoke(cli, ["--jobs", "2", "check"])
+    assert result.exit_code == 1
+    lines = result.output.splitlines()
+    fn = (main_dir / "pr.2.md").resolve()
+    assert f"{fn}:2: unknown reference type 'bug'" in lines
+    assert f"{fn}: empty fragment body" in lines
+    assert "Checked 2 fragment files: 2 problem(s) in 1 file(s)" in lines
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+def test_check_and_draft_since(build_project):
+    runner, main_dir = build_project
+    _write_fragment(main_dir / "pr.1.md", "")
+    git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+    subprocess.run(git + ["init", "-q"], check=True)
+    subprocess.run(git + ["add", "."], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "base"], check=True)
+    _write_fragment(main_dir / "pr.2.md", "Second change\n")
+    subprocess.run(git + ["add", "."], check=True)
+
+    result = runner.invoke(cli, ["check"])
+    assert result.exit_code == 1
+    result = runner.invoke(cli, ["check", "--since", "HEAD"])
+    assert result.exit_code == 0, result.output
+    assert "Checked 1 fragment files: 0 problem(s)" in result.output
+
+    result = runner.invoke(cli, ["draft", "--since", "HEAD"])
+    assert result.exit_code == 0, result.output
+    assert "Second change" in result.output
+    assert "pr.1" not in result.output
+
+    result = runner.invoke(cli, ["check", "--since", "no-such-ref"])
+    assert result.exit_code == 2
+    assert "git diff failed" in result.output
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+def test_draft_tree(monkeypatch):
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as dirname:
+        monkeypatch.chdir(dirname)
+        work = Path("work")
+        main_dir = work / "changes/main"
+        main_dir.mkdir(parents=True)
+        create_config_file(str(work), BUILD_PROJECT)
+        _write_fragment(main_dir / "pr.1.md", "First change\n")
+        git = ["git", "-C", str(work), "-c", "user.name=T", "-c", "user.email=t@e"]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "base"], check=True)
+        subprocess.run(git + ["tag", "base"], check=True)
+        _write_fragment(main_dir / "pr.2.md", "Second change\n")
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "change"], check=True)
+        subprocess.run(["git", "clone", "-q", "--bare", "work", "bare.git"], check=True)
+
+        args = ["-c", "work/.proclamation.json", "--default-base", "bare.git"]
+        result = runner.invoke(cli, args + ["draft", "--tree", "HEAD"])
+        assert result.exit_code == 0, result.output
+        assert "First change" in result.output
+        assert "Second change" in result.output
+
+        result = runner.invoke(cli, args + ["draft", "--tree", "base..HEAD"])
+        assert result.exit_code == 0, result.output
+        assert "First change" not in result.output
+        assert "Second change" in result.output
+
+        result = runner.invoke(cli, args + ["draft", "--tree", "no-such-ref"])
+        assert result.exit_code == 1
+        assert "git ls-tree failed" in result.output
+
+
+def test_draft_source_archive(build_project):
+    runner, main_dir = build_project
+    with tarfile.open("changes.tar.gz", "w:gz") as tar:
+        data = b"Archived change\n"
+        info = tarfile.TarInfo("changes/main/pr.1.md")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    result = runner.invoke(cli, ["draft", "--source", "changes.tar.gz"])
+    assert result.exit_code == 0, result.output
+    assert "Archived change" in result.output
+    assert list(main_dir.iterdir()) == []
+
+    result = runner.invoke(cli, ["draft", "--source", ".proclamation.json"])
+    assert result.exit_code == 2
+    assert "Cannot read archive" in result.output
+
+
+def test_draft_watch_conflicts(build_project):
+    runner, main_dir = build_project
+    result = runner.invoke(cli, ["draft", "--watch", "--tree", "HEAD"])
+    assert result.exit_code == 2
+    assert "--watch cannot be combined" in result.output
+
+
+def test_serve_needs_socket_or_port(build_project):
+    runner, main_dir = build_project
+    result = runner.invoke(cli, ["serve"])
+    assert result.exit_code == 2
+    assert "exactly one of --socket and --port" in result.output
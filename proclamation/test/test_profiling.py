@@ -0,0 +1,48 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import tempfile
+from pathlib import Path
+
+from ..profiling import DISABLED, Profiler
+
+
+def test_summary_and_outputs():
+    profiler = Profiler()
+    for project in ("a", "b", "a"):
+        with profiler.phase("parse", project) as record:
+            record.add(files=2, nbytes=10, cached=1)
+    with profiler.phase("remove"):
+        pass
+
+    summary = profiler.summary()
+    assert [(e["phase"], e["project"]) for e in summary["phases"]] == [
+        ("parse", "a"),
+        ("parse", "b"),
+        ("remove", None),
+    ]
+    assert summary["phases"][0]["calls"] == 2
+    assert summary["phases"][0]["files"] == 4
+    assert summary["phases"][0]["bytes"] == 20
+    assert summary["phases"][0]["cached"] == 2
+
+    line = profiler.json_line(summary)
+    assert "\n" not in line
+    assert json.loads(line)["proclamation_profile"] == summary
+    assert profiler.format_table(summary).splitlines()[-1].startswith("total")
+
+    with tempfile.TemporaryDirectory() as dirname:
+        trace = Path(dirname) / "trace.json"
+        profiler.write_chrome_trace(trace)
+        events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+        assert [e["name"] for e in events][:2] == ["parse (a)", "parse (b)"]
+        assert all(e["ph"] == "X" for e in events)
+
+
+def test_disabled():
+    with DISABLED.phase("parse") as record:
+        record.add(files=1)
+    assert DISABLED.records == []
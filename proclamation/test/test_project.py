@@ -3,10 +3,13 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import tempfile
 from copy import deepcopy
+from pathlib import Path
 
-from ..project import Project
+from ..project import DirectoryScanner, FileListScanner, Project
 from ..settings import parse_project
+from ..types import ReferenceParser
 from .test_settings import PROJECT
 
 
@@ -31,3 +34,78 @@ def test_project_and_section_create_sort_by_prefix():
     assert proj.sections[0].name == "main section"
     assert proj.sections[0].relative_directory == "changes/main"
     assert proj.sections[0].sort_by_prefix is True
+
+
+def _write_fragments(base, directory, count):
+    section_dir = Path(base) / directory
+    section_dir.mkdir(parents=True)
+    for i in range(count):
+        with open(str(section_dir / f"pr.{i}.md"), "w", encoding="utf-8") as fp:
+            fp.write(f"---\n- author.someone{i % 3}\n---\nChange {i}\n")
+
+
+def _populated_texts(base, jobs):
+    proj_config = deepcopy(PROJECT)
+    proj_config["sections"]["second section"] = {"directory": "changes/second"}
+    proj = Project(parse_project(proj_config), default_base=Path(base))
+    proj.populate_sections(jobs=jobs)
+    return [
+        [(str(f.filename), f.text, f.authors) for f in section.fragments]
+        for section in proj.sections
+    ]
+
+
+def test_populate_sections_parallel_is_deterministic():
+    with tempfile.TemporaryDirectory() as dirname:
+        _write_fragments(dirname, "changes/main", 25)
+        _write_fragments(dirname, "changes/second", 10)
+        serial = _populated_texts(dirname, 1)
+        assert len(serial[0]) == 25
+        assert len(serial[1]) == 10
+        assert _populated_texts(dirname, 4) == serial
+        assert _populated_texts(dirname, 0) == serial
+
+
+def test_scanner_shared_between_projects():
+    with tempfile.TemporaryDirectory() as dirname:
+        _write_fragments(dirname, "changes/main", 3)
+        main_dir = Path(dirname) / "changes/main"
+        (main_dir / ".hidden.md").write_text("Hidden\n", encoding="utf-8")
+        (main_dir / "README.md").write_text("Readme\n", encoding="utf-8")
+        (main_dir / "pr.99.txt.bak").write_text("Backup\n", encoding="utf-8")
+        (main_dir / "pr.100.md").mkdir()
+
+        parser = ReferenceParser()
+        scanner = DirectoryScanner()
+        projects = [
+            Project(parse_project(PROJECT), parser, default_base=Path(dirname))
+            for _ in range(2)
+        ]
+        for proj in projects:
+            proj.populate_sections(scanner=scanner)
+        assert scanner.scans == 1
+        for proj in projects:
+            assert sorted(f.name for f in proj.fragment_filenames) == [
+                "pr.0.md",
+                "pr.1.md",
+                "pr.2.md",
+            ]
+
+
+def test_file_list_scanner():
+    with tempfile.TemporaryDirectory() as dirname:
+        _write_fragments(dirname, "changes/main", 5)
+        main_dir = Path(dirname) / "changes/main"
+        rejected = []
+        scanner = FileListScanner(
+            [main_dir / "pr.3.md", main_dir / "pr.1.md", Path(dirname) / "README.md"]
+        )
+        assert scanner.list_directory(main_dir, ReferenceParser(), rejected) == [
+            (main_dir.resolve() / "pr.1.md", ReferenceParser().parse("pr.1")),
+            (main_dir.resolve() / "pr.3.md", ReferenceParser().parse("pr.3")),
+        ]
+        assert rejected == []
+
+        proj = Project(parse_project(PROJECT), default_base=Path(dirname))
+        proj.populate_sections(scanner=scanner)
+        assert [f.text for f in proj.sections[0].fragments] == ["Change 1", "Change 3"]
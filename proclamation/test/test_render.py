@@ -3,14 +3,26 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
 from ..project import Project
 from ..render import (
     combine_changelogs,
+    generate_updated_changelog,
+    get_environment,
     get_split_changelog_file,
     render_template,
     split_changelog_contents,
+    write_outputs,
+    write_updated_changelog,
 )
-from ..settings import ProjectSettings, SectionSettings
+from ..settings import OutputSettings, ProjectSettings, SectionSettings
+from ..utils import copy_file_tail
 
 NEWS_FILE_1 = """# Sample NEWS file
 
@@ -94,3 +106,137 @@ def test_render_no_fragments():
     assert rendered.endswith("\n\n")
     assert rendered.startswith("## Test 1.0 (Release Date)\n\n")
     assert EXPECTED2 == rendered
+
+
+def test_environment_shared():
+    assert get_environment(["a"]) is get_environment(["a"])
+    assert get_environment(["a"]) is not get_environment(["b"])
+    assert get_environment(["a"], "cache") is get_environment(["a"], "cache")
+    assert get_environment(["a"], "cache") is not get_environment(["a"])
+
+
+def test_bytecode_cache():
+    with tempfile.TemporaryDirectory() as dirname:
+        base = Path(dirname)
+        cache_dir = base / "cache"
+        template_fn = base / "custom.j2"
+        template_fn.write_text("## {{ project_version }}\n", encoding="utf-8")
+        proj_settings = ProjectSettings("Test", template="custom.j2")
+        project = Project(
+            proj_settings, default_base=base, template_cache_dir=cache_dir
+        )
+
+        assert render_template(project, "1.0") == "## 1.0\n\n"
+        assert list(cache_dir.iterdir())
+
+        # A changed template must not use the stale compiled copy
+        template_fn.write_text("## v{{ project_version }}!\n", encoding="utf-8")
+        os.utime(str(template_fn), (time.time() + 10, time.time() + 10))
+        assert render_template(project, "1.0") == "## v1.0!\n\n"
+
+        # Only this project uses the cache.
+        other = Project(proj_settings, default_base=base)
+        assert get_environment([base]).bytecode_cache is None
+        assert render_template(other, "1.0") == "## v1.0!\n\n"
+
+
+def _make_project_with_news_file(dirname, contents):
+    news_fn = Path(dirname) / "CHANGELOG.md"
+    if contents is not None:
+        news_fn.write_text(contents, encoding="utf-8")
+    proj_settings = make_mock_project_settings_with_sections()
+    proj_settings.news_filename = str(news_fn)
+    return Project(proj_settings), news_fn
+
+
+def test_write_updated_changelog():
+    with tempfile.TemporaryDirectory() as dirname:
+        project, news_fn = _make_project_with_news_file(dirname, NEWS_FILE_1)
+        expected = generate_updated_changelog(project, "2.0", "Release Date")
+        write_updated_changelog(project, "2.0", "Release Date")
+        assert news_fn.read_text(encoding="utf-8") == expected
+        assert os.listdir(dirname) == ["CHANGELOG.md"]
+
+
+def test_write_updated_changelog_missing_file():
+    with tempfile.TemporaryDirectory() as dirname:
+        project, news_fn = _make_project_with_news_file(dirname, None)
+        write_updated_changelog(project, "1.0", "Release Date")
+        assert news_fn.read_text(encoding="utf-8") == "# Changelog\n\n" + EXPECTED2
+
+
+def test_write_updated_changelog_duplicated_version():
+    with tempfile.TemporaryDirectory() as dirname:
+        project, news_fn = _make_project_with_news_file(dirname, NEWS_FILE_1)
+        try:
+            write_updated_changelog(project, "1.0", "date goes here")
+        except RuntimeError:
+            assert news_fn.read_text(encoding="utf-8") == NEWS_FILE_1
+            assert os.listdir(dirname) == ["CHANGELOG.md"]
+            return
+        assert False  # We expect an error.
+
+
+def test_write_updated_changelog_does_not_decode_history():
+    with tempfile.TemporaryDirectory() as dirname:
+        project, news_fn = _make_project_with_news_file(dirname, None)
+        # The history is copied as-is, so even invalid UTF-8 there is fine
+        history = b"## Old 0.1\n\n- \xff\xfe legacy bytes\r\n" * 1000
+        news_fn.write_bytes(b"# Sample NEWS file\n\n" + history)
+        write_updated_changelog(project, "1.0", "Release Date")
+        head = b"# Sample NEWS file\n\n"
+        assert news_fn.read_bytes() == head + EXPECTED2.encode("utf-8") + history
+
+
+def test_write_updated_changelog_keeps_crlf():
+    with tempfile.TemporaryDirectory() as dirname:
+        project, news_fn = _make_project_with_news_file(dirname, None)
+        news_fn.write_bytes(NEWS_FILE_1.replace("\n", "\r\n").encode("utf-8"))
+        expected = generate_updated_changelog(project, "2.0", "Release Date")
+        write_updated_changelog(project, "2.0", "Release Date")
+        data = news_fn.read_bytes()
+        assert data.count(b"\n") == data.count(b"\r\n")
+        assert data == expected.replace("\n", "\r\n").encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "unsupported", [("copy_file_range",), ("copy_file_range", "sendfile")]
+)
+def test_copy_file_tail_fallback(monkeypatch, unsupported):
+    def fail(*args):
+        raise OSError("not supported")
+
+    for name in unsupported:
+        monkeypatch.setattr(os, name, fail, raising=False)
+    with tempfile.TemporaryFile() as src, tempfile.TemporaryFile() as dst:
+        src.write(b"head|tail")
+        src.flush()
+        dst.write(b">")
+        copy_file_tail(src, dst, 5)
+        dst.seek(0)
+        assert dst.read() == b">tail"
+
+
+def test_write_outputs():
+    with tempfile.TemporaryDirectory() as dirname:
+        base = Path(dirname)
+        (base / "text.j2").write_text(
+            "{{ project_name }} {{ project_version }}: "
+            "{{ sections | map(attribute='name') | join(', ') }}\n",
+            encoding="utf-8",
+        )
+        proj_settings = make_mock_project_settings_with_sections()
+        proj_settings.outputs = [
+            OutputSettings("base.j2", str(base / "out" / "notes-{version}.md")),
+            OutputSettings("text.j2", str(base / "{project_name}.txt")),
+        ]
+        project = Project(proj_settings, default_base=base)
+        for jobs in (1, 2):
+            filenames = write_outputs(project, "1.0", "Release Date", jobs)
+            assert filenames == [base / "out" / "notes-1.0.md", base / "Test.txt"]
+            assert filenames[0].read_text(encoding="utf-8") == render_template(
+                project, "1.0", "Release Date"
+            )
+            assert filenames[1].read_text(encoding="utf-8") == (
+                "Test 1.0: Features, Bug fixes\n\n"
+            )
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from ..client import Client, ServerError
+from ..main import ProjectCollection
+from ..server import ProclamationServer, TCPServer
+from .test_main import create_config_file
+
+CONFIG = {
+    "projects": [
+        {
+            "project_name": name,
+            "base_url": "https://example.com/project",
+            "sections": {"Main": {"directory": f"changes/{name}"}},
+        }
+        for name in ("first", "second")
+    ]
+}
+
+
+def _write(fn, text):
+    fn.parent.mkdir(parents=True, exist_ok=True)
+    fn.write_text(text, encoding="utf-8")
+    # Make sure the change is visible even on coarse mtime file systems.
+    st = fn.stat()
+    os.utime(str(fn), ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@contextmanager
+def _running(listener):
+    thread = threading.Thread(target=listener.serve_forever)
+    thread.start()
+    try:
+        yield
+    finally:
+        listener.shutdown()
+        thread.join()
+        listener.server_close()
+
+
+@contextmanager
+def _server(dirname):
+    base = Path(dirname).resolve()
+    create_config_file(str(base), CONFIG)
+    _write(base / "changes/first/pr.1.md", "First change\n")
+    collection = ProjectCollection(str(base / ".proclamation.json"), None, base)
+    proclamation = ProclamationServer(collection.reload, collection.config_file)
+    yield base, proclamation
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs Unix sockets")
+def test_unix_socket_server():
+    from ..server import UnixServer
+
+    with tempfile.TemporaryDirectory() as dirname, _server(dirname) as (base, srv):
+        socket_path = base / "proclamation.sock"
+        with _running(UnixServer(socket_path, srv)):
+            assert socket_path.stat().st_mode & 0o777 == 0o600
+            client = Client(socket_path, timeout=10)
+            client.ping()
+            drafts = client.draft(version="1.0")
+            # The second project has no directory yet, so is left out.
+            assert list(drafts) == ["first"]
+            assert "First change" in drafts["first"]
+            assert "1.0" in drafts["first"]
+
+            # Changes are picked up without a restart.
+            _write(base / "changes/first/pr.2.md", "Second change\n")
+            _write(base / "changes/first/pr.1.md", "First change, again\n")
+            draft = client.draft(project="first")["first"]
+            assert "Second change" in draft
+            assert "First change, again" in draft
+
+            _write(base / "changes/second/pr.3.md", "Third change\n")
+            assert list(client.draft()) == ["first", "second"]
+
+            _write(base / "changes/second/pr.3.md", "")
+            checked, problems = client.check()
+            assert checked == 3
+            assert [(p["filename"], p["message"]) for p in problems] == [
+                (str(base / "changes/second/pr.3.md"), "empty fragment body")
+            ]
+
+            _write(base / "changes/second/pr.3.md", "Third change\n")
+            exported = json.loads(client.export(project="second"))
+            assert exported["projects"][0]["name"] == "second"
+
+            with pytest.raises(ServerError, match="Could not find a project"):
+                client.draft(project="third")
+            with pytest.raises(ServerError, match="Unknown command"):
+                client.request("build")
+            with pytest.raises(ServerError, match="Invalid parameters"):
+                client.request("draft", colour="blue")
+
+            # The config file is reloaded when it changes.
+            create_config_file(str(base), CONFIG["projects"][1])
+            assert list(client.draft()) == ["second"]
+        assert not socket_path.exists()
+
+
+def test_slow_render_does_not_block_other_projects():
+    with tempfile.TemporaryDirectory() as dirname, _server(dirname) as (base, srv):
+        _write(base / "changes/second/pr.4.md", "Fourth change\n")
+        listener = TCPServer(0, srv)
+        with _running(listener):
+            client = Client(port=listener.server_address[1], timeout=10)
+            _, warm = srv._reload_if_needed()
+            # Stand in for a slow render of the first project.
+            with warm["first"].lock:
+                assert "second" in client.draft(project="second")
+                assert client.check(project="first")[0] == 1
+
+
+def test_failed_refresh_is_retried(monkeypatch):
+    from .. import server
+
+    with tempfile.TemporaryDirectory() as dirname, _server(dirname) as (base, srv):
+        _write(base / "changes/first/pr.2.md", "Second change\n")
+
+        def fail(*args, **kwargs):
+            raise OSError("disk on fire")
+
+        with monkeypatch.context() as m:
+            m.setattr(server, "refresh_projects", fail)
+            response = srv.handle_request({"command": "draft", "project": "first"})
+            assert response == {"ok": False, "error": "disk on fire"}
+        draft = srv.draft(project="first")["drafts"]["first"]
+        assert "Second change" in draft
+
+
+def test_export_uses_warm_projects(monkeypatch):
+    from .. import export
+
+    with tempfile.TemporaryDirectory() as dirname, _server(dirname) as (base, srv):
+        _write(base / "changes/first/pr.2.md", "Second change\n")
+        collection = srv._reload_if_needed()[0]
+        out = StringIO()
+        export.export(out, [collection.projects[0]], "ndjson")
+        expected = out.getvalue()
+
+        def parse(*args, **kwargs):
+            raise AssertionError("export should not parse unchanged files")
+
+        monkeypatch.setattr(export, "parse_fragment_file", parse)
+        assert srv.export(project="first", format="ndjson")["output"] == expected
+        # The second project has no directory yet, so is left out.
+        exported = json.loads(srv.export()["output"])
+        assert [p["name"] for p in exported["projects"]] == ["first"]
+
+
+def test_reload_outside_lock():
+    with tempfile.TemporaryDirectory() as dirname, _server(dirname) as (base, srv):
+        loading = threading.Event()
+        release = threading.Event()
+        load_collection = srv._load_collection
+
+        def slow_load():
+            loading.set()
+            assert release.wait(10)
+            return load_collection()
+
+        srv._load_collection = slow_load
+        create_config_file(str(base), CONFIG["projects"][1])
+        thread = threading.Thread(target=srv._reload_if_needed)
+        thread.start()
+        try:
+            assert loading.wait(10)
+            # The previous collection stays available while loading.
+            assert srv._lock.acquire(timeout=10)
+            assert [p.name for p in srv._collection.projects] == ["first", "second"]
+            srv._lock.release()
+        finally:
+            release.set()
+            thread.join()
+        assert [p.name for p in srv._collection.projects] == ["second"]
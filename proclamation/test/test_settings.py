@@ -62,3 +62,18 @@ def test_parse_section():
     assert sect.name == "main section"
     assert sect.directory == sect_setting_dict["directory"]
     assert sect.sort_by_prefix is True
+
+
+def test_parse_outputs():
+    proj = parse_project(
+        dict(
+            PROJECT,
+            outputs=[
+                {"template": "email.txt.j2", "output": "email-{version}.txt"},
+                {"template": "site.html.j2", "output": "site/news.html"},
+            ],
+        )
+    )
+    assert [o.template for o in proj.outputs] == ["email.txt.j2", "site.html.j2"]
+    assert proj.outputs[1].output == "site/news.html"
+    assert parse_project(PROJECT).outputs == []
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from ..project import Project
+from ..settings import parse_project
+from ..sources import (
+    FileSystemSource,
+    FragmentSource,
+    TarSource,
+    ZipSource,
+    open_archive,
+)
+from ..types import ReferenceParser
+from .test_settings import PROJECT
+
+FILES = {
+    "changes/main/pr.1.md": "---\n- author.someone\n---\nFirst change\n",
+    "changes/main/pr.10.md": "Tenth change\n",
+    "changes/main/README.md": "Not a fragment\n",
+    "changes/main/pr-2.md": "Misnamed\n",
+    "changes/other/pr.3.md": "Another section\n",
+}
+
+
+def _write_tar(filename, mode, prefix=""):
+    with tarfile.open(str(filename), mode) as tar:
+        for name, text in FILES.items():
+            data = text.encode("utf-8")
+            info = tarfile.TarInfo(prefix + name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+def _write_zip(filename):
+    with zipfile.ZipFile(str(filename), "w") as archive:
+        for name, text in FILES.items():
+            archive.writestr(name, text)
+
+
+def _populated(base, source):
+    project = Project(parse_project(PROJECT), default_base=base)
+    project.populate_sections(source=source, jobs=2)
+    return [(f.filename, f.text, f.authors) for f in project.sections[0].fragments]
+
+
+@pytest.mark.parametrize(
+    "name,writer",
+    [
+        ("changes.tar", lambda fn: _write_tar(fn, "w")),
+        ("changes.tar.gz", lambda fn: _write_tar(fn, "w:gz", "./")),
+        ("changes.tar.xz", lambda fn: _write_tar(fn, "w:xz")),
+        ("changes.zip", _write_zip),
+    ],
+)
+def test_archive_sources(name, writer):
+    with tempfile.TemporaryDirectory() as dirname:
+        base = Path(dirname).resolve()
+        writer(base / name)
+        main_dir = base / "changes/main"
+        with open_archive(base / name, base) as source:
+            assert isinstance(source, ZipSource if name.endswith(".zip") else TarSource)
+            rejected = []
+            source.list_directory(main_dir, ReferenceParser(), rejected)
+            assert sorted(rejected) == [main_dir / "README.md", main_dir / "pr-2.md"]
+            fragments = _populated(base, source)
+        assert fragments == [
+            (main_dir / "pr.1.md", "First change", ["someone"]),
+            (main_dir / "pr.10.md", "Tenth change", []),
+        ]
+        # Nothing was extracted.
+        assert not main_dir.exists()
+
+
+def test_file_system_source_matches_archive():
+    with tempfile.TemporaryDirectory() as dirname:
+        base = Path(dirname).resolve()
+        for name, text in FILES.items():
+            (base / name).parent.mkdir(parents=True, exist_ok=True)
+            (base / name).write_text(text, encoding="utf-8")
+        _write_zip(base / "changes.zip")
+        with open_archive(base / "changes.zip", base) as source:
+            from_archive = _populated(base, source)
+        assert _populated(base, FileSystemSource()) == from_archive
+        assert _populated(base, None) == from_archive
+
+
+def test_unreadable_archive():
+    with tempfile.TemporaryDirectory() as dirname:
+        fn = Path(dirname) / "changes.tar"
+        fn.write_bytes(b"not an archive")
+        with pytest.raises(RuntimeError, match="Cannot read archive"):
+            open_archive(fn)
+
+
+def test_incomplete_source():
+    class ListingOnly(FragmentSource):
+        def list_directory(self, directory, ref_parser, rejected=None):
+            return []
+
+    with pytest.raises(TypeError):
+        ListingOnly()
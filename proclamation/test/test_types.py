@@ -3,7 +3,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
 import tempfile
+import tracemalloc
 from io import StringIO
 from pathlib import Path
 
@@ -314,3 +316,184 @@ def test_fragment_sorting_prefix_from_disk():
         # This one starts with "Make"
         assert section.fragments[2].prefix == "Make"
         assert section.fragments[2].ref.as_tuple() == ("mr", 1729, ())
+
+
+def test_fragment_bulk_add():
+    section = Section("MySection", sort_by_prefix=True)
+    fragments = []
+    for fn, contents in reversed(PREFIX_DATA):
+        fragment = Fragment(fn)
+        fragment.text = contents
+        fragments.append(fragment)
+    section.add_fragments(fragments)
+    assert len(section.fragments) == 3
+    assert [str(f.filename) for f in section.fragments] == [
+        "mr.1544.md",
+        "mr.1731.md",
+        "mr.1729.md",
+    ]
+
+    # Single adds still land in sorted position
+    frag_doc_0 = Fragment("mr.1000.md")
+    frag_doc_0.text = "Document an old thing"
+    section.add_fragment(frag_doc_0)
+    assert section.fragments[0] == frag_doc_0
+    assert section.fragments[3].prefix == "Make"
+
+
+class _DictReference:
+    """A dict-backed reference, like :class:`Reference` used to be."""
+
+    def __init__(self, item_type, identifier, service_params):
+        self.item_type = item_type
+        self.identifier = identifier
+        self.service_params = service_params
+
+    def as_tuple(self):
+        return (self.item_type, self.identifier, tuple(self.service_params))
+
+
+class _DictFragment:
+    """A dict-backed fragment with the layout :class:`Fragment` used to have."""
+
+    def __init__(self, filename, ref_strings):
+        self.filename = Path(filename)
+        self.text = ""
+        self.io = None
+        self._ref_parser = None
+        self._prefix = None
+        self.refs = []
+        self.authors = []
+        self._known_refs = set()
+        for ref_str in ref_strings:
+            ref = _DictReference(*ref_str.split(".")[:2], ref_str.split(".")[2:])
+            if ref.item_type == "author":
+                self.authors.append(ref.identifier)
+            else:
+                self.refs.append(ref)
+            self._known_refs.add(ref.as_tuple())
+        self._ref = self.refs[0]
+
+
+def _bytes_per_item(factory, count=2000):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [factory(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(items) == count
+    return (after - before) / count
+
+
+def test_fragment_memory_overhead():
+    parser = ReferenceParser()
+    # Inputs are allocated up front: only count what the fragments add.
+    filenames = [Path(f"changes/main/pr.{i}.md") for i in range(2000)]
+    ref_strings = [(f"pr.{i}", "author.someone", "mr.7") for i in range(2000)]
+
+    def make_fragment(i):
+        main_ref, *extra_refs = ref_strings[i]
+        fragment = Fragment(filenames[i], parser.parse(main_ref), parser)
+        for ref_str in extra_refs:
+            fragment.add_ref(ref_str)
+        return fragment
+
+    def make_dict_fragment(i):
+        return _DictFragment(filenames[i], ref_strings[i])
+
+    new_size = _bytes_per_item(make_fragment)
+    old_size = _bytes_per_item(make_dict_fragment)
+    assert new_size < 0.75 * old_size, (new_size, old_size)
+
+    fragment = make_fragment(1)
+    assert not hasattr(fragment, "__dict__")
+    # Shared references
+    assert fragment.refs[1] is make_fragment(2).refs[1]
+    assert fragment.refs[1].item_type is sys.intern("mr")
+
+
+def test_fragment_sorting_numeric():
+    section = Section("MySection")
+    section.add_fragments(
+        Fragment(fn) for fn in ("pr.10.md", "pr.9.md", "pr.9.10.md", "pr.9.2.md")
+    )
+    assert [str(f.filename) for f in section.fragments] == [
+        "pr.9.md",
+        "pr.9.2.md",
+        "pr.9.10.md",
+        "pr.10.md",
+    ]
+    assert Fragment("pr.9.md") < Fragment("pr.10.md")
+
+
+def test_ref_parse_memo():
+    parser = ReferenceParser(memo_size=2)
+    first = parser.parse("pr.123")
+    assert parser.parse("pr.123.md") is first
+    assert parser.parse("pr.123") is first
+    assert parser.parse_filename("pr.123") is None
+    assert parser.memo_hits == 1
+    assert parser.memo_misses == 3
+    # Least recently used entries are evicted
+    assert parser.memo_info().currsize == 2
+
+    unmemoized = ReferenceParser()
+    assert unmemoized.parse("pr.123") == first
+    assert unmemoized.memo_info().currsize == 0
+
+
+class _MutableRef:
+    def __init__(self, elts):
+        self.elts = list(elts)
+
+
+class _CustomParser(ReferenceParser):
+    def make_reference(self, elts):
+        if elts[0] == "custom":
+            return _MutableRef(elts)
+        return super().make_reference([elts[0].upper()] + elts[1:])
+
+
+def test_ref_parse_memo_custom_parser():
+    parser = _CustomParser(memo_size=10)
+    assert parser.parse("pr.5").item_type == "PR"
+    assert parser.parse("pr.5") is parser.parse("pr.5")
+
+    # Results not known to be immutable are never shared
+    custom = parser.parse("custom.5")
+    assert isinstance(custom, _MutableRef)
+    assert parser.parse("custom.5") is not custom
+
+
+def test_lazy_fragment():
+    with tempfile.TemporaryDirectory() as dirname:
+        fn = Path(dirname) / "issue.54.md"
+        with open(str(fn), "w", encoding="utf-8") as fp:
+            fp.write(FRAGMENT_WITH_COMMENTS)
+        fragment = Fragment(fn, lazy=True)
+        assert not fragment.loaded
+        assert fragment.ref.identifier == "54"
+        assert not fragment.loaded
+
+        assert len(fragment.refs) == 2
+        assert fragment.loaded
+        assert fragment.issue == 55
+        assert fragment.text == "This is content."
+        assert fragment.prefix == "This"
+
+
+def test_lazy_section():
+    with tempfile.TemporaryDirectory() as dirname:
+        create_fragments(dirname)
+        section = Section("MySection", sort_by_prefix=True)
+        section.populate_from_directory(dirname, ReferenceParser(), lazy=True)
+        assert sorted(f.name for f in section.fragment_filenames) == sorted(
+            fn for fn, _ in PREFIX_DATA
+        )
+
+        # Changing a file now shows it has not been read yet
+        with open(str(Path(dirname) / "mr.1729.md"), "w", encoding="utf-8") as fp:
+            fp.write("Add a thing\n")
+        assert [f.prefix for f in section.fragments] == ["Add", "Document", "Document"]
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import tempfile
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from ..project import Project
+from ..settings import parse_project
+from ..watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    refresh_projects,
+    watch_projects,
+    watched_paths,
+)
+from .test_settings import PROJECT
+
+
+def _project(base):
+    main_dir = base / "changes/main"
+    main_dir.mkdir(parents=True)
+    for i in range(3):
+        (main_dir / f"pr.{i}.md").write_text(f"Change {i}\n", encoding="utf-8")
+    config = deepcopy(PROJECT)
+    config["template"] = "template.md"
+    (base / "template.md").write_text("{{ project_name }}\n", encoding="utf-8")
+    project = Project(parse_project(config), default_base=base)
+    project.populate_sections()
+    return project, main_dir
+
+
+def _texts(project):
+    return [fragment.text for fragment in project.sections[0].fragments]
+
+
+def test_refresh_fragments():
+    with tempfile.TemporaryDirectory() as dirname:
+        project, main_dir = _project(Path(dirname).resolve())
+        (main_dir / "pr.1.md").write_text("Changed 1\n", encoding="utf-8")
+        (main_dir / "pr.2.md").unlink()
+        (main_dir / "pr.10.md").write_text("Change 10\n", encoding="utf-8")
+        (main_dir / "notes.txt").write_text("Not a fragment\n", encoding="utf-8")
+        changed = {main_dir / name for name in ("pr.1.md", "pr.2.md", "pr.10.md")}
+        sections = project.refresh_fragments(changed | {main_dir / "notes.txt"})
+        assert sections == project.sections
+        assert _texts(project) == ["Change 0", "Changed 1", "Change 10"]
+
+        assert project.refresh_fragments({main_dir / "notes.txt"}) == []
+        assert refresh_projects([project], {main_dir / "notes.txt"}) == []
+        assert refresh_projects([project], {Path(dirname).resolve() / "template.md"})
+
+
+def test_refresh_fragments_keeps_unparsable_files():
+    with tempfile.TemporaryDirectory() as dirname:
+        project, main_dir = _project(Path(dirname).resolve())
+        (main_dir / "pr.1.md").write_text("Changed 1\n", encoding="utf-8")
+        (main_dir / "pr.2.md").write_text("---\nnonsense\n", encoding="utf-8")
+        (main_dir / "pr.10.md").write_text("", encoding="utf-8")
+        changed = {main_dir / name for name in ("pr.1.md", "pr.2.md", "pr.10.md")}
+        assert project.refresh_fragments(changed) == project.sections
+        assert _texts(project) == ["Change 0", "Changed 1", "Change 2"]
+
+        (main_dir / "pr.10.md").write_text("Change 10\n", encoding="utf-8")
+        project.refresh_fragments({main_dir / "pr.10.md"})
+        assert _texts(project) == ["Change 0", "Changed 1", "Change 2", "Change 10"]
+
+
+def test_watched_paths():
+    with tempfile.TemporaryDirectory() as dirname:
+        base = Path(dirname).resolve()
+        project, main_dir = _project(base)
+        assert watched_paths(project) == [main_dir, base / "template.md"]
+
+
+def _check_watcher(watcher_class, **kwargs):
+    with tempfile.TemporaryDirectory() as dirname:
+        base = Path(dirname).resolve()
+        project, main_dir = _project(base)
+        with watcher_class(watched_paths(project), **kwargs) as watcher:
+            assert watcher.wait(timeout=0) == set()
+            (main_dir / "pr.5.md").write_text("New change\n", encoding="utf-8")
+            (base / "template.md").write_text("Changed\n", encoding="utf-8")
+            # Not watched
+            (base / "other.md").write_text("Other\n", encoding="utf-8")
+            changed = set()
+            while len(changed) < 2:
+                new = watcher.wait(timeout=5)
+                assert new
+                changed |= new
+            assert changed == {main_dir / "pr.5.md", base / "template.md"}
+
+            # Files to retry come back on timeout, or with the next change.
+            watcher.retry({main_dir / "pr.5.md"})
+            assert watcher.wait(timeout=0) == {main_dir / "pr.5.md"}
+            assert watcher.wait(timeout=0) == set()
+            watcher.retry({main_dir / "pr.5.md"})
+            (main_dir / "pr.6.md").write_text("Newer change\n", encoding="utf-8")
+            changed = watcher.wait(timeout=5)
+            assert {main_dir / "pr.5.md", main_dir / "pr.6.md"} <= changed
+
+
+def test_polling_watcher():
+    _check_watcher(PollingWatcher, interval=0.01)
+
+
+def test_polling_watcher_retry():
+    with tempfile.TemporaryDirectory() as dirname:
+        base = Path(dirname).resolve()
+        watcher = PollingWatcher([base])
+        watcher.retry({base / "pr.1.md"})
+        assert watcher.wait(timeout=0) == {base / "pr.1.md"}
+        assert watcher.wait(timeout=0) == set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs Linux")
+def test_inotify_watcher():
+    _check_watcher(InotifyWatcher)
+
+
+class _FakeWatcher:
+    def __init__(self, changes):
+        self.changes = list(changes)
+        self.retried = []
+
+    def wait(self, timeout=None):
+        if not self.changes:
+            raise KeyboardInterrupt
+        return self.changes.pop(0)
+
+    def retry(self, changed):
+        self.retried.append(changed)
+
+
+def test_watch_projects():
+    with tempfile.TemporaryDirectory() as dirname:
+        project, main_dir = _project(Path(dirname).resolve())
+        (main_dir / "pr.0.md").write_text("Changed 0\n", encoding="utf-8")
+        watcher = _FakeWatcher([{main_dir / "README.md"}, {main_dir / "pr.0.md"}])
+        rendered = []
+        messages = []
+        with pytest.raises(KeyboardInterrupt):
+            watch_projects(
+                [project],
+                lambda p: rendered.append(_texts(p)),
+                watcher,
+                report=messages.append,
+            )
+        assert rendered == [["Changed 0", "Change 1", "Change 2"]]
+        assert len(messages) == 1
+        assert messages[0].startswith(f"Updated the draft of {project.name} in ")
+
+
+def test_watch_projects_survives_errors():
+    with tempfile.TemporaryDirectory() as dirname:
+        project, main_dir = _project(Path(dirname).resolve())
+        (main_dir / "pr.0.md").write_text("Changed 0\n", encoding="utf-8")
+        changes = [{main_dir / "pr.0.md"}, {main_dir / "pr.0.md"}]
+        watcher = _FakeWatcher(changes)
+        rendered = []
+        messages = []
+
+        def render(p):
+            if not rendered:
+                rendered.append(None)
+                raise RuntimeError("broken template")
+            rendered.append(_texts(p))
+
+        with pytest.raises(KeyboardInterrupt):
+            watch_projects([project], render, watcher, report=messages.append)
+        assert rendered == [None, ["Changed 0", "Change 1", "Change 2"]]
+        assert messages[0] == (
+            f"Could not update the draft of {project.name}: broken template"
+        )
+        assert messages[1].startswith(f"Updated the draft of {project.name} in ")
+
+
+def test_watch_projects_retries_failed_refresh(monkeypatch):
+    from .. import watch
+
+    with tempfile.TemporaryDirectory() as dirname:
+        project, main_dir = _project(Path(dirname).resolve())
+        watcher = _FakeWatcher([{main_dir / "pr.0.md"}])
+        messages = []
+
+        def fail(*args, **kwargs):
+            raise OSError("file vanished")
+
+        monkeypatch.setattr(watch, "refresh_projects", fail)
+        with pytest.raises(KeyboardInterrupt):
+            watch_projects([project], None, watcher, report=messages.append)
+        assert watcher.retried == [{main_dir / "pr.0.md"}]
+        assert messages == ["Could not update the fragments: file vanished"]
@@ -8,16 +8,24 @@
 
 import copy
 import logging
-from operator import attrgetter
+import os
+import re
+import sys
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
 
 _LOG = logging.getLogger(__name__)
 
 FRONT_MATTER_DELIMITER = "---"
 
 
-class Reference:
+class Reference(tuple):
     """A simple class storing the information about a reference.
 
     A reference is an issue, merge/pull request, ticket number, etc: any known
@@ -27,25 +35,37 @@ class Reference:
 
     Generally created from a string by :class:`ReferenceParser`.
 
+    This is an immutable tuple of ``(item_type, identifier, service_params)``
+    with named accessors, so a single instance can be shared by every
+    fragment mentioning the same reference.
+
     If you customize Proclamation by writing your own customized subclass
     of :class:`ReferenceParser`, you do not necessarily have to use this
     class. However, for most project structures, even fairly complicated ones,
     this class and a custom template suffice.
     """
 
-    def __init__(self, item_type, identifier, service_params):
+    __slots__ = ()
+
+    def __new__(cls, item_type, identifier, service_params):
         """Construct from a parsed reference string."""
-        super().__init__()
+        if isinstance(item_type, str):
+            item_type = sys.intern(item_type)
+        return super().__new__(cls, (item_type, identifier, tuple(service_params)))
 
-        self.item_type = item_type
-        """Item type, like ``issue``, ``mr``, ``pr``."""
+    def __getnewargs__(self):
+        return tuple(self)
 
-        self.identifier = identifier
-        """Reference identifier."""
+    item_type = property(
+        itemgetter(0), doc="Item type, like ``issue``, ``mr``, ``pr``."
+    )
 
-        self.service_params = service_params
-        """A list/tuple of any additional parameters associated with the
-        service."""
+    identifier = property(itemgetter(1), doc="Reference identifier.")
+
+    service_params = property(
+        itemgetter(2),
+        doc="A tuple of any additional parameters associated with the service.",
+    )
 
     def as_tuple(self):
         """Return all contents as a tuple for use in sets and maps.
@@ -55,14 +75,21 @@ class Reference:
 
         Don't actually use this in your templates!
         """
-        return (self.item_type, self.identifier, tuple(self.service_params))
+        return self
 
     def __repr__(self):
         return "Reference({}, {}, {})".format(
-            repr(self.item_type), repr(self.identifier), repr(self.service_params)
+            repr(self.item_type), repr(self.identifier), repr(list(self.service_params))
         )
 
 
+ReferenceMemoInfo = namedtuple(
+    "ReferenceMemoInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+"""Statistics about a :class:`ReferenceParser` memo, like
+:func:`functools.lru_cache` provides."""
+
+
 class ReferenceParser:
     """The base class and default "reference parser".
 
@@ -77,11 +104,69 @@ class ReferenceParser:
     request numbers, etc. This portion of the system is left fairly flexible
     since there are almost as many project administration structures as there
     are projects.
+
+    Pass a non-zero ``memo_size`` to remember the results of up to that many
+    :func:`parse` and :func:`parse_filename` calls, least-recently-used first
+    out. Only ``None`` and (immutable) :class:`Reference` results are
+    remembered, so a :func:`make_reference` override returning some other
+    type is simply called every time.
     """
 
-    def __init__(self):
+    def __init__(self, memo_size=0):
         """Construct parser."""
         self.extensions_to_drop = {"md", "rst", "txt"}
+        self.known_item_types = {"issue", "pr", "mr", "author"}
+        """Reference types that templates know about. Only used to warn about
+        typos by ``proclamation check``."""
+        self._interned_refs: Dict[Reference, Reference] = {}
+
+        self.memo_size = memo_size
+        """Maximum number of memoized parse results, 0 to disable."""
+        self._memo: "OrderedDict[Tuple[bool, str], Optional[Reference]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self.memo_hits = 0
+        """Number of parse calls answered from the memo."""
+        self.memo_misses = 0
+        """Number of parse calls that had to actually parse."""
+
+    def memo_info(self) -> ReferenceMemoInfo:
+        """Return statistics about the parse memo.
+
+        >>> rp = ReferenceParser(memo_size=10)
+        >>> _ = rp.parse("mr.50"), rp.parse("mr.50"), rp.parse("mr.51")
+        >>> rp.memo_info()
+        ReferenceMemoInfo(hits=1, misses=2, maxsize=10, currsize=2)
+        """
+        with self._memo_lock:
+            return ReferenceMemoInfo(
+                self.memo_hits, self.memo_misses, self.memo_size, len(self._memo)
+            )
+
+    def clear_memo(self):
+        """Forget all memoized results, for example after changing
+        :attr:`extensions_to_drop`."""
+        with self._memo_lock:
+            self._memo.clear()
+            self.memo_hits = 0
+            self.memo_misses = 0
+
+    def _memoized(self, key, func, s):
+        with self._memo_lock:
+            try:
+                result = self._memo[key]
+            except KeyError:
+                self.memo_misses += 1
+            else:
+                self._memo.move_to_end(key)
+                self.memo_hits += 1
+                return result
+        result = func(s)
+        if result is None or type(result) is Reference:
+            with self._memo_lock:
+                self._memo[key] = result
+                if len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+        return result
 
     def split_on_dot_and_drop_ext(self, s):
         """Return the .-delimited portions of a name/ref, excluding a file
@@ -137,12 +222,14 @@ class ReferenceParser:
             # Only one component: Can't be a ref.
             return None
         try:
-            return Reference(
+            ref = Reference(
                 item_type=elts[0], identifier=elts[1], service_params=elts[2:]
             )
         except ValueError:
             # Conversion failure, etc. means this isn't actually a ref
             return None
+        # Share a single instance of each distinct reference
+        return self._interned_refs.setdefault(ref, ref)
 
     def parse_filename(self, s):
         """Turn a filename string into a reference or None.
@@ -168,6 +255,11 @@ class ReferenceParser:
 
         >>> ReferenceParser().parse_filename("mr.50.extradata")
         """
+        if self.memo_size:
+            return self._memoized((True, s), self._parse_filename, s)
+        return self._parse_filename(s)
+
+    def _parse_filename(self, s):
         elts, removed_extension = self.split_on_dot_and_drop_ext(s)
         if not removed_extension:
             # Filenames must have the extension
@@ -199,6 +291,11 @@ class ReferenceParser:
         >>> ReferenceParser().parse("mr.50.extradata")
         Reference('mr', 50, ['extradata'])
         """
+        if self.memo_size:
+            return self._memoized((False, s), self._parse, s)
+        return self._parse(s)
+
+    def _parse(self, s):
         elts, _ = self.split_on_dot_and_drop_ext(s)
 
         return self.make_reference(elts)
@@ -226,10 +323,130 @@ class ReferenceParser:
         return ".".join(parts)
 
 
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+def natural_sort_key(value) -> Tuple:
+    """Return a key that sorts runs of digits numerically.
+
+    >>> natural_sort_key("10") > natural_sort_key("9")
+    True
+
+    >>> natural_sort_key("v2a") < natural_sort_key("v10")
+    True
+
+    >>> natural_sort_key(12) == natural_sort_key("12")
+    True
+    """
+    if isinstance(value, int):
+        return ((0, value, ""),)
+    return tuple(
+        (0, int(chunk), "") if chunk.isdecimal() else (1, 0, chunk)
+        for chunk in _DIGITS_RE.split(str(value))
+        if chunk
+    )
+
+
+def reference_sort_key(reference) -> Tuple:
+    """Return a key sorting references by type, then naturally by identifier
+    and service parameters, as fragments are sorted in a section.
+
+    >>> refs = [Reference("pr", "10", []), Reference("issue", "3", []),
+    ...         Reference("pr", "9", [])]
+    >>> [str(ref.identifier) for ref in sorted(refs, key=reference_sort_key)]
+    ['3', '9', '10']
+    """
+    item_type, identifier, service_params = reference.as_tuple()
+    return (
+        str(item_type),
+        natural_sort_key(identifier),
+        tuple(natural_sort_key(param) for param in service_params),
+    )
+
+
 _DASH_BULLET = "- "
 _ASTERISK_BULLET = "* "
 
 
+def _parse_bullets(fp, line: str) -> List[str]:
+    bullets: List[str] = []
+    bullet_content = ""
+    while 1:
+        if not line:
+            break
+        '''
+        # Remove leading "bullet"
+        lstripped_line = line.lstrip()
+        had_bullet = False
+        if lstripped_line.startswith(_DASH_BULLET):
+            line = lstripped_line[len(_DASH_BULLET) :]
+            had_bullet = True
+        elif lstripped_line.startswith(_ASTERISK_BULLET):
+            line = lstripped_line[len(_ASTERISK_BULLET) :]
+            had_bullet = True
+
+        if had_bullet:
+            # We must start a new bullet
+            if bullet_content:
+                bullets.append(bullet_content)
+            bullet_content = ""
+        bullet_content += line
+        '''
+        bullet_content += line
+        line = fp.readline()
+
+    if bullet_content:
+        bullets.append(bullet_content)
+    return [s.strip() for s in bullets]
+
+
+class FragmentText(NamedTuple):
+    """The parts of a fragment file, as split by :func:`split_fragment_text`."""
+
+    references: List[Tuple[int, str]]
+    """The 1-based line number and text of each reference in the front
+    matter, with any leading ``-`` removed."""
+    front_matter_closed: Optional[bool]
+    """Whether the front matter ended with a delimiter, or None if there is
+    no front matter."""
+    bullets: List[str]
+    """The non-empty items of the body."""
+
+
+def split_fragment_text(fp) -> FragmentText:
+    """Split the contents of a fragment file into front matter and body.
+
+    Only splits lines: references are not parsed. Used both by
+    :class:`Fragment` and by :func:`proclamation.check.check_fragment_file`,
+    so they agree on what a fragment file contains.
+    """
+    references: List[Tuple[int, str]] = []
+    closed = None
+    line: str = fp.readline()
+    if line.strip() == FRONT_MATTER_DELIMITER:
+        closed = False
+        number = 1
+        while 1:
+            line = fp.readline()
+            number += 1
+            if not line:
+                break
+            line = line.strip()
+            if line == FRONT_MATTER_DELIMITER:
+                closed = True
+                break
+            if line.startswith("#"):
+                # comment line
+                continue
+            # Strip "bullet points" so this can look more yaml-like
+            if line.startswith(_DASH_BULLET):
+                line = line[len(_DASH_BULLET) :].strip()
+            references.append((number, line))
+        line = fp.readline()
+    bullets = [bullet for bullet in _parse_bullets(fp, line) if bullet]
+    return FragmentText(references, closed, bullets)
+
+
 class Fragment:
     """
     A single changelog entry, provided as text to insert into the
@@ -242,8 +459,29 @@ class Fragment:
     additional references in the fragment file contents. Delimit the front
     matter with --- both before and after, and place one reference per line
     (with or without leading -) between those delimiters.
+
+    A "lazy" fragment is built from its filename and reference alone: the
+    file is only read and parsed (by :func:`load`) when :attr:`text`,
+    :attr:`refs`, :attr:`authors`, :attr:`issue` or :attr:`prefix` is first
+    accessed.
     """
 
+    __slots__ = (
+        "filename",
+        "_text",
+        "io",
+        "_ref_parser",
+        "_ref",
+        "_refs",
+        "_authors",
+        "_issue",
+        "_known_refs",
+        "_prefix",
+        "_sort_key",
+        "_loaded",
+        "_extras",
+    )
+
     ARBITRARY_MAX_PREFIX_LEN = 40
     """If the first colon in a fragment is after this many characters or more,
     we assume it's not actually the prefix. It may instead be, for example,
@@ -251,7 +489,12 @@ class Fragment:
     """
 
     def __init__(
-        self, filename, reference: Optional[Reference] = None, ref_parser=None, io=None
+        self,
+        filename,
+        reference: Optional[Reference] = None,
+        ref_parser=None,
+        io=None,
+        lazy=False,
     ):
         """Construct a fragment.
 
@@ -261,12 +504,17 @@ class Fragment:
         A default is provided.
         For testing or advanced stuff, pass a file handle or something like
         StringIO to io, in which case filename is not used.
+        If lazy is true, content is loaded on first access instead of by an
+        explicit call to :func:`parse_file`.
         """
         super().__init__()
-        filename = Path(filename)
-        self.filename = filename
-        self.text: str = ""
+        if not isinstance(filename, Path):
+            filename = Path(filename)
+        self.filename: Path = filename
+        self._text: str = ""
         self.io = io
+        self._loaded = not lazy
+        self._extras: Optional[List[Fragment]] = None
         if ref_parser is None:
             ref_parser = ReferenceParser()
         self._ref_parser = ref_parser
@@ -280,18 +528,15 @@ class Fragment:
             )
 
         self._ref: Reference = reference
+        self._sort_key = reference_sort_key(reference)
 
-        self.refs: List[Reference] = []
-        """All references added for a fragment, including the first.
+        self._refs: List[Reference] = []
+        self._authors: List[str] = []
+        # self._issue is only set if the fragment references an issue.
 
-        Do not modify manually."""
-
-        self.authors: List[str] = []
-
-        self.issue: int
-
-        self._known_refs: Set[Tuple[str, ...]] = set()
-        """The set of all ref tuples associated with this fragment.
+        self._known_refs: Tuple[Tuple, ...] = ()
+        """All ref tuples associated with this fragment. Usually only a handful,
+        so an immutable tuple is smaller than a set, and can be shared by copies.
 
         Do not modify manually."""
         self._insert_ref(reference)
@@ -302,18 +547,91 @@ class Fragment:
         ref_tuple = reference.as_tuple()
         if ref_tuple not in self._known_refs:
             if reference.item_type == "author":
-                self.authors.append(reference.identifier)
+                self._authors.append(reference.identifier)
             elif reference.item_type == "issue":
-                self.issue = int(reference.identifier)
+                self._issue = int(reference.identifier)
             else:
-                self.refs.append(reference)
-            self._known_refs.add(ref_tuple)
+                self._refs.append(reference)
+            self._known_refs += (ref_tuple,)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the content of this fragment has been loaded.
+
+        Always true unless the fragment was constructed as lazy."""
+        return self._loaded
+
+    def load(self) -> List["Fragment"]:
+        """Load the content of a lazy fragment now, if not already loaded.
+
+        Returns any extra fragments from additional bullet points, like
+        :func:`parse_file`. Does nothing for non-lazy fragments.
+        """
+        if not self._loaded:
+            self._loaded = True
+            try:
+                self._extras = self.parse_file()
+            except Exception:
+                self._loaded = False
+                raise
+        if self._extras is None:
+            return []
+        return self._extras
+
+    @property
+    def text(self) -> str:
+        """The text of this fragment, without front matter."""
+        if not self._loaded:
+            self.load()
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        self._text = value
+        self._prefix = None
+
+    @property
+    def refs(self) -> List[Reference]:
+        """All references added for a fragment, including the first.
+
+        Do not modify manually."""
+        if not self._loaded:
+            self.load()
+        return self._refs
+
+    @property
+    def authors(self) -> List[str]:
+        """Identifiers of all ``author`` references for this fragment."""
+        if not self._loaded:
+            self.load()
+        return self._authors
+
+    @property
+    def issue(self) -> int:
+        """The identifier of the ``issue`` reference for this fragment.
+
+        Raises AttributeError if there is none."""
+        if not self._loaded:
+            self.load()
+        try:
+            return self._issue
+        except AttributeError:
+            raise AttributeError("Fragment has no issue reference") from None
 
     def __lt__(self, other):
         """Compare less-than for fragment sorting."""
-        # For now - sort based on the first reference of a fragment.
-        # This is typically the one from the filename.
-        return self.ref.as_tuple() < other.ref.as_tuple()
+        return self._sort_key < other._sort_key
+
+    @property
+    def sort_key(self):
+        """Get the key fragments are sorted by, computed once at construction.
+
+        For now - sort based on the first reference of a fragment.
+        This is typically the one from the filename.
+        Numbers within the reference sort numerically, so ``pr.9``
+        comes before ``pr.10``.
+        """
+        return self._sort_key
 
     @property
     def ref(self):
@@ -351,91 +669,39 @@ class Fragment:
         self._insert_ref(ref_tuple)
         return ref_tuple
 
-    def _parse_front_matter(self, fp):
-        log = logging.getLogger(__name__)
-        while 1:
-            line = fp.readline()
-            if not line:
-                return
-            line = line.strip()
-            if line == FRONT_MATTER_DELIMITER:
-                return
-            if line.startswith("#"):
-                # comment line
-                continue
-
-            # Strip "bullet points" so this can look more yaml-like
-            if line.startswith(_DASH_BULLET):
-                line = line[2:].strip()
-            log.debug("Front matter reference text: %s", line)
-            result = self.add_ref(line)
-            if result is None:
-                raise RuntimeError(
-                    "Could not parse line in front matter as reference:", line
-                )
-
     def __copy__(self):
         current = Fragment(self.filename, self._ref, self._ref_parser)
-        current.refs = list(self.refs)
-        current._known_refs = set(self._known_refs)
-        current.text = self.text
+        current._refs = list(self._refs)
+        current._known_refs = self._known_refs
+        current._text = self._text
         return current
 
     def _parse_io(self, fp) -> List["Fragment"]:
-        line: str = fp.readline()
-        if line.strip() == FRONT_MATTER_DELIMITER:
-            self._parse_front_matter(fp)
-            line = fp.readline()
+        contents = split_fragment_text(fp)
+        for _, line in contents.references:
+            _LOG.debug("Front matter reference text: %s", line)
+            if self.add_ref(line) is None:
+                raise RuntimeError(
+                    "Could not parse line in front matter as reference:", line
+                )
+        if not contents.bullets:
+            raise RuntimeError(f"Fragment {self.filename} has an empty body")
 
-        bullets = self._parse_bullets(fp, line)
-        self.text = bullets[0]
-        log = logging.getLogger(__name__)
-        log.debug(
+        bullets = list(contents.bullets)
+        self.text = bullets.pop(0)
+        _LOG.debug(
             "Got fragment with prefix '%s', text starting with '%s'",
             self.prefix,
             self.text[:20],
         )
-        bullets.pop(0)
 
         extras: List[Fragment] = []
-        if bullets:
-            for bullet in bullets:
-                current = copy.copy(self)
-                current.text = bullet
-                extras.append(current)
+        for bullet in bullets:
+            current = copy.copy(self)
+            current.text = bullet
+            extras.append(current)
         return extras
 
-    def _parse_bullets(self, fp, line: str):
-        bullets: List[str] = []
-        bullet_content = ""
-        while 1:
-            if not line:
-                break
-            '''
-            # Remove leading "bullet"
-            lstripped_line = line.lstrip()
-            had_bullet = False
-            if lstripped_line.startswith(_DASH_BULLET):
-                line = lstripped_line[len(_DASH_BULLET) :]
-                had_bullet = True
-            elif lstripped_line.startswith(_ASTERISK_BULLET):
-                line = lstripped_line[len(_ASTERISK_BULLET) :]
-                had_bullet = True
-
-            if had_bullet:
-                # We must start a new bullet
-                if bullet_content:
-                    bullets.append(bullet_content)
-                bullet_content = ""
-            bullet_content += line
-            '''
-            bullet_content += line
-            line = fp.readline()
-
-        if bullet_content:
-            bullets.append(bullet_content)
-        return [s.strip() for s in bullets]
-
     def parse_file(self) -> List["Fragment"]:
         """Open the file and parse content, and front matter if any.
 
@@ -452,6 +718,152 @@ class Fragment:
             return self._parse_io(fp)
 
 
+@lru_cache(maxsize=16)
+def _fragment_filename_re(extensions: FrozenSet[str]):
+    alternatives = "|".join(re.escape(ext) for ext in sorted(extensions))
+    return re.compile(r"[^.].*\.(?:" + alternatives + r")\Z")
+
+
+def scan_fragment_directory(
+    directory, ref_parser, rejected: Optional[List[Path]] = None
+) -> List[Tuple[Path, Reference]]:
+    """
+    List a directory, trying to parse each filename as a reference.
+
+    Only regular files (or links to them) whose names do not start with a dot
+    and end in one of ``ref_parser.extensions_to_drop`` are considered. This
+    is checked before any objects are created for an entry.
+
+    Returns a list of (filename, reference) pairs for the files that
+    parse properly, sorted by name so results do not depend on
+    directory order. No file contents are read.
+
+    If a list is passed as rejected, files that have a fragment extension
+    but do not parse as a reference are appended to it.
+    """
+    match = _fragment_filename_re(frozenset(ref_parser.extensions_to_drop)).match
+    with os.scandir(str(directory)) as it:
+        names = [entry.name for entry in it if match(entry.name) and entry.is_file()]
+    return _parse_fragment_names(Path(directory), names, ref_parser, rejected)
+
+
+def filter_fragment_names(
+    directory, names: Iterable[str], ref_parser, rejected: Optional[List[Path]] = None
+) -> List[Tuple[Path, Reference]]:
+    """
+    Like :func:`scan_fragment_directory`, but for a known list of file names
+    in directory instead of its whole listing.
+
+    The files are assumed to exist, so nothing is read from the file system.
+    """
+    match = _fragment_filename_re(frozenset(ref_parser.extensions_to_drop)).match
+    names = [name for name in names if match(name)]
+    return _parse_fragment_names(Path(directory), names, ref_parser, rejected)
+
+
+def _parse_fragment_names(
+    directory: Path, names: List[str], ref_parser, rejected: Optional[List[Path]]
+) -> List[Tuple[Path, Reference]]:
+    log = _LOG.getChild("scan_fragment_directory")
+    entries = []
+    for name in names:
+        fragment_ref = ref_parser.parse(name)
+        if not fragment_ref:
+            # Actually not a fragment, skipping
+            log.debug("Not actually a fragment: %s", name)
+            if rejected is not None:
+                rejected.append(directory / name)
+            continue
+        entries.append((name, fragment_ref))
+    entries.sort(key=itemgetter(0))
+    return [(directory / name, fragment_ref) for name, fragment_ref in entries]
+
+
+def parse_fragment_file(filename, reference=None, ref_parser=None) -> List[Fragment]:
+    """Parse a single fragment file.
+
+    Returns a list of the :class:`Fragment` for the file followed by any
+    extras (from additional bullet points).
+    Safe to call from worker threads.
+    """
+    fragment = Fragment(filename, reference, ref_parser)
+    extras = fragment.parse_file()
+    return [fragment] + extras
+
+
+class SortedFragments:
+    """An ordered container of :class:`Fragment` objects.
+
+    Fragments are kept sorted by their first reference and, optionally, by
+    prefix first. Equal keys keep their insertion order, so this matches a
+    stable sort by reference followed by a stable sort by prefix.
+
+    Single insertions use :mod:`bisect`, while :func:`extend` appends
+    everything and sorts once, so loading N fragments costs O(N log N).
+
+    Behaves like a read-only sequence, so templates can iterate it, index it,
+    and take its length.
+    """
+
+    def __init__(self, sort_by_prefix=False):
+        """Construct an empty container."""
+        self.sort_by_prefix = sort_by_prefix
+        self._keys: list = []
+        self._items: List["Fragment"] = []
+
+    def _key(self, fragment):
+        if self.sort_by_prefix:
+            return (fragment.prefix, fragment.sort_key)
+        return fragment.sort_key
+
+    def add(self, fragment):
+        """Insert a single fragment in its sorted position."""
+        key = self._key(fragment)
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._items.insert(index, fragment)
+
+    def extend(self, fragments: Iterable["Fragment"]):
+        """Insert many fragments, sorting only once."""
+        self._items.extend(fragments)
+        self.resort()
+
+    def remove_filenames(self, filenames) -> int:
+        """Remove all fragments from the given files, returning how many."""
+        keep = [
+            i
+            for i, fragment in enumerate(self._items)
+            if fragment.filename not in filenames
+        ]
+        removed = len(self._items) - len(keep)
+        if removed:
+            self._keys = [self._keys[i] for i in keep]
+            self._items = [self._items[i] for i in keep]
+        return removed
+
+    def resort(self):
+        """Re-sort everything, in case sort keys have changed."""
+        keys = [self._key(fragment) for fragment in self._items]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = [keys[i] for i in order]
+        self._items = [self._items[i] for i in order]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __repr__(self):
+        return "SortedFragments({})".format(repr(self._items))
+
+
 class Section:
     """A section is a component/aspect of a project.
 
@@ -461,6 +873,10 @@ class Section:
     A section contains :class:`Fragment` objects. They are typically populated
     from a directory of files through a call to
     :func:`populate_from_directory()`. They are kept sorted.
+
+    Lazy fragments (see :func:`add_lazy_fragments()`) are only loaded when
+    :attr:`fragments` is first accessed, so :attr:`fragment_filenames` alone
+    never reads fragment files.
     """
 
     def __init__(self, name, relative_directory=None, sort_by_prefix=False):
@@ -468,15 +884,29 @@ class Section:
         self.name = name
         self.relative_directory = relative_directory
         self.sort_by_prefix = sort_by_prefix
-        self.fragments = []
+        self._fragments = SortedFragments(sort_by_prefix)
+        self._unloaded: List[Fragment] = []
         self._log = _LOG.getChild(f"Section.{name}")
 
+    @property
+    def fragments(self) -> SortedFragments:
+        """A :class:`SortedFragments` container. Do not modify directly.
+
+        Loads any lazy fragments first."""
+        if self._unloaded:
+            unloaded = self._unloaded
+            self._unloaded = []
+            self._log.debug("Loading %d lazy fragments", len(unloaded))
+            self._fragments.extend(
+                chain.from_iterable(
+                    [fragment] + fragment.load() for fragment in unloaded
+                )
+            )
+        return self._fragments
+
     def _sort_fragments(self):
         # Keep this list sorted
-        self.fragments.sort()
-        if self.sort_by_prefix:
-            self._log.debug("Sorting by prefix here!")
-            self.fragments.sort(key=attrgetter("prefix"))
+        self.fragments.resort()
 
     def add_fragment(self, fragment):
         """Add a fragment to this section.
@@ -484,12 +914,50 @@ class Section:
         This does **not** call fragment.parse_file(). However,
         :func:`populate_from_directory()` is the usual place this gets
         called from, and it **does** call parse_file.
+
+        To add many fragments at once, prefer :func:`add_fragments()`.
         """
-        self.fragments.append(fragment)
-        self._sort_fragments()
+        self._fragments.add(fragment)
         self._log.debug("added: %s", fragment.filename)
 
-    def populate_from_directory(self, directory, ref_parser):
+    def add_fragments(self, fragments: Iterable[Fragment]):
+        """Add several fragments to this section, sorting only once.
+
+        Like :func:`add_fragment()`, this does **not** call
+        fragment.parse_file().
+        """
+        fragments = list(fragments)
+        self._fragments.extend(fragments)
+        self._log.debug("added %d fragments", len(fragments))
+
+    def remove_fragments(self, filenames: Iterable[Path]) -> int:
+        """Remove all fragments from the given files, e.g. after they were
+        deleted or changed. Returns the number of fragments removed."""
+        filenames = frozenset(filenames)
+        unloaded = len(self._unloaded)
+        self._unloaded = [f for f in self._unloaded if f.filename not in filenames]
+        removed = unloaded - len(self._unloaded)
+        removed += self._fragments.remove_filenames(filenames)
+        self._log.debug("removed %d fragments", removed)
+        return removed
+
+    def add_lazy_fragments(self, fragments: Iterable[Fragment]):
+        """Add several lazy fragments, without loading them yet.
+
+        They are loaded, and sorted in with the others, the next time
+        :attr:`fragments` is accessed.
+        """
+        self._unloaded.extend(fragments)
+
+    def list_directory(self, directory, ref_parser) -> List[Tuple[Path, Reference]]:
+        """
+        List a directory, trying to parse each filename as a reference.
+
+        See :func:`scan_fragment_directory`.
+        """
+        return scan_fragment_directory(directory, ref_parser)
+
+    def populate_from_directory(self, directory, ref_parser, executor=None, lazy=False):
         """
         Iterate through a directory, trying to parse each filename as a
         reference.
@@ -498,28 +966,33 @@ class Section:
         and a :class:`Fragment` object is instantiated for them.
         Files with multiple bullet points are considered to be
         multiple fragments.
-        """
-        if isinstance(directory, str):
-            directory = Path(directory)
-        for fragment_name in directory.iterdir():
-            fragment_ref = ref_parser.parse(fragment_name.name)
-            if not fragment_ref:
-                # Actually not a fragment, skipping
-                self._log.debug("Not actually a fragment: %s", fragment_name)
-                continue
-            fragment = Fragment(fragment_name, fragment_ref, ref_parser)
-            extras = fragment.parse_file()
-            self.add_fragment(fragment)
-            for extra in extras:
-                self.add_fragment(extra)
 
-        self._sort_fragments()
+        If executor (e.g. a :class:`concurrent.futures.ThreadPoolExecutor`)
+        is provided, files are parsed using its ``map`` method.
+
+        If lazy is true, only the directory is read now: see
+        :func:`add_lazy_fragments()`.
+        """
+        entries = self.list_directory(directory, ref_parser)
+        if lazy:
+            self.add_lazy_fragments(
+                Fragment(filename, ref, ref_parser, lazy=True)
+                for filename, ref in entries
+            )
+            return
+        filenames = [filename for filename, _ in entries]
+        refs = [ref for _, ref in entries]
+        map_func = map if executor is None else executor.map
+        results = map_func(parse_fragment_file, filenames, refs, repeat(ref_parser))
+        self.add_fragments(chain.from_iterable(results))
 
     @property
     def fragment_filenames(self):
         """Return a generator of filenames for all :class:`Fragment` objects
-        added."""
-        return (fragment.filename for fragment in self.fragments)
+        added, without loading any lazy fragments."""
+        return (
+            fragment.filename for fragment in chain(self._fragments, self._unloaded)
+        )
 
 
 if __name__ == "__main__":
@@ -6,12 +6,17 @@
 # Original author: Rylie Pavlik <rylie.pavlik@collabora.com>
 """Functionality that did not fit elsewhere."""
 
-from typing import Iterable
+from contextlib import contextmanager
+from typing import BinaryIO, Iterable, Iterator, List
 from pathlib import Path
 import logging
+import os
+import shutil
+import tempfile
 
 VERSION = "ILLIXR"
 
+
 def remove_files(files: Iterable[Path]):
     """
     Remove the given files, if possible.
@@ -24,3 +29,92 @@ def remove_files(files: Iterable[Path]):
             log.info("Removed %s", f)
         except FileNotFoundError:
             log.info("Skipping %s, not found", f)
+
+
+def write_manifest(filename, files: Iterable[Path]):
+    """
+    Write a manifest of fragment files: one absolute path per line.
+    """
+    with open(str(filename), "w", encoding="utf-8") as fp:
+        for f in files:
+            fp.write(str(Path(f).resolve()))
+            fp.write("\n")
+
+
+def read_manifest(filename) -> List[Path]:
+    """
+    Read a manifest written by :func:`write_manifest`.
+    """
+    with open(str(filename), encoding="utf-8") as fp:
+        return [Path(line.rstrip("\n")) for line in fp if line.strip()]
+
+
+def copy_file_tail(src: BinaryIO, dst: BinaryIO, offset: int):
+    """
+    Append everything in the binary file src from offset onward to dst.
+
+    Uses os.copy_file_range or os.sendfile when available, so the data
+    does not need to pass through Python, falling back to a buffered copy.
+    """
+    dst.flush()
+    src_fd = src.fileno()
+    dst_fd = dst.fileno()
+    remaining = os.fstat(src_fd).st_size - offset
+    methods = []
+    if hasattr(os, "copy_file_range"):
+        methods.append(
+            lambda count, pos: os.copy_file_range(src_fd, dst_fd, count, pos)
+        )
+    if hasattr(os, "sendfile"):
+        methods.append(lambda count, pos: os.sendfile(dst_fd, src_fd, pos, count))
+    for method in methods:
+        try:
+            while remaining > 0:
+                copied = method(remaining, offset)
+                if copied == 0:
+                    break
+                offset += copied
+                remaining -= copied
+        except OSError:
+            # Not supported here, e.g. by this kernel or filesystem.
+            continue
+        if remaining <= 0:
+            return
+        break
+    # Whatever is left over, copy the slow way.
+    src.seek(offset)
+    dst.seek(0, os.SEEK_END)
+    shutil.copyfileobj(src, dst)
+
+
+@contextmanager
+def atomic_write(filename) -> Iterator[BinaryIO]:
+    """
+    Open a temporary binary file next to filename, which replaces filename
+    atomically once the block completes without an exception.
+
+    On error, the temporary file is removed and filename is left untouched.
+    The permissions of an existing file are kept.
+    """
+    fn = Path(filename)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=str(fn.parent), prefix=f".{fn.name}.", suffix=".tmp"
+    )
+    try:
+        with open(fd, "wb") as out:
+            yield out
+        _copy_permissions(fn, tmp_name)
+        os.replace(tmp_name, str(fn))
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _copy_permissions(original: Path, tmp_name: str):
+    try:
+        shutil.copymode(str(original), tmp_name)
+    except FileNotFoundError:
+        # mkstemp makes files only we can read: use the usual default instead.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_name, 0o666 & ~umask)
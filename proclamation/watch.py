@@ -0,0 +1,297 @@
+#!/usr/bin/env python3 -i
+# Copyright 2026, Collabora, Ltd. and the Proclamation contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Watch fragment directories and templates, for ``proclamation draft --watch``."""
+
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+_LOG = logging.getLogger(__name__)
+
+DEBOUNCE_SECONDS = 0.05
+"""After a change, wait this long for more before reporting them together,
+as editors often write a file in several steps."""
+
+
+def watched_paths(project) -> List[Path]:
+    """Return the section directories of a project, and its template file if
+    it is in the base directory rather than built in."""
+    paths = [project.section_directory(section) for section in project.sections]
+    template = (Path(project.default_base) / project.template).resolve()
+    if template.is_file():
+        paths.append(template)
+    return paths
+
+
+def _split_paths(paths: Iterable[Path]) -> Dict[Path, Optional[Set[str]]]:
+    """Map each directory to watch to the names to report in it, or None for
+    all of them."""
+    directories: Dict[Path, Optional[Set[str]]] = {}
+    for path in paths:
+        path = Path(path).resolve()
+        if path.is_dir():
+            directories[path] = None
+        elif path.parent in directories and directories[path.parent] is None:
+            continue
+        else:
+            directories.setdefault(path.parent, set()).add(path.name)
+    return directories
+
+
+class PollingWatcher:
+    """Notices changes by comparing the modification time and size of every
+    file in the watched directories, every interval seconds."""
+
+    def __init__(self, paths: Iterable[Path], interval: float = 0.25):
+        """Start watching directories, or single files."""
+        self.interval = interval
+        self._directories = _split_paths(paths)
+        self._snapshot = self._take_snapshot()
+        self._pending: Set[Path] = set()
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for directory, names in self._directories.items():
+            try:
+                with os.scandir(str(directory)) as it:
+                    for entry in it:
+                        if names is not None and entry.name not in names:
+                            continue
+                        try:
+                            if not entry.is_file():
+                                continue
+                            st = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        snapshot[directory / entry.name] = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                continue
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait for changes, returning the files added, modified or removed.
+
+        Files passed to :func:`retry` are returned too, with the next change
+        or once timeout seconds have passed. Returns an empty set if there is
+        nothing to report within timeout seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._take_snapshot()
+            old = self._snapshot
+            changed = {
+                path
+                for path in set(snapshot) | set(old)
+                if snapshot.get(path) != old.get(path)
+            }
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                changed |= self._pending
+                self._pending = set()
+                return changed
+            time.sleep(self.interval)
+
+    def retry(self, changed: Iterable[Path]):
+        """Report files again from the next :func:`wait`, e.g. because
+        handling their changes failed."""
+        self._pending.update(changed)
+
+    def close(self):
+        """Stop watching."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# From <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_ONLYDIR = 0x01000000
+_IN_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_EVENT = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Notices changes in the watched directories with Linux inotify.
+
+    Calls the C library with :mod:`ctypes`, so no extra package is needed.
+    Raises OSError if inotify is not available.
+    """
+
+    def __init__(self, paths: Iterable[Path]):
+        """Start watching directories, or single files."""
+        import ctypes
+
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(None, use_errno=True)
+        try:
+            init = libc.inotify_init1
+            add_watch = libc.inotify_add_watch
+        except AttributeError:
+            raise OSError("the C library does not support inotify") from None
+        fd = init(os.O_CLOEXEC | os.O_NONBLOCK)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        self._watches: Dict[int, Tuple[Path, Optional[Set[str]]]] = {}
+        for directory, names in _split_paths(paths).items():
+            wd = add_watch(fd, os.fsencode(str(directory)), _IN_MASK | _IN_ONLYDIR)
+            if wd < 0:
+                _LOG.warning(
+                    "Cannot watch %s: %s", directory, os.strerror(ctypes.get_errno())
+                )
+                continue
+            self._watches[wd] = (directory, names)
+        self._pending: Set[Path] = set()
+
+    def _read_events(self, changed: Set[Path]):
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            watch = self._watches.get(wd)
+            if watch is None or not name:
+                continue
+            directory, names = watch
+            if names is None or name in names:
+                changed.add(directory / name)
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait for changes, returning the files added, modified or removed.
+
+        Files passed to :func:`retry` are returned too, like
+        :func:`PollingWatcher.wait` does.
+        """
+        changed: Set[Path] = set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not changed:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+            if not select.select([self._fd], [], [], remaining)[0]:
+                break
+            self._read_events(changed)
+            # Gather the rest of a burst of events, e.g. write then rename.
+            while select.select([self._fd], [], [], DEBOUNCE_SECONDS)[0]:
+                self._read_events(changed)
+        changed |= self._pending
+        self._pending = set()
+        return changed
+
+    def retry(self, changed: Iterable[Path]):
+        """Report files again from the next :func:`wait`, see
+        :func:`PollingWatcher.retry`."""
+        self._pending.update(changed)
+
+    def close(self):
+        """Stop watching."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def open_watcher(paths: Iterable[Path], polling=False):
+    """Return an :class:`InotifyWatcher` if possible, or else (or if polling
+    is true) a :class:`PollingWatcher`."""
+    paths = list(paths)
+    if not polling:
+        try:
+            return InotifyWatcher(paths)
+        except OSError as e:
+            _LOG.info("Cannot use inotify, polling instead: %s", e)
+    return PollingWatcher(paths)
+
+
+def refresh_projects(projects, changed: Set[Path], ref_parser=None, cache=None):
+    """Update populated projects after the given files changed.
+
+    Returns the projects whose fragments or template changed, and so need
+    rendering again.
+    """
+    affected = []
+    for project in projects:
+        sections = project.refresh_fragments(changed, ref_parser, cache)
+        template = (Path(project.default_base) / project.template).resolve()
+        if sections or template in changed:
+            affected.append(project)
+    return affected
+
+
+def watch_projects(
+    projects,
+    render: Callable,
+    watcher,
+    ref_parser=None,
+    cache=None,
+    report: Optional[Callable[[str], None]] = None,
+):
+    """Call render(project) each time fragments or the template of one of the
+    populated projects change, until interrupted.
+
+    Only touched fragment files are parsed again, and only affected projects
+    are rendered again. An error while updating, such as a broken template,
+    is reported (or logged, without report) and watching goes on. Files that
+    could not be updated are tried again with the next change.
+    """
+    while True:
+        changed = watcher.wait()
+        start = time.perf_counter()
+        try:
+            affected = refresh_projects(projects, changed, ref_parser, cache)
+        except Exception as e:
+            watcher.retry(changed)
+            _report_error(report, "Could not update the fragments", e)
+            continue
+        for project in affected:
+            try:
+                render(project)
+            except Exception as e:
+                _report_error(
+                    report, f"Could not update the draft of {project.name}", e
+                )
+                continue
+            if report is not None:
+                elapsed = (time.perf_counter() - start) * 1000
+                report(f"Updated the draft of {project.name} in {elapsed:.1f} ms")
+
+
+def _report_error(report: Optional[Callable[[str], None]], what: str, error):
+    if report is None:
+        _LOG.error("%s: %s", what, error, exc_info=error)
+    else:
+        report(f"{what}: {error}")